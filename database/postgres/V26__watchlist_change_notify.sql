@@ -0,0 +1,21 @@
+-- =============================================================================
+-- V26: Notify listeners when the set of watched symbols changes
+-- =============================================================================
+-- The recommendation flow service caches the distinct watchlist symbols and
+-- LISTENs on 'watchlist_changed' to reload them as soon as users add or
+-- remove stocks, instead of re-querying user_watchlist on every run.
+
+CREATE OR REPLACE FUNCTION notify_watchlist_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('watchlist_changed', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement-level, so a bulk insert/delete sends a single notification
+-- (Postgres also folds identical notifications within a transaction)
+DROP TRIGGER IF EXISTS user_watchlist_changed ON user_watchlist;
+CREATE TRIGGER user_watchlist_changed
+    AFTER INSERT OR DELETE OR UPDATE OF symbol ON user_watchlist
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_watchlist_changed();
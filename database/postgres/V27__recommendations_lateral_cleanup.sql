@@ -0,0 +1,29 @@
+-- =============================================================================
+-- V27: Prune old recommendations per symbol instead of ranking the whole table
+-- =============================================================================
+-- cleanup_old_recommendations() used ROW_NUMBER() over every row of
+-- stock_recommendations. Walking each symbol's rows newest-first through
+-- idx_recommendations_symbol_time (V5) and skipping the first 10 deletes the
+-- same rows while only sorting within a symbol.
+
+-- Created in V5; repeated so the cleanup below never runs without it
+CREATE INDEX IF NOT EXISTS idx_recommendations_symbol_time
+ON stock_recommendations(symbol, generated_at DESC);
+
+CREATE OR REPLACE FUNCTION cleanup_old_recommendations()
+RETURNS void AS $$
+BEGIN
+    -- Delete recommendations beyond the 10 most recent per symbol
+    DELETE FROM stock_recommendations
+    WHERE id IN (
+        SELECT stale.id
+        FROM (SELECT DISTINCT symbol FROM stock_recommendations) s
+        CROSS JOIN LATERAL (
+            SELECT id FROM stock_recommendations
+            WHERE symbol = s.symbol
+            ORDER BY generated_at DESC
+            OFFSET 10
+        ) stale
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,16 @@
+-- =============================================================================
+-- V28: Vacuum stock_recommendations as fast as it churns
+-- =============================================================================
+-- Retention is "last 10 per symbol", not an age window, so the table stays
+-- roughly (watched symbols x 10) rows and every run deletes about as many
+-- rows as it inserts. With the default scale factor (20% dead rows) the
+-- dead tuples of several runs pile up before autovacuum reclaims them.
+-- Trigger vacuum/analyze after a fixed number of dead rows instead, so the
+-- heap and idx_recommendations_symbol_time stay close to their live size.
+
+ALTER TABLE stock_recommendations SET (
+    autovacuum_vacuum_scale_factor = 0.0,
+    autovacuum_vacuum_threshold = 1000,
+    autovacuum_analyze_scale_factor = 0.0,
+    autovacuum_analyze_threshold = 1000
+);
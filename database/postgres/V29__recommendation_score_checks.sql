@@ -0,0 +1,25 @@
+-- =============================================================================
+-- V29: Range checks for recommendation scores
+-- =============================================================================
+-- The recommendation flow used to clamp every score into range in Python
+-- before writing. The engine's model already validates these ranges, so the
+-- invariant now lives here and the flow only drops NaN/Infinity.
+--
+-- NOT VALID: enforced for new rows without rescanning (or failing on) rows
+-- written before the checks existed.
+
+ALTER TABLE stock_recommendations
+  ADD CONSTRAINT chk_recommendations_score
+    CHECK (score BETWEEN -1 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_normalized_score
+    CHECK (normalized_score BETWEEN 0 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_confidence
+    CHECK (confidence BETWEEN 0 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_news_normalized_score
+    CHECK (news_normalized_score BETWEEN 0 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_news_confidence
+    CHECK (news_confidence BETWEEN 0 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_technical_normalized_score
+    CHECK (technical_normalized_score BETWEEN 0 AND 1) NOT VALID,
+  ADD CONSTRAINT chk_recommendations_technical_confidence
+    CHECK (technical_confidence BETWEEN 0 AND 1) NOT VALID;
@@ -59,6 +59,7 @@ Technology Stack:
 
 Port: 8000 (configurable via environment)
 """
+import asyncio
 import logging
 import math
 import os
@@ -72,6 +73,14 @@ import uvicorn
 import asyncpg
 import json
 
+# orjson is a C extension; fall back to the stdlib encoder if it isn't installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 # Import regime classifier
 try:
     from .regime_classifier import (
@@ -174,6 +183,17 @@ def _json_sanitize(value: Any) -> Any:
     return str(value)
 
 
+def _dumps_json(value: Any) -> str:
+    """Serialize a JSONB parameter, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value)
+
+
+# Same for every saved recommendation
+DATA_SOURCES_JSON = _dumps_json(["news", "technical"])
+
+
 def _db_float(v, *, min_value: float | None = None, max_value: float | None = None):
     """Prepare numeric values for Postgres.
 
@@ -203,6 +223,7 @@ app = FastAPI(
     title="Recommendation Engine",
     description="AI-powered trading recommendation service for AutoTrader AI",
     version="2.0.0",
+    default_response_class=DefaultResponse,
 )
 
 # =============================================================================
@@ -385,6 +406,68 @@ class RecommendationHistoryResponse(BaseModel):
     count: int
 
 
+# =============================================================================
+# Persistence
+# =============================================================================
+
+# Shared by the single and batch endpoints' save_to_db paths
+INSERT_RECOMMENDATION_SQL = """
+    INSERT INTO stock_recommendations (
+        symbol,
+        -- legacy combined
+        action, score, normalized_score, confidence,
+        -- split tracks
+        news_action, news_normalized_score, news_confidence,
+        technical_action, technical_normalized_score, technical_confidence,
+        -- features
+        price_at_recommendation, news_sentiment_score, news_momentum_score,
+        technical_trend_score, technical_momentum_score,
+        rsi, macd_histogram, price_vs_sma20,
+        news_sentiment_1d, article_count_24h,
+        explanation, data_sources_used, generated_at
+    ) VALUES (
+        $1,
+        $2, $3, $4, $5,
+        $6, $7, $8,
+        $9, $10, $11,
+        $12, $13, $14,
+        $15, $16,
+        $17, $18, $19,
+        $20, $21,
+        $22, $23, NOW()
+    )
+"""
+
+
+def _recommendation_params(symbol: str, rec: "Recommendation") -> tuple:
+    """Parameters $1..$23 of INSERT_RECOMMENDATION_SQL for a recommendation."""
+    return (
+        symbol,
+        rec.action,
+        _db_float(rec.score, min_value=-1.0, max_value=1.0),
+        _db_float(rec.normalized_score, min_value=0.0, max_value=1.0),
+        _db_float(rec.confidence, min_value=0.0, max_value=1.0),
+        rec.news_action,
+        _db_float(rec.news_normalized_score, min_value=0.0, max_value=1.0),
+        _db_float(rec.news_confidence, min_value=0.0, max_value=1.0),
+        rec.technical_action,
+        _db_float(rec.technical_normalized_score, min_value=0.0, max_value=1.0),
+        _db_float(rec.technical_confidence, min_value=0.0, max_value=1.0),
+        rec.price_at_recommendation,
+        rec.news_sentiment_score,
+        rec.news_momentum_score,
+        rec.technical_trend_score,
+        rec.technical_momentum_score,
+        rec.rsi,
+        rec.macd_histogram,
+        rec.price_vs_sma20,
+        rec.news_sentiment_1d,
+        rec.article_count_24h,
+        _dumps_json(rec.explanation) if rec.explanation else None,
+        DATA_SOURCES_JSON,
+    )
+
+
 # =============================================================================
 # Global State (initialized on startup)
 # =============================================================================
@@ -646,6 +729,35 @@ class RecommendationEngine:
         
         return buy_threshold, sell_threshold
     
+    async def fetch_features(self, symbol: str) -> tuple:
+        """
+        Fetch news and technical features for a symbol concurrently.
+        
+        The two providers are independent, so both requests are in flight at
+        once. A provider that is not configured or fails yields None.
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            Tuple of (news_features, technical_features)
+        """
+        async def _fetch(kind: str, provider_call):
+            try:
+                return await provider_call(symbol)
+            except Exception as e:
+                logger.warning(f"Failed to get {kind} features for {symbol}: {e}")
+                return None
+        
+        async def _none():
+            return None
+        
+        news_features, technical_features = await asyncio.gather(
+            _fetch("news", self.news_provider.get_features_single) if self.news_provider else _none(),
+            _fetch("technical", self.technical_provider.get_features) if self.technical_provider else _none(),
+        )
+        return news_features, technical_features
+    
     async def generate_recommendation(
         self,
         symbol: str,
@@ -673,21 +785,8 @@ class RecommendationEngine:
         Returns:
             Recommendation object with action, confidence, regime info, and explanation
         """
-        # Get news features
-        news_features = None
-        if self.news_provider:
-            try:
-                news_features = await self.news_provider.get_features_single(symbol)
-            except Exception as e:
-                logger.warning(f"Failed to get news features for {symbol}: {e}")
-        
-        # Get technical features
-        technical_features = None
-        if self.technical_provider:
-            try:
-                technical_features = await self.technical_provider.get_features(symbol)
-            except Exception as e:
-                logger.warning(f"Failed to get technical features for {symbol}: {e}")
+        # Get news and technical features
+        news_features, technical_features = await self.fetch_features(symbol)
         
         # =====================================================================
         # REGIME CLASSIFICATION (NEW)
@@ -1760,57 +1859,9 @@ async def generate_single_recommendation(request: SingleRecommendationRequest):
             pool = await get_db_pool()
             if pool:
                 try:
-                    await pool.execute("""
-                        INSERT INTO stock_recommendations (
-                            symbol,
-                            -- legacy combined
-                            action, score, normalized_score, confidence,
-                            -- split tracks
-                            news_action, news_normalized_score, news_confidence,
-                            technical_action, technical_normalized_score, technical_confidence,
-                            -- features
-                            price_at_recommendation,
-                            news_sentiment_score, news_momentum_score,
-                            technical_trend_score, technical_momentum_score,
-                            rsi, macd_histogram, price_vs_sma20,
-                            news_sentiment_1d, article_count_24h,
-                            explanation, data_sources_used, generated_at
-                        ) VALUES (
-                            $1,
-                            $2, $3, $4, $5,
-                            $6, $7, $8,
-                            $9, $10, $11,
-                            $12,
-                            $13, $14,
-                            $15, $16,
-                            $17, $18, $19,
-                            $20, $21,
-                            $22, $23, NOW()
-                        )
-                    """,
-                        symbol,
-                        recommendation.action,
-                        _db_float(recommendation.score, min_value=-1.0, max_value=1.0),
-                        _db_float(recommendation.normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(recommendation.confidence, min_value=0.0, max_value=1.0),
-                        recommendation.news_action,
-                        _db_float(recommendation.news_normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(recommendation.news_confidence, min_value=0.0, max_value=1.0),
-                        recommendation.technical_action,
-                        _db_float(recommendation.technical_normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(recommendation.technical_confidence, min_value=0.0, max_value=1.0),
-                        recommendation.price_at_recommendation,
-                        recommendation.news_sentiment_score,
-                        recommendation.news_momentum_score,
-                        recommendation.technical_trend_score,
-                        recommendation.technical_momentum_score,
-                        recommendation.rsi,
-                        recommendation.macd_histogram,
-                        recommendation.price_vs_sma20,
-                        recommendation.news_sentiment_1d,
-                        recommendation.article_count_24h,
-                        json.dumps(recommendation.explanation) if recommendation.explanation else None,
-                        json.dumps(["news", "technical"]),
+                    await pool.execute(
+                        INSERT_RECOMMENDATION_SQL,
+                        *_recommendation_params(symbol, recommendation),
                     )
                     logger.info(f"Saved recommendation for {symbol} to database")
                 except Exception as e:
@@ -1957,55 +2008,8 @@ async def generate_recommendations(request: RecommendationRequest):
             if request.save_to_db and db_pool:
                 try:
                     await db_pool.execute(
-                        """
-                        INSERT INTO stock_recommendations (
-                            symbol,
-                            -- legacy combined
-                            action, score, normalized_score, confidence,
-                            -- split tracks
-                            news_action, news_normalized_score, news_confidence,
-                            technical_action, technical_normalized_score, technical_confidence,
-                            -- features
-                            price_at_recommendation, news_sentiment_score, news_momentum_score,
-                            technical_trend_score, technical_momentum_score,
-                            rsi, macd_histogram, price_vs_sma20,
-                            news_sentiment_1d, article_count_24h,
-                            explanation, data_sources_used, generated_at
-                        ) VALUES (
-                            $1,
-                            $2, $3, $4, $5,
-                            $6, $7, $8,
-                            $9, $10, $11,
-                            $12, $13, $14,
-                            $15, $16,
-                            $17, $18, $19,
-                            $20, $21,
-                            $22, $23, NOW()
-                        )
-                        """,
-                        rec.symbol,
-                        rec.action,
-                        _db_float(rec.score, min_value=-1.0, max_value=1.0),
-                        _db_float(rec.normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(rec.confidence, min_value=0.0, max_value=1.0),
-                        rec.news_action,
-                        _db_float(rec.news_normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(rec.news_confidence, min_value=0.0, max_value=1.0),
-                        rec.technical_action,
-                        _db_float(rec.technical_normalized_score, min_value=0.0, max_value=1.0),
-                        _db_float(rec.technical_confidence, min_value=0.0, max_value=1.0),
-                        rec.price_at_recommendation,
-                        rec.news_sentiment_score,
-                        rec.news_momentum_score,
-                        rec.technical_trend_score,
-                        rec.technical_momentum_score,
-                        rec.rsi,
-                        rec.macd_histogram,
-                        rec.price_vs_sma20,
-                        rec.news_sentiment_1d,
-                        rec.article_count_24h,
-                        json.dumps(rec.explanation) if rec.explanation else None,
-                        json.dumps(["news", "technical"]),
+                        INSERT_RECOMMENDATION_SQL,
+                        *_recommendation_params(rec.symbol, rec),
                     )
                     logger.info(f"Saved recommendation for {rec.symbol} to database (batch)")
                 except Exception as e:
@@ -2286,28 +2290,15 @@ async def get_regime(symbol: str):
     try:
         engine = await get_engine()
         
-        # Get features for regime classification
-        news_features = None
-        if engine.news_provider:
-            try:
-                news_features = await engine.news_provider.get_features_single(symbol)
-            except Exception as e:
-                logger.warning(f"Failed to get news features for {symbol}: {e}")
-        
-        technical_features = None
-        if engine.technical_provider:
-            try:
-                technical_features = await engine.technical_provider.get_features(symbol)
-            except Exception as e:
-                logger.warning(f"Failed to get technical features for {symbol}: {e}")
-        
-        # Classify regime
         if not engine.regime_classifier:
             raise HTTPException(
                 status_code=503,
                 detail="Regime classification not available"
             )
         
+        # Get features for regime classification
+        news_features, technical_features = await engine.fetch_features(symbol)
+        
         regime_state = engine.regime_classifier.classify(
             symbol=symbol,
             technical_features=technical_features,
@@ -2370,12 +2361,17 @@ async def get_regime(symbol: str):
             stop_loss=stop_loss_info,
         )
         
-        return RegimeResponse(
+        response = RegimeResponse(
             symbol=symbol,
             regime=regime_info,
             signal_weights=signal_weights_info,
         )
         
+        # Already validated on construction; returning a Response skips
+        # FastAPI's second validation pass against response_model (which is
+        # kept for the OpenAPI schema)
+        return DefaultResponse(content=response.model_dump(mode="json"))
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -2426,11 +2422,12 @@ if __name__ == "__main__":
     - CLICKHOUSE_HOST: ClickHouse server (default: localhost)
     - CLICKHOUSE_PORT: ClickHouse port (default: 8123)
     - REDIS_URL: Redis connection URL (default: redis://localhost:6379)
+    - ACCESS_LOG: Set to '1' to log every request (default: off)
     
     Production deployment:
-        uvicorn main:app --host 0.0.0.0 --port 8000 --workers 4
+        uvicorn main:app --host 0.0.0.0 --port 8000 --workers 4 --no-access-log
     """
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(app, host=host, port=port, access_log=os.getenv("ACCESS_LOG", "0") == "1")
@@ -21,9 +21,11 @@ with technical indicators and social signals for final predictions.
 """
 
 import logging
+import sys
+from collections import Counter
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -119,24 +121,32 @@ class NewsFeatures:
     
     @classmethod
     def empty(cls, symbol: str) -> "NewsFeatures":
-        """Create empty features (no news data available)."""
-        return cls(
-            symbol=symbol,
-            feature_date=date.today(),
-            sentiment_1d=0.0,
-            sentiment_3d=0.0,
-            sentiment_momentum=0.0,
-            sentiment_7d=0.0,
-            sentiment_14d=0.0,
-            sentiment_trend=0.0,
-            article_count_1d=0,
-            article_count_7d=0,
-            volume_ratio=0.0,
-            avg_confidence_1d=0.0,
-            high_confidence_ratio=0.0,
-            sentiment_volatility_7d=0.0,
-            sentiment_range_7d=0.0,
-        )
+        """Create empty features (no news data available).
+        
+        Copies a shared all-zero template instead of spelling out every
+        field, since this runs once per symbol with no news coverage.
+        """
+        return replace(_EMPTY_NEWS_FEATURES, symbol=symbol, feature_date=date.today())
+
+
+# Zero-valued template used by NewsFeatures.empty(); never handed out directly.
+_EMPTY_NEWS_FEATURES = NewsFeatures(
+    symbol="",
+    feature_date=date.min,
+    sentiment_1d=0.0,
+    sentiment_3d=0.0,
+    sentiment_momentum=0.0,
+    sentiment_7d=0.0,
+    sentiment_14d=0.0,
+    sentiment_trend=0.0,
+    article_count_1d=0,
+    article_count_7d=0,
+    volume_ratio=0.0,
+    avg_confidence_1d=0.0,
+    high_confidence_ratio=0.0,
+    sentiment_volatility_7d=0.0,
+    sentiment_range_7d=0.0,
+)
 
 
 class NewsFeatureProvider:
@@ -168,6 +178,8 @@ class NewsFeatureProvider:
         clickhouse_password: str = "",
         redis_url: Optional[str] = "redis://localhost:6379",
         cache_ttl_seconds: int = 300,
+        max_connections: int = 32,
+        prewarm_top_k: int = 200,
     ):
         """
         Initialize the feature provider.
@@ -179,6 +191,11 @@ class NewsFeatureProvider:
             clickhouse_password: ClickHouse password
             redis_url: Redis URL for caching (optional)
             cache_ttl_seconds: How long to cache features
+            max_connections: Size of the ClickHouse HTTP and Redis connection pools
+            prewarm_top_k: Number of most-requested symbols to refresh in the
+                background before their cache entries expire (0 disables).
+                Request counts are halved after every refresh, so this
+                follows recent demand
         """
         self.clickhouse_host = clickhouse_host
         self.clickhouse_port = clickhouse_port
@@ -186,10 +203,18 @@ class NewsFeatureProvider:
         self.clickhouse_password = clickhouse_password
         self.redis_url = redis_url
         self.cache_ttl = cache_ttl_seconds
+        self.max_connections = max_connections
+        self.prewarm_top_k = prewarm_top_k
         
         self._clickhouse_available = False
+        self._ch_pool_mgr = None
         self.redis_client = None
         self._initialized = False
+        
+        # Decaying request counts per symbol, used to pick which symbols to
+        # pre-warm (see _decay_access_counts)
+        self._access_counter: Counter = Counter()
+        self._refresh_task: Optional[asyncio.Task] = None
     
     def _create_clickhouse_client(self):
         """
@@ -197,7 +222,9 @@ class NewsFeatureProvider:
         
         Each query gets its own client to avoid concurrency issues.
         The clickhouse-connect library's clients are not thread-safe
-        for concurrent queries within the same session.
+        for concurrent queries within the same session. The clients do
+        share one urllib3 pool manager, so keep-alive HTTP connections are
+        reused across queries instead of being re-opened each time.
         """
         try:
             import clickhouse_connect
@@ -206,11 +233,23 @@ class NewsFeatureProvider:
                 port=self.clickhouse_port,
                 username=self.clickhouse_user,
                 password=self.clickhouse_password,
+                pool_mgr=self._get_clickhouse_pool_manager(),
             )
         except Exception as e:
             logger.warning(f"Failed to create ClickHouse client: {e}")
             return None
     
+    def _get_clickhouse_pool_manager(self):
+        """Get or create the shared HTTP pool manager for ClickHouse clients."""
+        if self._ch_pool_mgr is None:
+            from clickhouse_connect.driver.httputil import get_pool_manager
+            self._ch_pool_mgr = get_pool_manager(
+                maxsize=self.max_connections,
+                num_pools=4,
+                block=False,
+            )
+        return self._ch_pool_mgr
+    
     async def initialize(self):
         """Initialize connections to ClickHouse and Redis."""
         if self._initialized:
@@ -225,6 +264,7 @@ class NewsFeatureProvider:
                 port=self.clickhouse_port,
                 username=self.clickhouse_user,
                 password=self.clickhouse_password,
+                pool_mgr=self._get_clickhouse_pool_manager(),
             )
             # Quick connectivity test
             test_client.query("SELECT 1")
@@ -239,15 +279,62 @@ class NewsFeatureProvider:
         if self.redis_url:
             try:
                 import redis.asyncio as redis
-                self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+                self.redis_client = redis.from_url(
+                    self.redis_url,
+                    decode_responses=True,
+                    max_connections=self.max_connections,
+                    socket_keepalive=True,
+                )
                 await self.redis_client.ping()
                 logger.info("Connected to Redis cache")
             except Exception as e:
                 logger.warning(f"Redis not available: {e}")
                 self.redis_client = None
         
+        # Keep hot symbols warm so readers rarely pay for a ClickHouse query
+        if self.prewarm_top_k > 0 and self._clickhouse_available and self.redis_client:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        
         self._initialized = True
     
+    async def _refresh_loop(self):
+        """
+        Periodically refresh cached features for the most-requested symbols.
+        
+        Runs every half TTL so entries for popular symbols are rewritten
+        before they expire and the serving path keeps hitting the cache.
+        """
+        interval = max(1, self.cache_ttl // 2)
+        while True:
+            await asyncio.sleep(interval)
+            top = [symbol for symbol, _ in self._access_counter.most_common(self.prewarm_top_k)]
+            self._decay_access_counts()
+            if not top:
+                continue
+            try:
+                feature_date = date.today()
+                fetched = await self._fetch_from_clickhouse(top, feature_date)
+                if fetched:
+                    await self._save_to_cache(fetched, feature_date)
+                    logger.debug(f"Pre-warmed news features for {len(fetched)} symbols")
+            except Exception as e:
+                logger.warning(f"News feature pre-warm failed: {e}")
+    
+    def _decay_access_counts(self):
+        """
+        Halve every symbol's request count, dropping symbols that reach zero.
+        
+        Keeps the pre-warm set tied to recent demand: a symbol that stops
+        being requested falls out after a few refreshes instead of being
+        re-queried for the life of the process. It also bounds the counter
+        to symbols requested recently.
+        """
+        self._access_counter = Counter({
+            symbol: count // 2
+            for symbol, count in self._access_counter.items()
+            if count > 1
+        })
+    
     async def get_features(
         self,
         symbols: List[str],
@@ -267,6 +354,10 @@ class NewsFeatureProvider:
             await self.initialize()
         
         feature_date = feature_date or date.today()
+        # Interned symbols make the repeated dict/cache-key lookups below
+        # identity comparisons instead of full string compares.
+        symbols = [sys.intern(s) for s in symbols]
+        self._access_counter.update(symbols)
         
         # Try cache first
         cached = await self._get_from_cache(symbols, feature_date)
@@ -297,7 +388,8 @@ class NewsFeatureProvider:
     ) -> NewsFeatures:
         """Get news features for a single symbol."""
         features = await self.get_features([symbol], feature_date)
-        return features.get(symbol, NewsFeatures.empty(symbol))
+        feat = features.get(symbol)
+        return feat if feat is not None else NewsFeatures.empty(symbol)
     
     async def _get_from_cache(
         self,
@@ -313,9 +405,10 @@ class NewsFeatureProvider:
             
             result = {}
             pipe = self.redis_client.pipeline()
+            date_str = feature_date.isoformat()
             
             for symbol in symbols:
-                key = f"news_features:{symbol}:{feature_date.isoformat()}"
+                key = f"news_features:{symbol}:{date_str}"
                 pipe.get(key)
             
             values = await pipe.execute()
@@ -344,9 +437,10 @@ class NewsFeatureProvider:
             import json
             
             pipe = self.redis_client.pipeline()
+            date_str = feature_date.isoformat()
             
             for symbol, feat in features.items():
-                key = f"news_features:{symbol}:{feature_date.isoformat()}"
+                key = f"news_features:{symbol}:{date_str}"
                 pipe.set(key, json.dumps(feat.to_dict()), ex=self.cache_ttl)
             
             await pipe.execute()
@@ -386,30 +480,32 @@ class NewsFeatureProvider:
     ) -> Dict[str, NewsFeatures]:
         """Fetch from pre-computed features table."""
         symbols_str = ", ".join(f"'{s}'" for s in symbols)
+        date_str = feature_date.isoformat()
         
         query = f"""
         SELECT
             symbol,
             feature_date,
-            sentiment_1d,
-            sentiment_3d,
-            sentiment_momentum,
-            sentiment_7d,
-            sentiment_14d,
-            sentiment_trend,
-            article_count_1d,
-            article_count_7d,
-            volume_ratio,
-            avg_confidence_1d,
-            high_confidence_ratio,
-            sentiment_volatility_7d,
-            sentiment_range_7d,
+            -- Coalesce NULLs server-side so the result loop needs no per-cell branching.
+            ifNull(sentiment_1d, 0.0) AS sentiment_1d,
+            ifNull(sentiment_3d, 0.0) AS sentiment_3d,
+            ifNull(sentiment_momentum, 0.0) AS sentiment_momentum,
+            ifNull(sentiment_7d, 0.0) AS sentiment_7d,
+            ifNull(sentiment_14d, 0.0) AS sentiment_14d,
+            ifNull(sentiment_trend, 0.0) AS sentiment_trend,
+            ifNull(article_count_1d, 0) AS article_count_1d,
+            ifNull(article_count_7d, 0) AS article_count_7d,
+            ifNull(volume_ratio, 0.0) AS volume_ratio,
+            ifNull(avg_confidence_1d, 0.0) AS avg_confidence_1d,
+            ifNull(high_confidence_ratio, 0.0) AS high_confidence_ratio,
+            ifNull(sentiment_volatility_7d, 0.0) AS sentiment_volatility_7d,
+            ifNull(sentiment_range_7d, 0.0) AS sentiment_range_7d,
             earnings_sentiment,
             analyst_sentiment,
             social_sentiment
         FROM symbol_news_features
         WHERE symbol IN ({symbols_str})
-          AND feature_date = '{feature_date.isoformat()}'
+          AND feature_date = '{date_str}'
         """
 
         def execute_query():
@@ -424,7 +520,7 @@ class NewsFeatureProvider:
                 # Returning an empty result here allows the caller to fall back to
                 # computing features from raw `news_articles`.
                 logger.warning(
-                    f"Precomputed news features unavailable for {feature_date.isoformat()} (falling back to raw articles): {e}"
+                    f"Precomputed news features unavailable for {date_str} (falling back to raw articles): {e}"
                 )
                 return []
             finally:
@@ -438,19 +534,19 @@ class NewsFeatureProvider:
             features = NewsFeatures(
                 symbol=row[0],
                 feature_date=row[1],
-                sentiment_1d=row[2] or 0.0,
-                sentiment_3d=row[3] or 0.0,
-                sentiment_momentum=row[4] or 0.0,
-                sentiment_7d=row[5] or 0.0,
-                sentiment_14d=row[6] or 0.0,
-                sentiment_trend=row[7] or 0.0,
-                article_count_1d=row[8] or 0,
-                article_count_7d=row[9] or 0,
-                volume_ratio=row[10] or 0.0,
-                avg_confidence_1d=row[11] or 0.0,
-                high_confidence_ratio=row[12] or 0.0,
-                sentiment_volatility_7d=row[13] or 0.0,
-                sentiment_range_7d=row[14] or 0.0,
+                sentiment_1d=row[2],
+                sentiment_3d=row[3],
+                sentiment_momentum=row[4],
+                sentiment_7d=row[5],
+                sentiment_14d=row[6],
+                sentiment_trend=row[7],
+                article_count_1d=row[8],
+                article_count_7d=row[9],
+                volume_ratio=row[10],
+                avg_confidence_1d=row[11],
+                high_confidence_ratio=row[12],
+                sentiment_volatility_7d=row[13],
+                sentiment_range_7d=row[14],
                 earnings_sentiment=row[15],
                 analyst_sentiment=row[16],
                 social_sentiment=row[17],
@@ -496,29 +592,40 @@ class NewsFeatureProvider:
         SELECT
             symbol,
 
+            -- NULLs are coalesced with ifNull() here rather than in Python.
+
             -- 1-day sentiment
-            avgIf(sentiment_score, published_at >= toDate(target_date) - 1) as sentiment_1d,
+            ifNull(avgIf(sentiment_score, published_at >= toDate(target_date) - 1), 0.0) as sentiment_1d,
 
             -- 3-day sentiment
-            avgIf(sentiment_score, published_at >= toDate(target_date) - 3) as sentiment_3d,
+            ifNull(avgIf(sentiment_score, published_at >= toDate(target_date) - 3), 0.0) as sentiment_3d,
 
             -- 7-day sentiment
-            avgIf(sentiment_score, published_at >= toDate(target_date) - 7) as sentiment_7d,
+            ifNull(avgIf(sentiment_score, published_at >= toDate(target_date) - 7), 0.0) as sentiment_7d,
 
             -- 14-day sentiment
-            avg(sentiment_score) as sentiment_14d,
+            ifNull(avg(sentiment_score), 0.0) as sentiment_14d,
 
             -- Article counts
             countIf(published_at >= toDate(target_date) - 1) as article_count_1d,
             countIf(published_at >= toDate(target_date) - 7) as article_count_7d,
 
             -- Confidence
-            avgIf(sentiment_confidence, published_at >= toDate(target_date) - 1) as avg_confidence_1d,
+            ifNull(avgIf(sentiment_confidence, published_at >= toDate(target_date) - 1), 0.0) as avg_confidence_1d,
 
             -- Volatility
-            stddevPopIf(sentiment_score, published_at >= toDate(target_date) - 7) as sentiment_volatility_7d,
-            maxIf(sentiment_score, published_at >= toDate(target_date) - 7) -
-                minIf(sentiment_score, published_at >= toDate(target_date) - 7) as sentiment_range_7d
+            ifNull(stddevPopIf(sentiment_score, published_at >= toDate(target_date) - 7), 0.0) as sentiment_volatility_7d,
+            ifNull(
+                maxIf(sentiment_score, published_at >= toDate(target_date) - 7) -
+                    minIf(sentiment_score, published_at >= toDate(target_date) - 7),
+                0.0
+            ) as sentiment_range_7d,
+
+            -- Derived features (computed here so ClickHouse vectorizes them)
+            sentiment_1d - sentiment_3d as sentiment_momentum,
+            sentiment_7d - sentiment_14d as sentiment_trend,
+            -- Volume ratio: 1-day count vs 7-day daily average
+            if(article_count_7d > 0, article_count_1d / (article_count_7d / 7.0), 0.0) as volume_ratio
 
         FROM symbol_articles
         WHERE symbol IN ({symbols_str})
@@ -539,24 +646,21 @@ class NewsFeatureProvider:
         
         result = {}
         for row in rows:
-            symbol = row[0]
-            sentiment_1d = row[1] or 0.0
-            sentiment_3d = row[2] or 0.0
-            sentiment_7d = row[3] or 0.0
-            sentiment_14d = row[4] or 0.0
-            article_count_1d = row[5] or 0
-            article_count_7d = row[6] or 0
-            avg_confidence_1d = row[7] or 0.0
-            sentiment_volatility_7d = row[8] or 0.0
-            sentiment_range_7d = row[9] or 0.0
-            
-            # Calculate derived features
-            sentiment_momentum = sentiment_1d - sentiment_3d
-            sentiment_trend = sentiment_7d - sentiment_14d
-            
-            # Volume ratio (vs 14-day average)
-            avg_daily = article_count_7d / 7.0 if article_count_7d > 0 else 1.0
-            volume_ratio = article_count_1d / avg_daily if avg_daily > 0 else 0.0
+            (
+                symbol,
+                sentiment_1d,
+                sentiment_3d,
+                sentiment_7d,
+                sentiment_14d,
+                article_count_1d,
+                article_count_7d,
+                avg_confidence_1d,
+                sentiment_volatility_7d,
+                sentiment_range_7d,
+                sentiment_momentum,
+                sentiment_trend,
+                volume_ratio,
+            ) = row
             
             # High confidence ratio
             high_conf_ratio = 0.5  # Default, would need separate query
@@ -674,9 +778,19 @@ class NewsFeatureProvider:
     
     async def close(self):
         """Close connections."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
         if self.redis_client:
             await self.redis_client.close()
-        # ClickHouse clients are created per-query and closed after each use,
-        # so no persistent client to close here.
+        # ClickHouse clients are created per-query and closed after each use;
+        # only the shared HTTP pool manager outlives them.
+        if self._ch_pool_mgr is not None:
+            self._ch_pool_mgr.clear()
+            self._ch_pool_mgr = None
         self._clickhouse_available = False
         self._initialized = False
@@ -40,11 +40,38 @@ import os
 import signal
 import time
 import asyncio
+import importlib.util
+import aiohttp
 import asyncpg
 import json
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import math
+import random
+import re
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from collections import Counter, OrderedDict
+from zoneinfo import ZoneInfo
+from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass, field
+from operator import attrgetter
+from urllib.parse import urlsplit
+
+import uvicorn
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+# orjson is a C extension; fall back to the stdlib encoder if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloop (libuv-based event loop) is optional; stock asyncio is used without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -92,6 +119,7 @@ try:
         TipRanksConnector,
         # Social Media (optional API key for higher rate limits)
         StockTwitsConnector,
+        NewsArticle,
     )
 except ImportError:
     # Fallback for standalone execution
@@ -108,15 +136,85 @@ except ImportError:
     SECEdgarConnector = None
     TipRanksConnector = None
     StockTwitsConnector = None
+    NewsArticle = None
 
 
-@dataclass
+def _replace_non_finite(obj: Any) -> Any:
+    """Recursively replace NaN/Inf floats with None (JSON has no NaN)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(v) for v in obj]
+    return obj
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON.
+    
+    Uses orjson when available (datetimes, numpy scalars and NaN-as-null
+    handled natively); otherwise the stdlib encoder, after replacing
+    non-finite floats so Postgres jsonb accepts the document.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(_replace_non_finite(obj), default=str).encode()
+
+
+def loads_json(data):
+    """Parse a JSON document (str or bytes), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Session settings sent with every connection's startup packet (no extra
+# round trip). Keepalives let idle connections survive NAT/load-balancer
+# timeouts; the flow's queries are short, so JIT compilation only adds
+# planning time; runaway statements are cut off server-side.
+DB_SERVER_SETTINGS = {
+    'tcp_keepalives_idle': '30',
+    'tcp_keepalives_interval': '10',
+    'tcp_keepalives_count': '3',
+    'jit': 'off',
+    'statement_timeout': '30000',
+}
+
+# Client-side limit (seconds) for a single query on a flow connection
+DB_COMMAND_TIMEOUT_SECONDS = 30
+
+
+async def init_db_connection(conn: asyncpg.Connection):
+    """
+    Pool connection setup: exchange JSONB as Python objects.
+    
+    Uses the binary jsonb wire format (a version byte followed by the JSON
+    text), so values go straight from dumps_json_bytes onto the wire
+    instead of being encoded to str first and re-encoded by asyncpg.
+    """
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=lambda value: b'\x01' + dumps_json_bytes(value),
+        decoder=lambda data: loads_json(data[1:]),
+        schema='pg_catalog',
+        format='binary',
+    )
+
+
+@dataclass(slots=True)
 class MarketDataSnapshot:
     """
     Aggregated market data snapshot for a symbol from all sources.
     
     Contains normalized data from multiple providers for use in
-    recommendation generation.
+    recommendation generation. Uses __slots__ since one is built per
+    symbol per run and the field set is fixed.
     """
     symbol: str
     timestamp: datetime = field(default_factory=datetime.utcnow)
@@ -154,6 +252,20 @@ class MarketDataSnapshot:
     news_count_24h: int = 0
     news_sentiment_avg: Optional[float] = None
     news_articles: List[Dict[str, Any]] = field(default_factory=list)
+    social_sentiment: Optional[float] = None
+    
+    # Running article-weighted sum of per-source news sentiment, and the
+    # total weight; news_sentiment_avg = sentiment_sum / sentiment_weight
+    sentiment_sum: float = field(default=0.0, repr=False)
+    sentiment_weight: float = field(default=0.0, repr=False)
+    
+    # Daily (date, close) pairs, oldest first; input for SMA/RSI, not serialized
+    price_history: List[tuple] = field(default_factory=list, repr=False)
+    
+    # Keys (see news_key) of articles already merged from any source, and
+    # URLs already listed in news_articles
+    seen_news: set = field(default_factory=set, repr=False)
+    seen_urls: set = field(default_factory=set, repr=False)
     
     # Data source tracking
     data_sources: List[str] = field(default_factory=list)
@@ -187,8 +299,523 @@ class MarketDataSnapshot:
             'week_52_low': self.week_52_low,
             'news_count_24h': self.news_count_24h,
             'news_sentiment_avg': self.news_sentiment_avg,
+            'social_sentiment': self.social_sentiment,
             'data_sources': self.data_sources,
         }
+    
+    def is_ready_for_decision(self) -> bool:
+        """
+        Whether enough data has arrived to make a recommendation.
+        
+        True once a price and at least one news/social source are present,
+        so callers streaming partial snapshots can proceed early.
+        """
+        return self.current_price is not None and bool(self.news_articles)
+
+
+# Numeric snapshot fields exported column-wise by snapshot_columns
+SNAPSHOT_NUMERIC_FIELDS = (
+    'current_price', 'open_price', 'high_price', 'low_price', 'close_price',
+    'previous_close', 'volume', 'vwap', 'change_amount', 'change_percent',
+    'sma_20', 'sma_50', 'sma_200', 'rsi',
+    'market_cap', 'pe_ratio', 'eps', 'dividend_yield', 'beta',
+    'week_52_high', 'week_52_low',
+    'news_count_24h', 'news_sentiment_avg', 'social_sentiment',
+)
+SNAPSHOT_DTYPE = np.dtype([(name, np.float64) for name in SNAPSHOT_NUMERIC_FIELDS])
+_snapshot_numeric_values = attrgetter(*SNAPSHOT_NUMERIC_FIELDS)
+
+
+def snapshot_columns(snapshots: List[MarketDataSnapshot]) -> np.ndarray:
+    """
+    Pack the numeric fields of many snapshots into one structured array.
+    
+    Watchlist-wide computations can then work on contiguous columns
+    (e.g. ``table['rsi']``) instead of walking per-symbol objects. Missing
+    values become NaN. Columns stay float64: float32 cannot represent
+    prices above ~$131k to the cent or large volumes exactly.
+    
+    Args:
+        snapshots: Snapshots in row order
+        
+    Returns:
+        Array of SNAPSHOT_DTYPE with one row per snapshot
+    """
+    nan = float('nan')
+    return np.array(
+        [
+            tuple(
+                nan if value is None else value
+                for value in _snapshot_numeric_values(snapshot)
+            )
+            for snapshot in snapshots
+        ],
+        dtype=SNAPSHOT_DTYPE,
+    )
+
+
+# First-available field mappings per source: (data key, fields, first_row).
+# Each field is (snapshot attribute, dotted path inside the data item). With
+# first_row the data item is a list and only its first (most recent) row is used.
+FIELD_MAPS = {
+    'polygon': (
+        ('snapshot', (
+            ('current_price', 'day.c'),
+            ('open_price', 'day.o'),
+            ('high_price', 'day.h'),
+            ('low_price', 'day.l'),
+            ('volume', 'day.v'),
+            ('vwap', 'day.vw'),
+            ('change_amount', 'todays_change'),
+            ('change_percent', 'todays_change_perc'),
+            ('previous_close', 'prev_day.c'),
+        ), False),
+    ),
+    'iex': (
+        ('quote', (
+            ('current_price', 'latestPrice'),
+            ('open_price', 'open'),
+            ('high_price', 'high'),
+            ('low_price', 'low'),
+            ('close_price', 'close'),
+            ('previous_close', 'previousClose'),
+            ('volume', 'volume'),
+            ('change_amount', 'change'),
+            ('change_percent', 'changePercent'),
+            ('market_cap', 'marketCap'),
+            ('pe_ratio', 'peRatio'),
+            ('week_52_high', 'week52High'),
+            ('week_52_low', 'week52Low'),
+        ), False),
+        ('stats', (
+            ('sma_50', 'day50MovingAvg'),
+            ('sma_200', 'day200MovingAvg'),
+            ('beta', 'beta'),
+            ('eps', 'ttmEPS'),
+            ('dividend_yield', 'dividendYield'),
+        ), False),
+    ),
+    # Most recent price row (Nasdaq returns them sorted desc)
+    'nasdaq': (
+        ('prices', (
+            ('close_price', 'close'),
+            ('open_price', 'open'),
+            ('high_price', 'high'),
+            ('low_price', 'low'),
+            ('volume', 'volume'),
+        ), True),
+    ),
+    'yahoo': (
+        ('quote', (
+            ('current_price', 'regularMarketPrice'),
+            ('close_price', 'regularMarketPreviousClose'),
+            ('open_price', 'regularMarketOpen'),
+            ('high_price', 'regularMarketDayHigh'),
+            ('low_price', 'regularMarketDayLow'),
+            ('volume', 'regularMarketVolume'),
+            ('change_amount', 'regularMarketChange'),
+            ('change_percent', 'regularMarketChangePercent'),
+            ('market_cap', 'marketCap'),
+            ('pe_ratio', 'trailingPE'),
+            ('week_52_high', 'fiftyTwoWeekHigh'),
+            ('week_52_low', 'fiftyTwoWeekLow'),
+        ), False),
+    ),
+}
+
+
+def _compile_field_merger(source: str, sections) -> Callable[['MarketDataSnapshot', Dict[str, Any]], None]:
+    """
+    Generate a straight-line merge function for one source's FIELD_MAPS entry.
+    
+    The generated code is the same `if snapshot.x is None: snapshot.x = ...`
+    sequence that would be written by hand, so no mapping tables are walked
+    at merge time.
+    """
+    lines = ["def merge(snapshot, data):"]
+    for key, fields, first_row in sections:
+        lines.append(f"    item = data.get({key!r})")
+        if first_row:
+            lines.append("    item = item[0] if item else None")
+        lines.append("    if item:")
+        for attr, path in fields:
+            if attr not in MarketDataSnapshot.__dataclass_fields__:
+                raise ValueError(f"Unknown snapshot field {attr!r} in {source} field map")
+            *parents, leaf = path.split('.')
+            expr = "item" + "".join(f".get({p!r}, {{}})" for p in parents) + f".get({leaf!r})"
+            lines.append(f"        if snapshot.{attr} is None:")
+            lines.append(f"            snapshot.{attr} = {expr}")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<merge_{source}>", "exec"), namespace)
+    return namespace['merge']
+
+
+FIELD_MERGERS = {
+    source: _compile_field_merger(source, sections)
+    for source, sections in FIELD_MAPS.items()
+}
+
+
+# Source-specific merge steps for news, sentiment and history, run after the
+# field mergers: source -> merge(snapshot, data)
+MERGERS: Dict[str, Callable[['MarketDataSnapshot', Dict[str, Any]], None]] = {}
+
+
+def register(*sources: str):
+    """Register a function as the MERGERS entry for one or more sources."""
+    def decorator(func):
+        for source in sources:
+            MERGERS[source] = func
+        return func
+    return decorator
+
+
+def _extend_news(snapshot: 'MarketDataSnapshot', source: str, items: list,
+                 extras: Optional[Dict[str, str]] = None):
+    """
+    Add the top 5 items of a source to snapshot.news_articles.
+    
+    Items whose URL is already listed (from this or another source) are
+    skipped, so the list stays small for the JSONB explanation and caches.
+    
+    Args:
+        snapshot: Snapshot being merged into
+        source: Source name recorded on each entry
+        items: Articles or messages, most relevant first
+        extras: Entry key -> item metadata key for source-specific fields
+    """
+    seen_urls = snapshot.seen_urls
+    fresh = []
+    for a in items[:5]:
+        if a.url in seen_urls:
+            continue
+        seen_urls.add(a.url)
+        fresh.append(a)
+    
+    if extras:
+        snapshot.news_articles.extend(
+            {
+                'source': source,
+                'title': a.title,
+                'url': a.url,
+                **{key: a.metadata.get(meta_key) for key, meta_key in extras.items()},
+            }
+            for a in fresh
+        )
+    else:
+        snapshot.news_articles.extend(
+            {'source': source, 'title': a.title, 'url': a.url}
+            for a in fresh
+        )
+
+
+def _news_merger(source: str, count: bool = True):
+    """Build a merger that keeps the top 5 headlines (and optionally counts all articles)."""
+    def merge(snapshot: 'MarketDataSnapshot', data: Dict[str, Any]):
+        if 'news' in data:
+            if count:
+                snapshot.news_count_24h += len(data['news'])
+            _extend_news(snapshot, source, data['news'])
+    return merge
+
+
+# Price feeds' headlines are listed but not counted towards news volume
+for _source in ('polygon', 'iex'):
+    MERGERS[_source] = _news_merger(_source, count=False)
+for _source in ('finnhub', 'newsapi', 'benzinga', 'fmp', 'yahoo', 'rss', 'tipranks'):
+    MERGERS[_source] = _news_merger(_source)
+del _source
+
+
+@register('nasdaq')
+def _merge_nasdaq(snapshot: 'MarketDataSnapshot', data: Dict[str, Any]):
+    if data.get('prices'):
+        # Daily closes, oldest first, for SMA/RSI in _calculate_derived_metrics
+        snapshot.price_history = sorted(
+            (p['date'], float(p['close']))
+            for p in data['prices']
+            if p.get('date') and p.get('close') is not None
+        )
+
+
+@register('alpha_vantage')
+def _merge_alpha_vantage(snapshot: 'MarketDataSnapshot', data: Dict[str, Any]):
+    if 'news' in data:
+        snapshot.news_count_24h += len(data['news'])
+        _extend_news(snapshot, 'alpha_vantage', data['news'], {'sentiment': 'sentiment_score'})
+    
+    # Combined across sources in _calculate_derived_metrics
+    if 'avg_sentiment' in data:
+        snapshot.sentiment_sum += data['avg_sentiment'] * data['sentiment_count']
+        snapshot.sentiment_weight += data['sentiment_count']
+
+
+@register('sec_edgar')
+def _merge_sec_edgar(snapshot: 'MarketDataSnapshot', data: Dict[str, Any]):
+    if 'filings' in data:
+        # SEC filings are treated as high-importance news
+        _extend_news(snapshot, 'sec_edgar', data['filings'], {'filing_type': 'filing_type'})
+
+
+@register('stocktwits')
+def _merge_stocktwits(snapshot: 'MarketDataSnapshot', data: Dict[str, Any]):
+    if 'messages' in data:
+        _extend_news(snapshot, 'stocktwits', data['messages'], {'sentiment': 'sentiment'})
+    
+    # Blended into news sentiment once all sources have landed
+    if 'social_sentiment' in data:
+        snapshot.social_sentiment = data['social_sentiment']
+
+
+SMA_WINDOW = 20
+RSI_PERIOD = 14
+
+
+@dataclass(slots=True)
+class IndicatorState:
+    """
+    Rolling SMA20 / RSI14 state for one symbol.
+    
+    Keeps the window sums so a new daily close updates both indicators with
+    a handful of scalar operations. RSI uses the same simple 14-period
+    gain/loss averages as TechnicalFeatureProvider and is scaled to 0-1.
+    
+    Attributes:
+        last_date: Date of the newest close folded into the state
+        closes: The last SMA_WINDOW + 1 closes, oldest first
+        close_sum: Sum of the last SMA_WINDOW closes
+        gain_sum: Sum of gains over the last RSI_PERIOD deltas
+        loss_sum: Sum of losses over the last RSI_PERIOD deltas
+    """
+    last_date: Any
+    closes: List[float]
+    close_sum: float
+    gain_sum: float
+    loss_sum: float
+    
+    @classmethod
+    def seed(cls, history: List[tuple]) -> Optional['IndicatorState']:
+        """Build state from (date, close) history, oldest first."""
+        if len(history) <= RSI_PERIOD:
+            return None
+        closes = np.fromiter((c for _, c in history), dtype=np.float64, count=len(history))
+        deltas = np.diff(closes[-(RSI_PERIOD + 1):])
+        close_sum = (
+            float(np.convolve(closes, np.ones(SMA_WINDOW), mode='valid')[-1])
+            if len(closes) >= SMA_WINDOW else float('nan')
+        )
+        return cls(
+            last_date=history[-1][0],
+            closes=closes[-(SMA_WINDOW + 1):].tolist(),
+            close_sum=close_sum,
+            gain_sum=float(np.clip(deltas, 0, None).sum()),
+            loss_sum=float(np.clip(-deltas, 0, None).sum()),
+        )
+    
+    def advance(self, bar_date, close: float):
+        """Fold one new daily close into the state."""
+        closes = self.closes
+        delta = close - closes[-1]
+        dropped = closes[-RSI_PERIOD] - closes[-RSI_PERIOD - 1]
+        self.gain_sum += max(delta, 0.0) - max(dropped, 0.0)
+        self.loss_sum += max(-delta, 0.0) - max(-dropped, 0.0)
+        if len(closes) >= SMA_WINDOW:
+            self.close_sum += close - closes[-SMA_WINDOW]
+        closes.append(close)
+        if len(closes) == SMA_WINDOW:
+            self.close_sum = float(sum(closes))
+        elif len(closes) > SMA_WINDOW + 1:
+            del closes[0]
+        self.last_date = bar_date
+    
+    @property
+    def sma_20(self) -> Optional[float]:
+        if len(self.closes) < SMA_WINDOW:
+            return None
+        return self.close_sum / SMA_WINDOW
+    
+    @property
+    def rsi(self) -> Optional[float]:
+        total = self.gain_sum + self.loss_sum
+        if total <= 0:
+            return 0.5
+        return self.gain_sum / total
+
+
+@dataclass(frozen=True, slots=True)
+class FetchCall:
+    """
+    A single connector call within a fetch plan.
+    
+    Attributes:
+        key: Key the result is stored under in the per-source data dict
+        method: Name of the connector coroutine to await
+        kwargs: Extra keyword arguments (e.g. limit)
+        symbol_arg: How the symbol is passed - 'symbols' (as a one-item list),
+            'symbol' (as a keyword) or None (positionally)
+        lookback: Time window passed as `since_arg` (and `until_arg` = now)
+        since_arg: Keyword receiving the start of the lookback window
+        until_arg: Keyword receiving the end of the window, if the method takes one
+    """
+    key: str
+    method: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    symbol_arg: Optional[str] = 'symbols'
+    lookback: Optional[timedelta] = None
+    since_arg: str = 'since'
+    until_arg: Optional[str] = None
+    
+    def bind(self, symbols: List[str], now: datetime):
+        """
+        Build (args, kwargs) for calling the connector method.
+        
+        Only 'symbols'-style calls accept more than one symbol; when several
+        are passed the limit is scaled so each symbol keeps its share.
+        """
+        kwargs = dict(self.kwargs)
+        args = ()
+        if self.symbol_arg == 'symbols':
+            kwargs['symbols'] = list(symbols)
+            if len(symbols) > 1 and 'limit' in kwargs:
+                kwargs['limit'] = kwargs['limit'] * len(symbols)
+        elif self.symbol_arg:
+            kwargs[self.symbol_arg] = symbols[0]
+        else:
+            args = (symbols[0],)
+        if self.lookback is not None:
+            kwargs[self.since_arg] = now - self.lookback
+            if self.until_arg:
+                kwargs[self.until_arg] = now
+        return args, kwargs
+
+
+@dataclass(frozen=True, slots=True)
+class FetchPlan:
+    """
+    Declarative description of what to fetch from one connector.
+    
+    Attributes:
+        name: Display name used in log messages
+        attr: MarketDataAggregator attribute holding the connector
+        calls: Connector calls, issued in order
+        postprocess: Optional hook that derives summary values in place
+        batch_size: If > 0, the connector answers a multi-symbol fetch_news
+            with OR semantics in a single request, so the watchlist is fetched
+            in buckets of up to this many symbols and the articles are routed
+            back to each symbol by article.symbols
+    """
+    name: str
+    attr: str
+    calls: tuple
+    postprocess: Optional[Callable[[Dict[str, Any]], None]] = None
+    batch_size: int = 0
+
+
+# VADER normalization constant: s = v / sqrt(v^2 + alpha) maps a summed
+# sentiment onto (-1, 1) so scores from different sources are comparable
+VADER_ALPHA = 15.0
+
+
+def _summarize_news_sentiment(data: Dict[str, Any]):
+    """Combine per-article sentiment scores into one normalized score (Alpha Vantage)."""
+    sentiments = np.fromiter(
+        (
+            article.metadata['sentiment_score']
+            for article in data.get('news', [])
+            if article.metadata.get('sentiment_score') is not None
+        ),
+        dtype=np.float64,
+    )
+    if sentiments.size:
+        total = sentiments.sum()
+        data['avg_sentiment'] = float(total / np.sqrt(total * total + VADER_ALPHA))
+        data['sentiment_count'] = int(sentiments.size)
+
+
+def _summarize_social_sentiment(data: Dict[str, Any]):
+    """Calculate sentiment from pre-labeled messages (StockTwits)."""
+    labels = Counter(m.metadata.get('sentiment') for m in data.get('messages', []))
+    bullish = labels['bullish']
+    bearish = labels['bearish']
+    total_labeled = bullish + bearish
+    if total_labeled > 0:
+        # Sentiment score: 1.0 = all bullish, -1.0 = all bearish
+        data['social_sentiment'] = (bullish - bearish) / total_labeled
+        data['bullish_count'] = bullish
+        data['bearish_count'] = bearish
+
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def news_key(article) -> int:
+    """
+    Identity of a news article across connectors.
+    
+    Wire stories are republished by several providers with different
+    punctuation and casing, so the key is the normalized headline plus the
+    publisher's host rather than the provider-specific URL.
+    """
+    title = _NON_WORD.sub(' ', (article.title or '').lower()).strip()
+    return hash((title, urlsplit(article.url or '').netloc))
+
+
+_WEEK = timedelta(days=7)
+
+FETCH_PLANS = (
+    FetchPlan('Polygon', 'polygon', (
+        FetchCall('snapshot', 'get_snapshot', symbol_arg=None),
+        FetchCall('prev_close', 'get_previous_close', symbol_arg=None),
+        FetchCall('news', 'fetch_news', {'limit': 10}),
+    )),
+    FetchPlan('IEX', 'iex', (
+        FetchCall('quote', 'get_quote', symbol_arg=None),
+        FetchCall('stats', 'get_key_stats', symbol_arg=None),
+        FetchCall('news', 'fetch_news', {'limit': 10}),
+    )),
+    # Last 30 days of prices for technical analysis
+    FetchPlan('Nasdaq', 'nasdaq', (
+        FetchCall('prices', 'get_stock_prices', symbol_arg='symbol',
+                  lookback=timedelta(days=30), since_arg='start_date', until_arg='end_date'),
+    )),
+    FetchPlan('Alpha Vantage', 'alpha_vantage', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=timedelta(hours=24)),
+    ), postprocess=_summarize_news_sentiment),
+    FetchPlan('Finnhub', 'finnhub', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    # Symbols are OR'ed into one query; 5 x 20 articles fills the 100-article
+    # page and keeps the query under NewsAPI's 500 character limit
+    FetchPlan('NewsAPI', 'newsapi', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    ), batch_size=5),
+    FetchPlan('Benzinga', 'benzinga', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    FetchPlan('FMP', 'fmp', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    # ============== FREE CONNECTORS ==============
+    FetchPlan('Yahoo Finance', 'yahoo', (
+        FetchCall('quote', 'fetch_quote', symbol_arg=None),
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    FetchPlan('RSS feed', 'rss', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    # Filings are less frequent, so look back further
+    FetchPlan('SEC EDGAR', 'sec_edgar', (
+        FetchCall('filings', 'fetch_news', {'limit': 10}, lookback=timedelta(days=30)),
+    )),
+    FetchPlan('TipRanks', 'tipranks', (
+        FetchCall('news', 'fetch_news', {'limit': 20}, lookback=_WEEK),
+    )),
+    # ============== SOCIAL MEDIA CONNECTORS ==============
+    # StockTwits is more real-time
+    FetchPlan('StockTwits', 'stocktwits', (
+        FetchCall('messages', 'fetch_news', {'limit': 30}, lookback=timedelta(days=1)),
+    ), postprocess=_summarize_social_sentiment),
+)
 
 
 class MarketDataAggregator:
@@ -208,8 +835,33 @@ class MarketDataAggregator:
     All connectors load API keys from Vault with fallback to environment variables.
     """
     
-    def __init__(self):
-        """Initialize the market data aggregator with all connectors."""
+    def __init__(
+        self,
+        max_concurrent_fetches: int = 16,
+        fetch_budget_seconds: float = 30.0,
+        news_cache_ttl: int = 3600,
+        news_cache_size: int = 4096,
+        quorum_sources: Optional[int] = 5,
+        quorum_news_sources: int = 3,
+        redis_url: Optional[str] = None,
+    ):
+        """
+        Initialize the market data aggregator with all connectors.
+        
+        Args:
+            max_concurrent_fetches: Maximum number of connector fetches in flight
+            fetch_budget_seconds: Longest a single source fetch may run once it
+                holds its bulkhead slots (queueing behind other symbols is free)
+            news_cache_ttl: Seconds a fetched news list is reused (0 disables caching)
+            news_cache_size: Maximum number of cached news lists (LRU eviction)
+            quorum_sources: Once every snapshot has a price and this many
+                sources, outstanding fetches are cancelled (None waits for all).
+                QUORUM_EXEMPT_SOURCES are always waited for
+            quorum_news_sources: How many of those sources must have
+                delivered news or social messages
+            redis_url: Optional Redis shared by all processes as a second
+                news cache tier, so restarts and one-shot runs start warm
+        """
         # Connectors requiring API keys (loaded from Vault)
         self.polygon: Optional[PolygonConnector] = None
         self.iex: Optional[IEXCloudConnector] = None
@@ -229,242 +881,193 @@ class MarketDataAggregator:
         # Social media connectors (optional API key for higher rate limits)
         self.stocktwits: Optional[StockTwitsConnector] = None
         
+        # Upper bound on in-flight connector fetches across all symbols
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        
+        # One HTTP session (connection pool + DNS cache) shared by all connectors
+        self._http: Optional[aiohttp.ClientSession] = None
+        self.fetch_budget_seconds = fetch_budget_seconds
+        self.quorum_sources = quorum_sources
+        self.quorum_news_sources = quorum_news_sources
+        
+        # Per-source bulkheads and circuit breaker state
+        self._source_semaphores: Dict[str, asyncio.Semaphore] = {
+            plan.attr: asyncio.Semaphore(
+                self.SOURCE_CONCURRENCY.get(plan.attr, self.DEFAULT_SOURCE_CONCURRENCY)
+            )
+            for plan in self.FETCH_PLANS
+        }
+        self._consecutive_failures: Counter = Counter()
+        self._disabled_until: Dict[str, float] = {}
+        
+        # Rolling SMA/RSI state per symbol, advanced incrementally between runs
+        self._indicator_state: Dict[str, IndicatorState] = {}
+        
+        # News cache: (source, call key, symbols, since hour) -> (expires_at, articles)
+        self.news_cache_ttl = news_cache_ttl
+        self.news_cache_size = news_cache_size
+        self._news_cache: OrderedDict = OrderedDict()
+        self.redis_url = redis_url
+        self._redis = None
+        
         self._initialized = False
     
+    # Connector registry: (attribute, connector class, display name, category).
+    # Paid connectors need an API key from Vault/env, free ones need nothing,
+    # social ones work anonymously but pick up an optional access token.
+    CONNECTOR_SPECS = (
+        ('polygon', PolygonConnector, 'Polygon.io', 'paid'),
+        ('iex', IEXCloudConnector, 'IEX Cloud', 'paid'),
+        ('nasdaq', NasdaqDataLinkConnector, 'Nasdaq Data Link', 'paid'),
+        ('alpha_vantage', AlphaVantageConnector, 'Alpha Vantage', 'paid'),
+        ('finnhub', FinnhubConnector, 'Finnhub', 'paid'),
+        ('newsapi', NewsAPIConnector, 'NewsAPI', 'paid'),
+        ('benzinga', BenzingaConnector, 'Benzinga', 'paid'),
+        ('fmp', FinancialModelingPrepConnector, 'Financial Modeling Prep', 'paid'),
+        ('yahoo', YahooFinanceConnector, 'Yahoo Finance', 'free'),
+        ('rss', RSSFeedConnector, 'RSS Feed', 'free'),
+        ('sec_edgar', SECEdgarConnector, 'SEC EDGAR', 'free'),
+        ('tipranks', TipRanksConnector, 'TipRanks', 'free'),
+        ('stocktwits', StockTwitsConnector, 'StockTwits', 'social'),
+    )
+    
+    FETCH_PLANS = FETCH_PLANS
+    
+    # Per-source bulkheads: max in-flight fetches and per-fetch timeout (s).
+    # Rate-limited APIs get a single slot; timeouts leave room for the
+    # connectors' own rate-limit waits (Alpha Vantage is 5 req/min).
+    SOURCE_CONCURRENCY = {
+        'polygon': 5,
+        'alpha_vantage': 1,
+        'newsapi': 1,
+        'stocktwits': 1,
+        'sec_edgar': 2,
+    }
+    DEFAULT_SOURCE_CONCURRENCY = 4
+    SOURCE_TIMEOUTS = {
+        'alpha_vantage': 30.0,
+        'sec_edgar': 20.0,
+        'newsapi': 15.0,
+    }
+    DEFAULT_SOURCE_TIMEOUT = 10.0
+    
+    # Seconds fetched news stays cached, where it differs from news_cache_ttl
+    NEWS_CACHE_TTLS = {
+        'stocktwits': 1800,
+    }
+    REDIS_NEWS_PREFIX = 'rec:news'
+    
+    # Circuit breaker: skip a source for a while after repeated failures
+    CIRCUIT_BREAKER_THRESHOLD = 3
+    CIRCUIT_BREAKER_COOLDOWN = 60.0
+    
+    # Sources nothing else substitutes for, never cancelled at quorum:
+    # Nasdaq is the only price history (SMA20/RSI14 fallback) and StockTwits
+    # the only social sentiment (30% of the blended sentiment)
+    QUORUM_EXEMPT_SOURCES = frozenset({'nasdaq', 'stocktwits'})
+    
     async def initialize(self):
         """
         Initialize all available connectors based on API keys from Vault.
         
         Connectors are initialized lazily - API keys are loaded from Vault
-        on first use. This method creates the connector instances and checks
-        the 'enabled' flag for disabled connectors.
+        on first use. Every connector in CONNECTOR_SPECS is set up concurrently,
+        so total startup time is bounded by the slowest Vault lookup rather
+        than the sum of all of them.
         """
         logger.info("Initializing market data connectors...")
         
-        # Initialize Polygon.io (loads API key from Vault on first use)
-        if PolygonConnector:
-            try:
-                self.polygon = PolygonConnector()
-                # Trigger API key loading to check if enabled
-                await self.polygon._ensure_api_key()
-                if self.polygon.api_key:
-                    logger.info("✓ Polygon.io connector initialized")
-                else:
-                    logger.info("✗ Polygon.io connector skipped - no API key configured")
-                    self.polygon = None
-            except Exception as e:
-                logger.warning(f"✗ Polygon.io connector failed: {e}")
-                self.polygon = None
-        
-        # Initialize IEX Cloud (check enabled flag - disabled until API key added)
-        if IEXCloudConnector:
-            try:
-                connector = IEXCloudConnector()
-                await connector._ensure_api_key()
-                # Check if connector is enabled (has API key)
-                if getattr(connector, 'enabled', True) and connector.api_key:
-                    self.iex = connector
-                    logger.info("✓ IEX Cloud connector initialized")
-                else:
-                    logger.info("✗ IEX Cloud connector disabled - no API key configured")
-            except Exception as e:
-                logger.warning(f"✗ IEX Cloud connector failed: {e}")
-        
-        # Initialize Nasdaq Data Link (loads API key from Vault on first use)
-        if NasdaqDataLinkConnector:
-            try:
-                self.nasdaq = NasdaqDataLinkConnector()
-                await self.nasdaq._ensure_api_key()
-                if self.nasdaq.api_key:
-                    logger.info("✓ Nasdaq Data Link connector initialized")
-                else:
-                    logger.info("✗ Nasdaq Data Link connector skipped - no API key configured")
-                    self.nasdaq = None
-            except Exception as e:
-                logger.warning(f"✗ Nasdaq Data Link connector failed: {e}")
-                self.nasdaq = None
-        
-        # Initialize Alpha Vantage (loads API key from Vault on first use)
-        if AlphaVantageConnector:
-            try:
-                self.alpha_vantage = AlphaVantageConnector()
-                await self.alpha_vantage._ensure_api_key()
-                if self.alpha_vantage.api_key:
-                    logger.info("✓ Alpha Vantage connector initialized")
-                else:
-                    logger.info("✗ Alpha Vantage connector skipped - no API key configured")
-                    self.alpha_vantage = None
-            except Exception as e:
-                logger.warning(f"✗ Alpha Vantage connector failed: {e}")
-                self.alpha_vantage = None
-        
-        # Initialize Finnhub (loads API key from Vault on first use)
-        if FinnhubConnector:
-            try:
-                self.finnhub = FinnhubConnector()
-                await self.finnhub._ensure_api_key()
-                if self.finnhub.api_key:
-                    logger.info("✓ Finnhub connector initialized")
-                else:
-                    logger.info("✗ Finnhub connector skipped - no API key configured")
-                    self.finnhub = None
-            except Exception as e:
-                logger.warning(f"✗ Finnhub connector failed: {e}")
-                self.finnhub = None
-        
-        # Initialize NewsAPI (loads API key from Vault on first use)
-        if NewsAPIConnector:
-            try:
-                self.newsapi = NewsAPIConnector()
-                await self.newsapi._ensure_api_key()
-                if self.newsapi.api_key:
-                    logger.info("✓ NewsAPI connector initialized")
-                else:
-                    logger.info("✗ NewsAPI connector skipped - no API key configured")
-                    self.newsapi = None
-            except Exception as e:
-                logger.warning(f"✗ NewsAPI connector failed: {e}")
-                self.newsapi = None
-        
-        # Initialize Benzinga (loads API key from Vault on first use)
-        if BenzingaConnector:
-            try:
-                self.benzinga = BenzingaConnector()
-                await self.benzinga._ensure_api_key()
-                if self.benzinga.api_key:
-                    logger.info("✓ Benzinga connector initialized")
-                else:
-                    logger.info("✗ Benzinga connector skipped - no API key configured")
-                    self.benzinga = None
-            except Exception as e:
-                logger.warning(f"✗ Benzinga connector failed: {e}")
-                self.benzinga = None
-        
-        # Initialize Financial Modeling Prep (loads API key from Vault on first use)
-        if FinancialModelingPrepConnector:
-            try:
-                self.fmp = FinancialModelingPrepConnector()
-                await self.fmp._ensure_api_key()
-                if self.fmp.api_key:
-                    logger.info("✓ Financial Modeling Prep connector initialized")
-                else:
-                    logger.info("✗ Financial Modeling Prep connector skipped - no API key configured")
-                    self.fmp = None
-            except Exception as e:
-                logger.warning(f"✗ Financial Modeling Prep connector failed: {e}")
-                self.fmp = None
-        
-        # ============== FREE CONNECTORS (no API keys required) ==============
-        
-        # Initialize Yahoo Finance (free, no API key required)
-        if YahooFinanceConnector:
-            try:
-                self.yahoo = YahooFinanceConnector()
-                logger.info("✓ Yahoo Finance connector initialized (free)")
-            except Exception as e:
-                logger.warning(f"✗ Yahoo Finance connector failed: {e}")
-                self.yahoo = None
+        if self._http is None or self._http.closed:
+            # Keep idle connections for a minute: rate-limited sources (Alpha
+            # Vantage at 5/min) would otherwise reconnect and redo the TLS
+            # handshake on nearly every request
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
         
-        # Initialize RSS Feed connector (free, no API key required)
-        if RSSFeedConnector:
+        if self.redis_url and self._redis is None:
             try:
-                self.rss = RSSFeedConnector()
-                logger.info("✓ RSS Feed connector initialized (free)")
+                import redis.asyncio as redis
+                self._redis = redis.from_url(self.redis_url, socket_keepalive=True)
+                await self._redis.ping()
+                logger.info("Connected to Redis news cache")
             except Exception as e:
-                logger.warning(f"✗ RSS Feed connector failed: {e}")
-                self.rss = None
+                logger.warning(f"Redis not available, news cache is in-process only: {e}")
+                self._redis = None
         
-        # Initialize SEC EDGAR connector (free, no API key required)
-        if SECEdgarConnector:
-            try:
-                self.sec_edgar = SECEdgarConnector()
-                logger.info("✓ SEC EDGAR connector initialized (free)")
-            except Exception as e:
-                logger.warning(f"✗ SEC EDGAR connector failed: {e}")
-                self.sec_edgar = None
+        specs = [spec for spec in self.CONNECTOR_SPECS if spec[1] is not None]
+        results = await asyncio.gather(
+            *[self._init_connector(name, cls, category) for _, cls, name, category in specs],
+            return_exceptions=True
+        )
         
-        # Initialize TipRanks connector (free, no API key required)
-        if TipRanksConnector:
-            try:
-                self.tipranks = TipRanksConnector()
-                logger.info("✓ TipRanks connector initialized (free)")
-            except Exception as e:
-                logger.warning(f"✗ TipRanks connector failed: {e}")
-                self.tipranks = None
+        counts = Counter()
+        for (attr, _, name, category), result in zip(specs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"✗ {name} connector failed: {result}")
+                result = None
+            setattr(self, attr, result)
+            if result is not None:
+                counts[category] += 1
         
-        # ============== SOCIAL MEDIA CONNECTORS ==============
+        self._initialized = True
         
-        # Initialize StockTwits connector (works without auth, optional token for higher limits)
-        if StockTwitsConnector:
-            try:
-                self.stocktwits = StockTwitsConnector()
-                # Try to load optional access token from Vault
-                await self.stocktwits._ensure_access_token()
-                if self.stocktwits.access_token:
-                    logger.info("✓ StockTwits connector initialized (with auth - higher rate limits)")
-                else:
-                    logger.info("✓ StockTwits connector initialized (no auth - lower rate limits)")
-            except Exception as e:
-                logger.warning(f"✗ StockTwits connector failed: {e}")
-                self.stocktwits = None
+        logger.info(f"Market data aggregator initialized with {sum(counts.values())} connector(s) "
+                   f"({counts['paid']} paid, {counts['free']} free, {counts['social']} social)")
+    
+    async def _init_connector(self, name: str, cls, category: str):
+        """
+        Create a single connector and load its credentials.
         
-        self._initialized = True
+        Args:
+            name: Display name used in log messages
+            cls: Connector class to instantiate
+            category: 'paid', 'free' or 'social'
+            
+        Returns:
+            The connector instance, or None if it has no API key configured
+        """
+        connector = cls(session=self._http)
+        
+        if category == 'paid':
+            # Trigger API key loading to check if enabled (IEX also carries
+            # an explicit 'enabled' flag that stays False without a key)
+            await connector._ensure_api_key()
+            if not (getattr(connector, 'enabled', True) and connector.api_key):
+                logger.info(f"✗ {name} connector skipped - no API key configured")
+                return None
+            logger.info(f"✓ {name} connector initialized")
+        elif category == 'social':
+            # Works without auth; try to load optional access token from Vault
+            await connector._ensure_access_token()
+            if connector.access_token:
+                logger.info(f"✓ {name} connector initialized (with auth - higher rate limits)")
+            else:
+                logger.info(f"✓ {name} connector initialized (no auth - lower rate limits)")
+        else:
+            logger.info(f"✓ {name} connector initialized (free)")
         
-        # Count active connectors
-        paid_connectors = sum([
-            self.polygon is not None,
-            self.iex is not None,
-            self.nasdaq is not None,
-            self.alpha_vantage is not None,
-            self.finnhub is not None,
-            self.newsapi is not None,
-            self.benzinga is not None,
-            self.fmp is not None,
-        ])
-        free_connectors = sum([
-            self.yahoo is not None,
-            self.rss is not None,
-            self.sec_edgar is not None,
-            self.tipranks is not None,
-        ])
-        social_connectors = sum([
-            self.stocktwits is not None,
-        ])
-        total_connectors = paid_connectors + free_connectors + social_connectors
-        logger.info(f"Market data aggregator initialized with {total_connectors} connector(s) "
-                   f"({paid_connectors} paid, {free_connectors} free, {social_connectors} social)")
+        return connector
     
     async def close(self):
-        """Close all connector sessions."""
-        # Close paid connectors
-        if self.polygon:
-            await self.polygon.close()
-        if self.iex:
-            await self.iex.close()
-        if self.nasdaq:
-            await self.nasdaq.close()
-        if self.alpha_vantage:
-            await self.alpha_vantage.close()
-        if self.finnhub:
-            await self.finnhub.close()
-        if self.newsapi:
-            await self.newsapi.close()
-        if self.benzinga:
-            await self.benzinga.close()
-        if self.fmp:
-            await self.fmp.close()
-        # Close free connectors
-        if self.yahoo:
-            await self.yahoo.close()
-        if self.rss:
-            await self.rss.close()
-        if self.sec_edgar:
-            await self.sec_edgar.close()
-        if self.tipranks:
-            await self.tipranks.close()
-        # Close social media connectors
-        if self.stocktwits:
-            await self.stocktwits.close()
+        """Close all connectors and the shared HTTP session."""
+        connectors = [getattr(self, attr) for attr, *_ in self.CONNECTOR_SPECS]
+        await asyncio.gather(
+            *[connector.close() for connector in connectors if connector],
+            return_exceptions=True
+        )
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
     
     async def get_snapshot(self, symbol: str) -> MarketDataSnapshot:
         """
@@ -479,654 +1082,416 @@ class MarketDataAggregator:
         Returns:
             MarketDataSnapshot with data from all sources
         """
-        snapshot = MarketDataSnapshot(symbol=symbol)
-        
-        # Fetch data from all sources concurrently
-        tasks = []
-        
-        if self.polygon:
-            tasks.append(('polygon', self._fetch_polygon_data(symbol)))
-        if self.iex:
-            tasks.append(('iex', self._fetch_iex_data(symbol)))
-        if self.nasdaq:
-            tasks.append(('nasdaq', self._fetch_nasdaq_data(symbol)))
-        if self.alpha_vantage:
-            tasks.append(('alpha_vantage', self._fetch_alpha_vantage_data(symbol)))
-        if self.finnhub:
-            tasks.append(('finnhub', self._fetch_finnhub_data(symbol)))
-        if self.newsapi:
-            tasks.append(('newsapi', self._fetch_newsapi_data(symbol)))
-        if self.benzinga:
-            tasks.append(('benzinga', self._fetch_benzinga_data(symbol)))
-        if self.fmp:
-            tasks.append(('fmp', self._fetch_fmp_data(symbol)))
-        # Free connectors (no API keys required)
-        if self.yahoo:
-            tasks.append(('yahoo', self._fetch_yahoo_data(symbol)))
-        if self.rss:
-            tasks.append(('rss', self._fetch_rss_data(symbol)))
-        if self.sec_edgar:
-            tasks.append(('sec_edgar', self._fetch_sec_edgar_data(symbol)))
-        if self.tipranks:
-            tasks.append(('tipranks', self._fetch_tipranks_data(symbol)))
-        # Social media connectors
-        if self.stocktwits:
-            tasks.append(('stocktwits', self._fetch_stocktwits_data(symbol)))
-        
-        if not tasks:
-            logger.warning(f"No data connectors available for {symbol}")
-            return snapshot
-        
-        # Execute all fetches concurrently
-        results = await asyncio.gather(
-            *[task for _, task in tasks],
-            return_exceptions=True
-        )
-        
-        # Process results from each source
-        for (source_name, _), result in zip(tasks, results):
-            if isinstance(result, Exception):
-                error_msg = f"{source_name}: {str(result)}"
-                snapshot.errors.append(error_msg)
-                logger.warning(f"Data fetch error for {symbol} from {source_name}: {result}")
-            elif result:
-                snapshot.data_sources.append(source_name)
-                self._merge_data(snapshot, result, source_name)
-        
-        # Calculate derived metrics
-        self._calculate_derived_metrics(snapshot)
-        
-        logger.debug(f"Snapshot for {symbol}: sources={snapshot.data_sources}, "
-                    f"price={snapshot.current_price}, errors={len(snapshot.errors)}")
-        
-        return snapshot
-    
-    async def _fetch_polygon_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Polygon.io."""
-        data = {}
-        
-        try:
-            # Get snapshot (current price and today's data)
-            snapshot = await self.polygon.get_snapshot(symbol)
-            if snapshot:
-                data['snapshot'] = snapshot
-            
-            # Get previous close
-            prev_close = await self.polygon.get_previous_close(symbol)
-            if prev_close:
-                data['prev_close'] = prev_close
-            
-            # Get news
-            news = await self.polygon.fetch_news(symbols=[symbol], limit=10)
-            if news:
-                data['news'] = news
-                
-        except Exception as e:
-            logger.warning(f"Polygon data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_iex_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from IEX Cloud."""
-        data = {}
-        
-        try:
-            # Get quote
-            quote = await self.iex.get_quote(symbol)
-            if quote:
-                data['quote'] = quote
-            
-            # Get key stats
-            stats = await self.iex.get_key_stats(symbol)
-            if stats:
-                data['stats'] = stats
-            
-            # Get news
-            news = await self.iex.fetch_news(symbols=[symbol], limit=10)
-            if news:
-                data['news'] = news
-                
-        except Exception as e:
-            logger.warning(f"IEX data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
+        snapshots = await self.get_snapshots([symbol])
+        return snapshots[symbol]
     
-    async def _fetch_nasdaq_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Nasdaq Data Link."""
-        data = {}
+    async def get_snapshots(
+        self,
+        symbols: List[str],
+        now: Optional[datetime] = None,
+    ) -> Dict[str, MarketDataSnapshot]:
+        """
+        Get aggregated market data snapshots for several symbols at once.
+        
+        Every (symbol, source) fetch runs concurrently, bounded by
+        max_concurrent_fetches and the per-source bulkheads. The
+        fetch_budget_seconds deadline applies to each fetch on its own and
+        starts once it holds its slots, so single-slot sources still serve
+        every symbol of a long watchlist, one after another. Results are
+        merged in completion order, so for first-available fields the fastest
+        source wins. Sources whose news endpoint accepts a list of symbols
+        (plan.batch_size) are called once per bucket of symbols and the
+        articles are routed back to each symbol. Once every snapshot has
+        reached the source quorum, the remaining fetches are cancelled,
+        except those of QUORUM_EXEMPT_SOURCES.
         
-        try:
-            # Get historical prices (last 30 days for technical analysis)
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=30)
+        Args:
+            symbols: Stock ticker symbols
+            now: Reference time for the cycle (default: current UTC time);
+                lookback windows end here and snapshots are stamped with it
             
-            prices = await self.nasdaq.get_stock_prices(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            if prices:
-                data['prices'] = prices
-                
-        except Exception as e:
-            logger.warning(f"Nasdaq data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_alpha_vantage_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Alpha Vantage."""
-        data = {}
-        
-        try:
-            # Get news with sentiment
-            since = datetime.utcnow() - timedelta(hours=24)
-            news = await self.alpha_vantage.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                # Calculate average sentiment
-                sentiments = [
-                    article.metadata.get('sentiment_score', 0)
-                    for article in news
-                    if article.metadata.get('sentiment_score') is not None
-                ]
-                if sentiments:
-                    data['avg_sentiment'] = sum(sentiments) / len(sentiments)
-                    
-        except Exception as e:
-            logger.warning(f"Alpha Vantage data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_finnhub_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Finnhub."""
-        data = {}
-        
-        try:
-            # Get company news
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.finnhub.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
-        except Exception as e:
-            logger.warning(f"Finnhub data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_newsapi_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from NewsAPI."""
-        data = {}
-        
-        try:
-            # Search for news about the symbol
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.newsapi.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
-        except Exception as e:
-            logger.warning(f"NewsAPI data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_benzinga_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Benzinga."""
-        data = {}
-        
-        try:
-            # Get news articles
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.benzinga.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
-        except Exception as e:
-            logger.warning(f"Benzinga data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    async def _fetch_fmp_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Financial Modeling Prep."""
-        data = {}
-        
-        try:
-            # Get news articles
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.fmp.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
-        except Exception as e:
-            logger.warning(f"FMP data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
-    
-    # ============== FREE CONNECTOR FETCH METHODS ==============
-    
-    async def _fetch_yahoo_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from Yahoo Finance (free, no API key required)."""
-        data = {}
-        
-        try:
-            # Get price quote
-            quote = await self.yahoo.fetch_quote(symbol)
-            if quote:
-                data['quote'] = quote
+        Returns:
+            Dictionary of symbol -> MarketDataSnapshot
+        """
+        # One clock reading per cycle: every source sees the same `since`
+        # bounds, which keeps fetch windows (and cache keys) consistent
+        now = now or datetime.utcnow()
+        snapshots = {symbol: MarketDataSnapshot(symbol=symbol, timestamp=now) for symbol in symbols}
+        # Resolve each plan's connector methods once per cycle; every job of
+        # a plan then calls the same bound methods without further lookups
+        fetchers = [
+            (plan, tuple(getattr(connector, call.method, None) for call in plan.calls))
+            for plan in self.FETCH_PLANS
+            if (connector := getattr(self, plan.attr)) and not self._circuit_open(plan.attr)
+        ]
+        
+        if not fetchers:
+            logger.warning(f"No data connectors available for {', '.join(symbols)}")
+            return snapshots
+        
+        # One job per (plan, symbols); batched plans cover a bucket of symbols
+        # task -> source, to tell which pending fetches the quorum may cancel
+        sources = {}
+        for plan, methods in fetchers:
+            size = plan.batch_size or 1
+            for i in range(0, len(symbols), size):
+                task = asyncio.create_task(
+                    self._run_job(plan, methods, symbols[i:i + size], now)
+                )
+                sources[task] = plan.attr
+        
+        # Merge each source as soon as it lands, so fast sources populate the
+        # snapshot without waiting on the slowest API; a fetch that overruns
+        # its budget comes back as a timeout error (see _run_job)
+        awaiting_quorum = set(symbols) if self.quorum_sources else None
+        news_sources = Counter()
+        pending = set(sources)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                plan, job_symbols, result = task.result()
+                for symbol in job_symbols:
+                    if isinstance(result, Exception):
+                        self._record_error(snapshots[symbol], plan.attr, result)
+                        continue
+                    symbol_data = result.get(symbol)
+                    self._merge_source(snapshots[symbol], plan.attr, symbol_data)
+                    if awaiting_quorum is None or symbol not in awaiting_quorum:
+                        continue
+                    if symbol_data and ('news' in symbol_data or 'messages' in symbol_data):
+                        news_sources[symbol] += 1
+                    snapshot = snapshots[symbol]
+                    if (snapshot.current_price is not None
+                            and len(snapshot.data_sources) >= self.quorum_sources
+                            and news_sources[symbol] >= self.quorum_news_sources):
+                        awaiting_quorum.discard(symbol)
             
-            # Get news articles
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.yahoo.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
-        except Exception as e:
-            logger.warning(f"Yahoo Finance data fetch error for {symbol}: {e}")
-            raise
+            if awaiting_quorum is not None and not awaiting_quorum:
+                # Quorum reached for every symbol: stop spending rate limit
+                # and CPU on sources that would not change the decision, but
+                # keep waiting for the ones nothing else can stand in for
+                cancelled = {
+                    task for task in pending
+                    if sources[task] not in self.QUORUM_EXEMPT_SOURCES
+                }
+                for task in cancelled:
+                    task.cancel()
+                pending -= cancelled
+                awaiting_quorum = None
+                logger.debug(f"Source quorum reached, cancelled {len(cancelled)} pending fetches")
+        
+        for symbol, snapshot in snapshots.items():
+            # Calculate derived metrics
+            self._calculate_derived_metrics(snapshot)
+            
+            logger.debug(f"Snapshot for {symbol}: sources={snapshot.data_sources}, "
+                        f"price={snapshot.current_price}, errors={len(snapshot.errors)}")
         
-        return data
+        return snapshots
     
-    async def _fetch_rss_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from RSS feeds (free, no API key required)."""
-        data = {}
+    def _merge_source(self, snapshot: MarketDataSnapshot, source_name: str, result: Optional[Dict[str, Any]]):
+        """Merge one source's result into a snapshot, if it returned anything."""
+        if result:
+            snapshot.data_sources.append(source_name)
+            self._merge_data(snapshot, result, source_name)
+    
+    def _record_error(self, snapshot: MarketDataSnapshot, source_name: str, error: BaseException):
+        """Record a failed source fetch on a snapshot."""
+        snapshot.errors.append(f"{source_name}: {str(error)}")
+        logger.warning(f"Data fetch error for {snapshot.symbol} from {source_name}: {error}")
+    
+    async def _run_job(self, plan: 'FetchPlan', methods: tuple, symbols: List[str], now: datetime):
+        """
+        Run a fetch plan inside the global and per-source bulkheads.
+        
+        Each fetch is bounded by the source's timeout, capped at
+        fetch_budget_seconds; the clock starts once both slots are held, so
+        time spent queued behind other symbols does not count. Failures feed
+        the circuit breaker and a success resets it.
         
+        Returns:
+            Tuple of (plan, symbols, result), where result is the per-symbol
+            data dict or the exception raised by the fetch
+        """
+        source = plan.attr
+        timeout = min(
+            self.SOURCE_TIMEOUTS.get(source, self.DEFAULT_SOURCE_TIMEOUT),
+            self.fetch_budget_seconds,
+        )
         try:
-            # Get news from financial RSS feeds
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.rss.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
+            async with self._fetch_semaphore, self._source_semaphores[source]:
+                result = await asyncio.wait_for(
+                    self._run_plan(plan, methods, symbols, now), timeout=timeout
+                )
+        except asyncio.TimeoutError:
+            self._record_failure(source)
+            return plan, symbols, TimeoutError(f"timed out after {timeout}s")
         except Exception as e:
-            logger.warning(f"RSS feed data fetch error for {symbol}: {e}")
-            raise
+            self._record_failure(source)
+            return plan, symbols, e
+        
+        self._consecutive_failures.pop(source, None)
+        return plan, symbols, result
+    
+    def _circuit_open(self, source: str) -> bool:
+        """Whether a source is temporarily disabled by the circuit breaker."""
+        disabled_until = self._disabled_until.get(source)
+        if disabled_until is None:
+            return False
+        if time.monotonic() >= disabled_until:
+            # Cooldown over: let the next fetch probe the source again
+            del self._disabled_until[source]
+            return False
+        return True
+    
+    def _record_failure(self, source: str):
+        """Count a failed fetch and open the circuit after too many in a row."""
+        self._consecutive_failures[source] += 1
+        if self._consecutive_failures[source] >= self.CIRCUIT_BREAKER_THRESHOLD:
+            self._disabled_until[source] = time.monotonic() + self.CIRCUIT_BREAKER_COOLDOWN
+            self._consecutive_failures[source] = 0
+            logger.warning(f"Circuit open for {source} after {self.CIRCUIT_BREAKER_THRESHOLD} "
+                           f"consecutive failures; skipping it for {self.CIRCUIT_BREAKER_COOLDOWN:.0f}s")
+    
+    async def _run_plan(self, plan: 'FetchPlan', methods: tuple, symbols: List[str],
+                        now: datetime) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute a fetch plan against its connector.
         
-        return data
-    
-    async def _fetch_sec_edgar_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from SEC EDGAR (free, no API key required)."""
+        Calls are issued in plan order; empty results are dropped so the
+        merge step only sees keys that actually carry data. For a batched
+        multi-symbol fetch, articles are assigned to each requested symbol
+        they mention, up to the per-symbol limit.
+        
+        Args:
+            plan: Fetch plan describing the connector calls
+            methods: The connector's bound method for each of plan.calls
+            symbols: Stock ticker symbols (more than one only for batch plans)
+            now: Reference time for the cycle; lookback windows end here
+            
+        Returns:
+            Dictionary of symbol -> (call key -> result), post-processed by the plan
+        """
         data = {}
         
+        # Errors propagate to _run_job, which records them once per symbol
+        for call, method in zip(plan.calls, methods):
+            if method is None:
+                raise AttributeError(f"connector has no {call.method}()")
+            args, kwargs = call.bind(symbols, now)
+            if call.method == 'fetch_news':
+                result = await self._fetch_news_cached(method, plan, call, symbols, args, kwargs)
+            else:
+                result = await method(*args, **kwargs)
+            if result:
+                data[call.key] = result
+        
+        if len(symbols) == 1:
+            per_symbol = {symbols[0]: data}
+        else:
+            per_symbol = {symbol: {} for symbol in symbols}
+            for call in plan.calls:
+                limit = call.kwargs.get('limit')
+                for article in data.get(call.key, []):
+                    for symbol in article.symbols:
+                        bucket = per_symbol.get(symbol)
+                        if bucket is None:
+                            continue
+                        articles = bucket.setdefault(call.key, [])
+                        if limit is None or len(articles) < limit:
+                            articles.append(article)
+        
+        if plan.postprocess:
+            for symbol_data in per_symbol.values():
+                if symbol_data:
+                    plan.postprocess(symbol_data)
+        
+        return per_symbol
+    
+    async def _fetch_news_cached(self, fetch_news, plan: 'FetchPlan', call: 'FetchCall',
+                                 symbols: List[str], args: tuple, kwargs: Dict[str, Any]):
+        """
+        Call a connector's fetch_news through the TTL cache.
+        
+        The `since` bound is bucketed to the hour for the cache key, so
+        repeated runs and on-demand requests within the same hour reuse the
+        already-parsed articles instead of hitting the API again. Lookups go
+        to the in-process LRU first, then to Redis (if configured). Empty
+        results are not cached in either tier, so a transient empty or
+        rate-limited response is retried on the next call.
+        """
+        if self.news_cache_ttl <= 0:
+            return await fetch_news(*args, **kwargs)
+        ttl = self.NEWS_CACHE_TTLS.get(plan.attr, self.news_cache_ttl)
+        
+        since = kwargs.get(call.since_arg)
+        bucket = since.replace(minute=0, second=0, microsecond=0) if since else None
+        key = (plan.attr, call.key, tuple(symbols), bucket)
+        
+        cached = self._news_cache.get(key)
+        if cached is not None:
+            expires_at, articles = cached
+            if expires_at > time.monotonic():
+                self._news_cache.move_to_end(key)
+                return articles
+            del self._news_cache[key]
+        
+        articles = await self._redis_get_news(key)
+        if articles is None:
+            articles = await fetch_news(*args, **kwargs)
+            await self._redis_set_news(key, articles, ttl)
+        
+        if not articles:
+            return articles
+        self._news_cache[key] = (time.monotonic() + ttl, articles)
+        while len(self._news_cache) > self.news_cache_size:
+            self._news_cache.popitem(last=False)
+        return articles
+    
+    def _redis_news_key(self, key: tuple) -> str:
+        """Redis key for a news cache key: prefix:source:call:SYM1,SYM2:bucket."""
+        attr, call_key, symbols, bucket = key
+        stamp = int(bucket.timestamp()) if bucket else 0
+        return f"{self.REDIS_NEWS_PREFIX}:{attr}:{call_key}:{','.join(symbols)}:{stamp}"
+    
+    async def _redis_get_news(self, key: tuple) -> Optional[list]:
+        """Cached articles from Redis, or None on a miss or Redis error."""
+        if self._redis is None or NewsArticle is None:
+            return None
         try:
-            # Get SEC filings (10-K, 10-Q, 8-K, etc.)
-            since = datetime.utcnow() - timedelta(days=30)  # Filings are less frequent
-            filings = await self.sec_edgar.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=10
-            )
-            if filings:
-                data['filings'] = filings
-                    
+            payload = await self._redis.get(self._redis_news_key(key))
         except Exception as e:
-            logger.warning(f"SEC EDGAR data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
+            logger.debug(f"Redis news cache read failed: {e}")
+            return None
+        if payload is None:
+            return None
+        return [NewsArticle.from_dict(item) for item in loads_json(payload)]
     
-    async def _fetch_tipranks_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from TipRanks (free, no API key required)."""
-        data = {}
-        
+    async def _redis_set_news(self, key: tuple, articles, ttl: int):
+        """Store fetched articles in Redis; failures only cost a future refetch."""
+        if self._redis is None or not articles:
+            return
         try:
-            # Get analyst ratings and news
-            since = datetime.utcnow() - timedelta(days=7)
-            news = await self.tipranks.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=20
-            )
-            if news:
-                data['news'] = news
-                    
+            payload = dumps_json_bytes([article.to_dict() for article in articles])
+            await self._redis.set(self._redis_news_key(key), payload, ex=ttl)
         except Exception as e:
-            logger.warning(f"TipRanks data fetch error for {symbol}: {e}")
-            raise
-        
-        return data
+            logger.debug(f"Redis news cache write failed: {e}")
     
-    # ============== SOCIAL MEDIA CONNECTOR FETCH METHODS ==============
-    
-    async def _fetch_stocktwits_data(self, symbol: str) -> Dict[str, Any]:
-        """Fetch data from StockTwits (works without auth, optional token for higher limits)."""
-        data = {}
+    async def invalidate_news_cache(self, symbol: Optional[str] = None):
+        """
+        Drop cached news, e.g. when the news pipeline signals fresh articles.
         
-        try:
-            # Get social sentiment and messages about the symbol
-            since = datetime.utcnow() - timedelta(days=1)  # StockTwits is more real-time
-            messages = await self.stocktwits.fetch_news(
-                symbols=[symbol],
-                since=since,
-                limit=30
-            )
-            if messages:
-                data['messages'] = messages
-                # Calculate sentiment from pre-labeled messages
-                bullish = sum(1 for m in messages if m.metadata.get('sentiment') == 'bullish')
-                bearish = sum(1 for m in messages if m.metadata.get('sentiment') == 'bearish')
-                total_labeled = bullish + bearish
-                if total_labeled > 0:
-                    # Sentiment score: 1.0 = all bullish, -1.0 = all bearish
-                    data['social_sentiment'] = (bullish - bearish) / total_labeled
-                    data['bullish_count'] = bullish
-                    data['bearish_count'] = bearish
-                    
-        except Exception as e:
-            logger.warning(f"StockTwits data fetch error for {symbol}: {e}")
-            raise
+        Args:
+            symbol: Only drop entries covering this symbol (default: everything)
+        """
+        if symbol is None:
+            self._news_cache.clear()
+            pattern = f"{self.REDIS_NEWS_PREFIX}:*"
+        else:
+            for key in [k for k in self._news_cache if symbol in k[2]]:
+                del self._news_cache[key]
+            # Symbols sit comma-separated between the call key and the bucket
+            pattern = f"{self.REDIS_NEWS_PREFIX}:*[:,]{symbol}[:,]*"
         
-        return data
+        if self._redis is not None:
+            try:
+                keys = [k async for k in self._redis.scan_iter(match=pattern)]
+                if keys:
+                    await self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate Redis news cache: {e}")
     
     def _merge_data(self, snapshot: MarketDataSnapshot, data: Dict[str, Any], source: str):
         """
         Merge data from a source into the snapshot.
         
-        Uses first-available strategy for most fields, but averages
-        for news sentiment when multiple sources provide it.
+        Uses first-available strategy for most fields (via the precompiled
+        FIELD_MERGERS), while news and sentiment are accumulated by the
+        per-source MERGERS and combined in _calculate_derived_metrics.
+        Articles another source already delivered are dropped so they are
+        not counted twice.
         """
-        if source == 'polygon':
-            if 'snapshot' in data:
-                s = data['snapshot']
-                if snapshot.current_price is None:
-                    snapshot.current_price = s.get('day', {}).get('c')
-                if snapshot.open_price is None:
-                    snapshot.open_price = s.get('day', {}).get('o')
-                if snapshot.high_price is None:
-                    snapshot.high_price = s.get('day', {}).get('h')
-                if snapshot.low_price is None:
-                    snapshot.low_price = s.get('day', {}).get('l')
-                if snapshot.volume is None:
-                    snapshot.volume = s.get('day', {}).get('v')
-                if snapshot.vwap is None:
-                    snapshot.vwap = s.get('day', {}).get('vw')
-                if snapshot.change_amount is None:
-                    snapshot.change_amount = s.get('todays_change')
-                if snapshot.change_percent is None:
-                    snapshot.change_percent = s.get('todays_change_perc')
-                if snapshot.previous_close is None:
-                    prev = s.get('prev_day', {})
-                    snapshot.previous_close = prev.get('c')
-            
-            if 'news' in data:
-                snapshot.news_articles.extend([
-                    {'source': 'polygon', 'title': a.title, 'url': a.url}
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'iex':
-            if 'quote' in data:
-                q = data['quote']
-                if snapshot.current_price is None:
-                    snapshot.current_price = q.get('latestPrice')
-                if snapshot.open_price is None:
-                    snapshot.open_price = q.get('open')
-                if snapshot.high_price is None:
-                    snapshot.high_price = q.get('high')
-                if snapshot.low_price is None:
-                    snapshot.low_price = q.get('low')
-                if snapshot.close_price is None:
-                    snapshot.close_price = q.get('close')
-                if snapshot.previous_close is None:
-                    snapshot.previous_close = q.get('previousClose')
-                if snapshot.volume is None:
-                    snapshot.volume = q.get('volume')
-                if snapshot.change_amount is None:
-                    snapshot.change_amount = q.get('change')
-                if snapshot.change_percent is None:
-                    snapshot.change_percent = q.get('changePercent')
-                if snapshot.market_cap is None:
-                    snapshot.market_cap = q.get('marketCap')
-                if snapshot.pe_ratio is None:
-                    snapshot.pe_ratio = q.get('peRatio')
-                if snapshot.week_52_high is None:
-                    snapshot.week_52_high = q.get('week52High')
-                if snapshot.week_52_low is None:
-                    snapshot.week_52_low = q.get('week52Low')
-            
-            if 'stats' in data:
-                s = data['stats']
-                if snapshot.sma_50 is None:
-                    snapshot.sma_50 = s.get('day50MovingAvg')
-                if snapshot.sma_200 is None:
-                    snapshot.sma_200 = s.get('day200MovingAvg')
-                if snapshot.beta is None:
-                    snapshot.beta = s.get('beta')
-                if snapshot.eps is None:
-                    snapshot.eps = s.get('ttmEPS')
-                if snapshot.dividend_yield is None:
-                    snapshot.dividend_yield = s.get('dividendYield')
-            
-            if 'news' in data:
-                snapshot.news_articles.extend([
-                    {'source': 'iex', 'title': a.title, 'url': a.url}
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'nasdaq':
-            if 'prices' in data and data['prices']:
-                # Use most recent price if no current price yet
-                latest = data['prices'][0]  # Assuming sorted desc
-                if snapshot.close_price is None:
-                    snapshot.close_price = latest.get('close')
-                if snapshot.open_price is None:
-                    snapshot.open_price = latest.get('open')
-                if snapshot.high_price is None:
-                    snapshot.high_price = latest.get('high')
-                if snapshot.low_price is None:
-                    snapshot.low_price = latest.get('low')
-                if snapshot.volume is None:
-                    snapshot.volume = latest.get('volume')
-        
-        elif source == 'alpha_vantage':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'alpha_vantage',
-                        'title': a.title,
-                        'url': a.url,
-                        'sentiment': a.metadata.get('sentiment_score')
-                    }
-                    for a in data['news'][:5]
-                ])
-            
-            if 'avg_sentiment' in data:
-                if snapshot.news_sentiment_avg is None:
-                    snapshot.news_sentiment_avg = data['avg_sentiment']
-                else:
-                    # Average with existing sentiment
-                    snapshot.news_sentiment_avg = (
-                        snapshot.news_sentiment_avg + data['avg_sentiment']
-                    ) / 2
+        field_merger = FIELD_MERGERS.get(source)
+        if field_merger is not None:
+            field_merger(snapshot, data)
+        
+        if data.get('news'):
+            seen = snapshot.seen_news
+            unique = []
+            for article in data['news']:
+                key = news_key(article)
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(article)
+            data['news'] = unique
+        
+        merger = MERGERS.get(source)
+        if merger is not None:
+            merger(snapshot, data)
+    
+    def _update_indicators(self, symbol: str, history: List[tuple]) -> Optional['IndicatorState']:
+        """
+        Bring the cached indicator state for a symbol up to date.
         
-        elif source == 'finnhub':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'finnhub',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'newsapi':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'newsapi',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'benzinga':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'benzinga',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'fmp':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'fmp',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        # ============== FREE CONNECTORS ==============
-        
-        elif source == 'yahoo':
-            # Extract price from Yahoo quote
-            if 'quote' in data:
-                q = data['quote']
-                if snapshot.current_price is None:
-                    snapshot.current_price = q.get('regularMarketPrice')
-                if snapshot.close_price is None:
-                    snapshot.close_price = q.get('regularMarketPreviousClose')
-                if snapshot.open_price is None:
-                    snapshot.open_price = q.get('regularMarketOpen')
-                if snapshot.high_price is None:
-                    snapshot.high_price = q.get('regularMarketDayHigh')
-                if snapshot.low_price is None:
-                    snapshot.low_price = q.get('regularMarketDayLow')
-                if snapshot.volume is None:
-                    snapshot.volume = q.get('regularMarketVolume')
-                if snapshot.change_amount is None:
-                    snapshot.change_amount = q.get('regularMarketChange')
-                if snapshot.change_percent is None:
-                    snapshot.change_percent = q.get('regularMarketChangePercent')
-                if snapshot.market_cap is None:
-                    snapshot.market_cap = q.get('marketCap')
-                if snapshot.pe_ratio is None:
-                    snapshot.pe_ratio = q.get('trailingPE')
-                if snapshot.week_52_high is None:
-                    snapshot.week_52_high = q.get('fiftyTwoWeekHigh')
-                if snapshot.week_52_low is None:
-                    snapshot.week_52_low = q.get('fiftyTwoWeekLow')
-            
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'yahoo',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'rss':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'rss',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        elif source == 'sec_edgar':
-            if 'filings' in data:
-                # SEC filings are treated as high-importance news
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'sec_edgar',
-                        'title': a.title,
-                        'url': a.url,
-                        'filing_type': a.metadata.get('filing_type') if hasattr(a, 'metadata') else None,
-                    }
-                    for a in data['filings'][:5]
-                ])
-        
-        elif source == 'tipranks':
-            if 'news' in data:
-                snapshot.news_count_24h += len(data['news'])
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'tipranks',
-                        'title': a.title,
-                        'url': a.url,
-                    }
-                    for a in data['news'][:5]
-                ])
-        
-        # ============== SOCIAL MEDIA CONNECTORS ==============
-        
-        elif source == 'stocktwits':
-            if 'messages' in data:
-                snapshot.news_articles.extend([
-                    {
-                        'source': 'stocktwits',
-                        'title': m.title,
-                        'url': m.url,
-                        'sentiment': m.metadata.get('sentiment') if hasattr(m, 'metadata') else None,
-                    }
-                    for m in data['messages'][:5]
-                ])
+        Between runs usually only the newest daily close differs, so known
+        state is advanced in O(1) per new bar; otherwise (first run, gaps,
+        restated history) it is re-seeded from the full history.
+        
+        Args:
+            symbol: Stock ticker symbol
+            history: (date, close) pairs, oldest first
             
-            # Use StockTwits social sentiment to influence overall sentiment
-            if 'social_sentiment' in data:
-                if snapshot.news_sentiment_avg is None:
-                    snapshot.news_sentiment_avg = data['social_sentiment']
-                else:
-                    # Weight social sentiment at 30% vs 70% for news sentiment
-                    snapshot.news_sentiment_avg = (
-                        snapshot.news_sentiment_avg * 0.7 + data['social_sentiment'] * 0.3
-                    )
+        Returns:
+            Updated IndicatorState, or None if there is too little history
+        """
+        state = self._indicator_state.get(symbol)
+        
+        if state is not None:
+            dates = [d for d, _ in history]
+            try:
+                idx = dates.index(state.last_date)
+            except ValueError:
+                idx = -1
+            new_bars = history[idx + 1:] if idx >= 0 else None
+            # Only advance if the overlapping tail still matches what we saw
+            if new_bars is not None and history[idx][1] == state.closes[-1]:
+                for bar_date, close in new_bars:
+                    state.advance(bar_date, close)
+                return state
+        
+        state = IndicatorState.seed(history)
+        if state is not None:
+            self._indicator_state[symbol] = state
+        return state
     
     def _calculate_derived_metrics(self, snapshot: MarketDataSnapshot):
         """Calculate derived metrics from raw data."""
+        # Combine per-source news sentiment, weighting each source by how
+        # many articles its score is based on (sums are order-independent)
+        if snapshot.sentiment_weight:
+            snapshot.news_sentiment_avg = snapshot.sentiment_sum / snapshot.sentiment_weight
+        
+        # Use StockTwits social sentiment to influence overall sentiment. Done
+        # here rather than in _merge_data so the blend doesn't depend on which
+        # source happened to arrive first.
+        if snapshot.social_sentiment is not None:
+            if snapshot.news_sentiment_avg is None:
+                snapshot.news_sentiment_avg = snapshot.social_sentiment
+            else:
+                # Weight social sentiment at 30% vs 70% for news sentiment
+                snapshot.news_sentiment_avg = (
+                    snapshot.news_sentiment_avg * 0.7 + snapshot.social_sentiment * 0.3
+                )
+        
+        # SMA20 / RSI14 from the daily close history (Nasdaq Data Link)
+        if snapshot.price_history:
+            state = self._update_indicators(snapshot.symbol, snapshot.price_history)
+            if state is not None:
+                if snapshot.sma_20 is None and state.sma_20 is not None:
+                    snapshot.sma_20 = state.sma_20
+                if snapshot.rsi is None and state.rsi is not None:
+                    snapshot.rsi = state.rsi
+        
         # Calculate price vs SMA ratios if we have the data
         if snapshot.current_price and snapshot.sma_50:
             # This could be used for trend analysis
@@ -1137,6 +1502,170 @@ class MarketDataAggregator:
             snapshot.current_price = snapshot.close_price
 
 
+# Column order shared by the bulk COPY and the row-by-row fallback INSERT
+RECOMMENDATION_COLUMNS = (
+    'symbol',
+    # legacy combined
+    'action', 'score', 'normalized_score', 'confidence',
+    # split tracks
+    'news_action', 'news_normalized_score', 'news_confidence',
+    'technical_action', 'technical_normalized_score', 'technical_confidence',
+    # features
+    'price_at_recommendation',
+    'news_sentiment_score', 'news_momentum_score',
+    'technical_trend_score', 'technical_momentum_score',
+    'rsi', 'macd_histogram', 'price_vs_sma20',
+    'news_sentiment_1d', 'article_count_24h',
+    'explanation', 'data_sources_used', 'generated_at',
+)
+
+INSERT_RECOMMENDATION_SQL = (
+    f"INSERT INTO stock_recommendations ({', '.join(RECOMMENDATION_COLUMNS)}) "
+    f"VALUES ({', '.join(f'${i}' for i in range(1, len(RECOMMENDATION_COLUMNS) + 1))})"
+)
+
+
+def _db_float(v):
+    """Coerce a value to a finite float, or None (NUMERIC has no NaN/Inf)."""
+    if v is None:
+        return None
+    try:
+        n = float(v)
+    except (TypeError, ValueError):
+        return None
+    return n if math.isfinite(n) else None
+
+
+def _recommendation_record(
+    symbol: str,
+    recommendation,
+    features: tuple,
+    explanation: Optional[Dict[str, Any]],
+    data_sources: List[str],
+) -> tuple:
+    """
+    Pack a recommendation into a stock_recommendations row.
+    
+    This is the one place that knows RECOMMENDATION_COLUMNS order. Score
+    ranges are enforced by CHECK constraints (V29) and the engine's model;
+    only non-finite values are dropped here.
+    
+    Args:
+        symbol: Stock ticker symbol
+        recommendation: Recommendation object from the engine
+        features: The ten feature columns, price_at_recommendation through
+            article_count_24h
+        explanation: Explanation stored in the JSONB column
+        data_sources: Values for data_sources_used
+    """
+    raw_score = recommendation.score if recommendation.score is not None else 0.0
+    normalized_score = recommendation.normalized_score
+    if normalized_score is None:
+        normalized_score = (raw_score + 1) / 2
+    return (
+        symbol,
+        # legacy combined
+        recommendation.action,
+        _db_float(raw_score),
+        _db_float(normalized_score),
+        _db_float(recommendation.confidence),
+        # split tracks
+        recommendation.news_action,
+        _db_float(recommendation.news_normalized_score),
+        _db_float(recommendation.news_confidence),
+        recommendation.technical_action,
+        _db_float(recommendation.technical_normalized_score),
+        _db_float(recommendation.technical_confidence),
+        # features
+        *features,
+        explanation,
+        data_sources,
+        recommendation.generated_at or datetime.now(timezone.utc),
+    )
+
+
+def _api_recommendation_record(symbol: str, rec_obj) -> tuple:
+    """
+    Build a stock_recommendations row for a recommendation generated through
+    the HTTP API (no market snapshot enrichment).
+
+    Rows are in RECOMMENDATION_COLUMNS order, so API batches are written
+    through the same COPY path (and prepared INSERT fallback) as the
+    scheduled flow.
+    """
+    features = (
+        rec_obj.price_at_recommendation,
+        rec_obj.news_sentiment_score,
+        rec_obj.news_momentum_score,
+        rec_obj.technical_trend_score,
+        rec_obj.technical_momentum_score,
+        rec_obj.rsi,
+        rec_obj.macd_histogram,
+        rec_obj.price_vs_sma20,
+        rec_obj.news_sentiment_1d,
+        rec_obj.article_count_24h or 0,
+    )
+    return _recommendation_record(
+        symbol, rec_obj, features, rec_obj.explanation or None, ['news', 'technical']
+    )
+
+
+# Keep only the 10 newest recommendations for each of the given symbols.
+# Each symbol reads its rows newest-first from idx_recommendations_symbol_time
+# and deletes whatever is past the 10th, so the work scales with the number
+# of symbols in the run rather than with the size of the table. Returns the
+# number of rows deleted.
+CLEANUP_RECOMMENDATIONS_SQL = """
+    WITH deleted AS (
+        DELETE FROM stock_recommendations
+        WHERE id IN (
+            SELECT stale.id
+            FROM unnest($1::text[]) AS run(symbol)
+            CROSS JOIN LATERAL (
+                SELECT id FROM stock_recommendations
+                WHERE symbol = run.symbol
+                ORDER BY generated_at DESC
+                OFFSET 10
+            ) stale
+        )
+        RETURNING 1
+    )
+    SELECT count(*) FROM deleted
+"""
+
+RECOMMENDATION_HISTORY_SQL = """
+    SELECT 
+        id, symbol, action, score, normalized_score, confidence,
+        price_at_recommendation,
+        news_sentiment_score, news_momentum_score,
+        technical_trend_score, technical_momentum_score,
+        rsi, macd_histogram, price_vs_sma20,
+        news_sentiment_1d, article_count_24h,
+        explanation, data_sources_used, generated_at, created_at
+    FROM stock_recommendations
+    WHERE symbol = $1
+    ORDER BY generated_at DESC
+    LIMIT $2
+"""
+
+
+def _normalize_symbol(symbol: Any) -> str:
+    """Canonical ticker form (stripped, upper-case) for generation and cache keys."""
+    if not isinstance(symbol, str):
+        symbol = str(symbol)
+    return symbol.strip().upper()
+
+
+def _maybe_dict(obj):
+    """Convert a pydantic model or plain object to a dict for JSON responses."""
+    if obj is None:
+        return None
+    if getattr(type(obj), 'dict', None) is not None:
+        return obj.dict()
+    attrs = getattr(obj, '__dict__', None)
+    return dict(attrs) if attrs is not None else obj
+
+
 @dataclass
 class WatchlistConfig:
     """Configuration for the watchlist of stocks to analyze."""
@@ -1146,7 +1675,7 @@ class WatchlistConfig:
     def from_env(cls) -> 'WatchlistConfig':
         """Load watchlist from environment variable or use defaults (fallback only)."""
         symbols_str = os.getenv('WATCHLIST_SYMBOLS', 'AAPL,GOOGL,MSFT')
-        symbols = [s.strip().upper() for s in symbols_str.split(',') if s.strip()]
+        symbols = [_normalize_symbol(s) for s in symbols_str.split(',') if s.strip()]
         return cls(symbols=symbols)
     
     @classmethod
@@ -1200,14 +1729,28 @@ class RecommendationFlowService:
     - Alpha Vantage: News with sentiment scores
     """
     
-    # Schedule interval: 2 hours in seconds
-    # Fixed schedule times in PST (hour, minute)
-    SCHEDULED_RUN_TIMES = [(7, 30), (12, 0)]  # 7:30 AM PST and 12:00 PM PST
+    # Fixed schedule times in Pacific time (hour, minute); PDT in summer
+    SCHEDULED_RUN_TIMES = sorted([(7, 30), (12, 0)])  # 7:30 AM PST and 12:00 PM PST
+    SCHEDULE_TIMEZONE = ZoneInfo('America/Los_Angeles')
+    
+    # The watchlist is reloaded when user_watchlist sends a NOTIFY on this
+    # channel (V26 trigger), and at the latest after the TTL as a safety net
+    WATCHLIST_CHANNEL = 'watchlist_changed'
+    WATCHLIST_TTL_SECONDS = 300
+    
+    # On-demand API responses (/regime, /generate/single) are shared through
+    # Redis for a short, jittered TTL so polling clients don't each trigger
+    # a feature fetch; bump the version when a response shape changes
+    RESPONSE_CACHE_PREFIX = 'rec:v1'
+    RESPONSE_CACHE_TTL_SECONDS = 60
+    RESPONSE_CACHE_TTL_JITTER = 0.1
     
     def __init__(
         self,
         postgres_dsn: Optional[str] = None,
         watchlist: Optional[WatchlistConfig] = None,
+        symbol_concurrency: Optional[int] = None,
+        db_pool_size: Optional[int] = None,
     ):
         """
         Initialize the recommendation flow service.
@@ -1215,6 +1758,10 @@ class RecommendationFlowService:
         Args:
             postgres_dsn: PostgreSQL connection string
             watchlist: Configuration for stocks to analyze
+            symbol_concurrency: Maximum symbols processed at once
+                (default: RECOMMENDATION_CONCURRENCY env var, or 8)
+            db_pool_size: Maximum pooled Postgres connections
+                (default: RECOMMENDATION_DB_POOL_SIZE env var, or 16)
         """
         self.postgres_dsn = postgres_dsn or os.getenv(
             'DATABASE_URL',
@@ -1225,17 +1772,53 @@ class RecommendationFlowService:
         self.db_pool: Optional[asyncpg.Pool] = None
         self.data_aggregator: Optional[MarketDataAggregator] = None
         self._running = False
+        self._stop_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watchlist_loaded_at: Optional[float] = None
+        self._watchlist_listener: Optional[asyncpg.Connection] = None
+        self.redis_url = os.getenv('REDIS_URL')
+        self._redis = None
+        
+        # Bounds concurrent engine calls; the connectors throttle themselves
+        # with their own per-minute rate limits
+        self.symbol_concurrency = symbol_concurrency or int(
+            os.getenv('RECOMMENDATION_CONCURRENCY', '8')
+        )
+        self._symbol_semaphore = asyncio.Semaphore(self.symbol_concurrency)
+        # Batch API calls answer HOLD for a symbol that takes longer than
+        # this, instead of holding the whole response for the slowest one
+        self.api_symbol_timeout = float(os.getenv('RECOMMENDATION_API_SYMBOL_TIMEOUT', '8'))
+        
+        # Each run writes through one connection; the rest serve concurrent
+        # API requests (history reads, on-demand saves)
+        self.db_pool_size = db_pool_size or int(
+            os.getenv('RECOMMENDATION_DB_POOL_SIZE', '16')
+        )
     
-    async def initialize(self):
-        """Initialize database connection, market data aggregator, and recommendation engine."""
+    async def initialize(self, scheduler: bool = True):
+        """
+        Initialize database connection, market data aggregator, and recommendation engine.
+        
+        Args:
+            scheduler: Load the watchlist and LISTEN for changes to it. API-only
+                workers pass False: they don't run the schedule, and each
+                listener is a Postgres connection held outside the pool. A
+                /generate run on such a worker loads the watchlist on demand.
+        """
         logger.info("Initializing Recommendation Flow Service...")
         
         # Initialize database pool
         try:
             self.db_pool = await asyncpg.create_pool(
                 self.postgres_dsn,
-                min_size=2,
-                max_size=10,
+                min_size=min(4, self.db_pool_size),
+                max_size=self.db_pool_size,
+                init=init_db_connection,
+                # Runs are hours apart; keep prepared statements for the
+                # connection's lifetime instead of re-parsing after 5 minutes
+                max_cached_statement_lifetime=0,
+                command_timeout=DB_COMMAND_TIMEOUT_SECONDS,
+                server_settings=DB_SERVER_SETTINGS,
             )
             logger.info("Database pool created successfully")
         except Exception as e:
@@ -1243,26 +1826,151 @@ class RecommendationFlowService:
             raise
         
         # Load watchlist from database (user's actual watchlist from onboarding)
-        self.watchlist = await WatchlistConfig.from_database(self.db_pool)
+        if scheduler:
+            await self._load_watchlist()
+            await self._listen_for_watchlist_changes()
+        
+        if self.redis_url and self._redis is None:
+            try:
+                import redis.asyncio as redis
+                self._redis = redis.from_url(self.redis_url, socket_keepalive=True)
+                await self._redis.ping()
+                logger.info("Connected to Redis response cache")
+            except Exception as e:
+                logger.warning(f"Redis not available, API responses are not cached: {e}")
+                self._redis = None
         
         # Initialize market data aggregator with all connectors
-        self.data_aggregator = MarketDataAggregator()
+        self.data_aggregator = MarketDataAggregator(redis_url=self.redis_url)
         await self.data_aggregator.initialize()
         
         # Initialize recommendation engine
         self.engine = await get_engine()
         logger.info(f"Recommendation engine initialized")
-        logger.info(f"Watchlist: {self.watchlist.symbols}")
+        if scheduler:
+            logger.info(f"Watchlist: {self.watchlist.symbols}")
+    
+    async def _load_watchlist(self):
+        """Load the watchlist from user_watchlist and remember when."""
+        self.watchlist = await WatchlistConfig.from_database(self.db_pool)
+        self._watchlist_loaded_at = time.monotonic()
+    
+    async def _refresh_watchlist(self):
+        """Reload the watchlist if it changed (NOTIFY) or the TTL expired."""
+        if self.db_pool is None:
+            return
+        loaded_at = self._watchlist_loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self.WATCHLIST_TTL_SECONDS:
+            await self._load_watchlist()
+    
+    def _on_watchlist_changed(self, connection, pid, channel, payload):
+        """asyncpg NOTIFY callback: reload the watchlist before the next run."""
+        logger.info("Watchlist changed, reloading before the next run")
+        self._watchlist_loaded_at = None
+    
+    async def _listen_for_watchlist_changes(self):
+        """
+        LISTEN for watchlist changes on a dedicated connection.
+        
+        Notifications are only delivered to the connection that LISTENs, so
+        it is kept outside the pool. If it can't be set up, the TTL alone
+        keeps the watchlist fresh.
+        """
+        try:
+            self._watchlist_listener = await asyncpg.connect(
+                self.postgres_dsn, server_settings=DB_SERVER_SETTINGS
+            )
+            await self._watchlist_listener.add_listener(
+                self.WATCHLIST_CHANNEL, self._on_watchlist_changed
+            )
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.warning(f"Could not listen for watchlist changes, relying on "
+                           f"{self.WATCHLIST_TTL_SECONDS}s reload: {e}")
+            if self._watchlist_listener is not None:
+                await self._watchlist_listener.close()
+            self._watchlist_listener = None
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Current Postgres pool usage, for the /pool/stats endpoint."""
+        if self.db_pool is None:
+            return {"available": False}
+        size = self.db_pool.get_size()
+        idle = self.db_pool.get_idle_size()
+        return {
+            "available": True,
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self.db_pool.get_min_size(),
+            "max_size": self.db_pool.get_max_size(),
+        }
     
     async def close(self):
         """Clean up resources."""
+        if self._watchlist_listener is not None:
+            await self._watchlist_listener.close()
+            self._watchlist_listener = None
         if self.data_aggregator:
             await self.data_aggregator.close()
             logger.info("Market data aggregator closed")
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
         if self.db_pool:
             await self.db_pool.close()
             logger.info("Database pool closed")
     
+    def _response_cache_key(self, kind: str, symbol: str) -> str:
+        """Redis key for a cached API response: prefix:kind:SYMBOL."""
+        return f"{self.RESPONSE_CACHE_PREFIX}:{kind}:{symbol}"
+    
+    async def get_cached_response(self, kind: str, symbol: str) -> Optional[Dict[str, Any]]:
+        """Cached API response from Redis, or None on a miss or Redis error."""
+        return (await self.get_cached_responses(kind, [symbol])).get(symbol)
+    
+    async def get_cached_responses(self, kind: str, symbols: List[str]) -> Dict[str, Any]:
+        """
+        Cached API responses for several symbols in one MGET round trip.
+        
+        Returns:
+            Dict of symbol -> response for the hits only (empty on a Redis error)
+        """
+        if self._redis is None or not symbols:
+            return {}
+        try:
+            payloads = await self._redis.mget([self._response_cache_key(kind, s) for s in symbols])
+        except Exception as e:
+            logger.debug(f"Redis response cache read failed: {e}")
+            return {}
+        return {
+            symbol: loads_json(payload)
+            for symbol, payload in zip(symbols, payloads)
+            if payload is not None
+        }
+    
+    async def cache_response(self, kind: str, symbol: str, response: Dict[str, Any]):
+        """Store an API response in Redis; failures only cost a recompute."""
+        await self.cache_responses(kind, {symbol: response})
+    
+    async def cache_responses(self, kind: str, responses: Dict[str, Any]):
+        """
+        Store API responses (symbol -> response) in one pipelined round trip.
+        
+        Each TTL is jittered so responses cached together don't all expire
+        (and get recomputed) in the same instant.
+        """
+        if self._redis is None or not responses:
+            return
+        jitter = self.RESPONSE_CACHE_TTL_JITTER
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for symbol, response in responses.items():
+                    ttl = max(1, round(self.RESPONSE_CACHE_TTL_SECONDS * random.uniform(1 - jitter, 1 + jitter)))
+                    pipe.set(self._response_cache_key(kind, symbol), dumps_json_bytes(response), ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Redis response cache write failed: {e}")
+    
     async def run_once(self) -> Dict[str, Any]:
         """
         Run a single iteration of the recommendation flow.
@@ -1270,7 +1978,7 @@ class RecommendationFlowService:
         This method:
         1. Collects data from all sources (Polygon, IEX, Nasdaq, Alpha Vantage)
         2. Normalizes the data into a unified snapshot
-        3. Generates recommendations using the ML engine
+        3. Generates recommendations using the ML engine (concurrently)
         4. Persists recommendations to the database
         5. Cleans up old recommendations (keeps last 10 per symbol)
         
@@ -1286,49 +1994,53 @@ class RecommendationFlowService:
             'errors': [],
         }
         
+        await self._refresh_watchlist()
         logger.info(f"Starting recommendation flow for {len(self.watchlist.symbols)} symbols")
         
-        for idx, symbol in enumerate(self.watchlist.symbols):
-            # Add delay between symbols to avoid rate limiting (except for first symbol)
-            if idx > 0:
-                logger.debug(f"Waiting 5 seconds before processing {symbol} to avoid rate limits...")
-                await asyncio.sleep(5)
-            
+        # Step 1: Collect data from all sources for the whole watchlist at once
+        snapshots = {}
+        if self.data_aggregator:
             try:
-                # Step 1: Collect data from all sources
-                market_snapshot = None
-                if self.data_aggregator:
-                    market_snapshot = await self.data_aggregator.get_snapshot(symbol)
-                    results['data_sources_used'].update(market_snapshot.data_sources)
-                    
-                    if market_snapshot.errors:
-                        for error in market_snapshot.errors:
-                            logger.warning(f"Data source error for {symbol}: {error}")
-                
-                # Step 2: Generate recommendation (engine uses its own data sources + snapshot)
-                recommendation = await self.engine.generate_recommendation(
-                    symbol=symbol,
-                    include_features=True,
+                snapshots = await self.data_aggregator.get_snapshots(
+                    self.watchlist.symbols, now=start_time
                 )
-                
-                # Step 3: Persist to database with enriched data from snapshot
-                await self._persist_recommendation(symbol, recommendation, market_snapshot)
-                
-                results['symbols_processed'] += 1
-                results['recommendations_generated'] += 1
-                
-                # Log with data sources info
-                sources_str = ', '.join(market_snapshot.data_sources) if market_snapshot else 'engine-only'
-                logger.info(f"Generated {recommendation.action} recommendation for {symbol} "
-                           f"(confidence: {recommendation.confidence:.3f}, sources: {sources_str})")
-                
             except Exception as e:
-                error_msg = f"Failed to process {symbol}: {str(e)}"
+                logger.error(f"Failed to collect market data snapshots: {e}")
+        
+        # Steps 2-3: Generate recommendations concurrently (bounded by
+        # symbol_concurrency); rows are bulk-loaded afterwards
+        symbols = self.watchlist.symbols
+        outcomes = await asyncio.gather(
+            *(self._process_symbol(symbol, snapshots.get(symbol)) for symbol in symbols),
+            return_exceptions=True,
+        )
+        
+        records = []
+        for symbol, outcome in zip(symbols, outcomes):
+            market_snapshot = snapshots.get(symbol)
+            if market_snapshot:
+                results['data_sources_used'].update(market_snapshot.data_sources)
+            
+            if isinstance(outcome, Exception):
+                error_msg = f"Failed to process {symbol}: {str(outcome)}"
                 logger.error(error_msg)
                 results['errors'].append(error_msg)
+                continue
+            
+            records.append(outcome)
+            results['symbols_processed'] += 1
+            results['recommendations_generated'] += 1
         
-        # Cleanup old recommendations
-        await self._cleanup_old_recommendations()
+        # Steps 4-5: Persist all recommendations in one COPY and prune old
+        # ones for the same symbols in the same transaction
+        try:
+            saved = await self._persist_recommendations(records)
+            if saved < len(records):
+                results['errors'].append(f"Persisted {saved} of {len(records)} recommendations")
+        except Exception as e:
+            error_msg = f"Failed to persist recommendations: {str(e)}"
+            logger.error(error_msg)
+            results['errors'].append(error_msg)
         
         end_time = datetime.utcnow()
         results['completed_at'] = end_time.isoformat()
@@ -1355,7 +2067,7 @@ class RecommendationFlowService:
         Returns:
             Dict with recommendation data or None if generation fails
         """
-        symbol = symbol.upper().strip()
+        symbol = _normalize_symbol(symbol)
         logger.info(f"Generating on-demand recommendation for {symbol}")
         
         try:
@@ -1371,18 +2083,7 @@ class RecommendationFlowService:
                 include_features=True,
             )
             
-            # Convert recommendation to dict
-            def _maybe_dict(obj):
-                try:
-                    if obj is None:
-                        return None
-                    if hasattr(obj, 'dict'):
-                        return obj.dict()
-                    if hasattr(obj, '__dict__'):
-                        return dict(obj.__dict__)
-                    return obj
-                except Exception:
-                    return None
+            generated_at = recommendation.generated_at or datetime.now(timezone.utc)
 
             return {
                 "symbol": symbol,
@@ -1392,12 +2093,12 @@ class RecommendationFlowService:
                 "normalized_score": recommendation.normalized_score,
                 "score": recommendation.score,
                 # split tracks
-                "news_action": getattr(recommendation, 'news_action', None),
-                "news_confidence": getattr(recommendation, 'news_confidence', None),
-                "news_normalized_score": getattr(recommendation, 'news_normalized_score', None),
-                "technical_action": getattr(recommendation, 'technical_action', None),
-                "technical_confidence": getattr(recommendation, 'technical_confidence', None),
-                "technical_normalized_score": getattr(recommendation, 'technical_normalized_score', None),
+                "news_action": recommendation.news_action,
+                "news_confidence": recommendation.news_confidence,
+                "news_normalized_score": recommendation.news_normalized_score,
+                "technical_action": recommendation.technical_action,
+                "technical_confidence": recommendation.technical_confidence,
+                "technical_normalized_score": recommendation.technical_normalized_score,
                 # raw components
                 "news_sentiment_score": recommendation.news_sentiment_score,
                 "news_momentum_score": recommendation.news_momentum_score,
@@ -1408,28 +2109,123 @@ class RecommendationFlowService:
                 "macd_histogram": recommendation.macd_histogram,
                 "explanation": recommendation.explanation,
                 # Include regime + signal weights so the UI can match StockRecommendations
-                "regime": _maybe_dict(getattr(recommendation, 'regime', None)),
-                "signal_weights": _maybe_dict(getattr(recommendation, 'signal_weights', None)),
-                "generated_at": recommendation.generated_at.isoformat() if recommendation.generated_at else datetime.now(timezone.utc).isoformat(),
+                "regime": _maybe_dict(recommendation.regime),
+                "signal_weights": _maybe_dict(recommendation.signal_weights),
+                "generated_at": generated_at.isoformat(),
             }
             
         except Exception as e:
             logger.error(f"Error generating on-demand recommendation for {symbol}: {e}")
             return None
     
-    async def _persist_recommendation(
-        self, 
-        symbol: str, 
-        recommendation, 
+    async def _process_symbol(
+        self,
+        symbol: str,
+        market_snapshot: Optional[MarketDataSnapshot] = None,
+    ) -> tuple:
+        """
+        Generate a recommendation for one symbol and build its database row.
+        
+        Args:
+            symbol: Stock ticker symbol
+            market_snapshot: Optional aggregated market data for the symbol
+            
+        Returns:
+            Row for stock_recommendations (see RECOMMENDATION_COLUMNS)
+        """
+        if market_snapshot and market_snapshot.errors:
+            for error in market_snapshot.errors:
+                logger.warning(f"Data source error for {symbol}: {error}")
+        
+        async with self._symbol_semaphore:
+            # Engine uses its own data sources + snapshot
+            recommendation = await self.engine.generate_recommendation(
+                symbol=symbol,
+                include_features=True,
+            )
+        
+        # Build the database row with enriched data from snapshot
+        record = self._build_recommendation_record(symbol, recommendation, market_snapshot)
+        
+        # Log with data sources info
+        sources_str = ', '.join(market_snapshot.data_sources) if market_snapshot else 'engine-only'
+        logger.info(f"Generated {recommendation.action} recommendation for {symbol} "
+                   f"(confidence: {recommendation.confidence:.3f}, sources: {sources_str})")
+        return record
+    
+    async def _persist_recommendations(self, records: List[tuple]) -> int:
+        """
+        Bulk-load recommendation rows with a single binary COPY.
+        
+        Old recommendations for the same symbols are pruned in the same
+        transaction, so a run costs one connection checkout and one commit.
+        Recommendations are regenerated every run, so the batch is committed
+        with synchronous_commit off: a crash can lose the last run's rows but
+        the COPY no longer waits on the WAL flush.
+        
+        If the COPY is rejected (e.g. one row violates a constraint), the
+        batch is retried row by row through one prepared INSERT, still in a
+        single transaction with synchronous_commit off. Each row gets its own
+        savepoint, so a single bad row doesn't drop the rest.
+        
+        Args:
+            records: Rows in RECOMMENDATION_COLUMNS order
+            
+        Returns:
+            Number of rows persisted
+        """
+        if not records:
+            return 0
+        
+        symbols = sorted({record[0] for record in records})
+        async with self.db_pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    await conn.execute("SET LOCAL synchronous_commit TO OFF")
+                    await conn.copy_records_to_table(
+                        'stock_recommendations',
+                        records=records,
+                        columns=RECOMMENDATION_COLUMNS,
+                    )
+                    await self._cleanup_old_recommendations(conn, symbols)
+                invalidate_history_cache(symbols)
+                return len(records)
+            except asyncpg.PostgresError as e:
+                logger.warning(f"Bulk insert of {len(records)} recommendations failed, "
+                               f"retrying row by row: {e}")
+            
+            insert = await conn.prepare(INSERT_RECOMMENDATION_SQL)
+            saved = 0
+            async with conn.transaction():
+                await conn.execute("SET LOCAL synchronous_commit TO OFF")
+                for record in records:
+                    try:
+                        # Nested transaction = savepoint: only this row rolls back
+                        async with conn.transaction():
+                            await insert.fetch(*record)
+                        saved += 1
+                    except asyncpg.PostgresError as e:
+                        logger.error(f"Failed to persist recommendation for {record[0]}: {e}")
+                await self._cleanup_old_recommendations(conn, symbols)
+            invalidate_history_cache(symbols)
+            return saved
+    
+    def _build_recommendation_record(
+        self,
+        symbol: str,
+        recommendation,
         market_snapshot: Optional[MarketDataSnapshot] = None
-    ) -> None:
+    ) -> tuple:
         """
-        Persist a recommendation to PostgreSQL with enriched market data.
+        Build a stock_recommendations row enriched with market snapshot data.
         
         Args:
             symbol: Stock ticker symbol
             recommendation: Recommendation object from engine
             market_snapshot: Optional aggregated market data from all sources
+            
+        Returns:
+            Tuple of values in RECOMMENDATION_COLUMNS order
         """
         # Extract component scores from explanation
         explanation = recommendation.explanation
@@ -1476,207 +2272,122 @@ class RecommendationFlowService:
                 # Fallback to SMA50 if SMA20 not available
                 price_vs_sma20 = (market_snapshot.current_price / market_snapshot.sma_50) - 1
         
-        # Use score and normalized_score from the recommendation object
-        raw_score = recommendation.score if recommendation.score is not None else 0.0
-        normalized_score = recommendation.normalized_score if recommendation.normalized_score is not None else (raw_score + 1) / 2
-        
         # Build data sources list - combine engine and aggregator sources
-        data_sources = []
+        data_sources = set()
         if explanation.get('news'):
-            data_sources.append('news_sentiment')
+            data_sources.add('news_sentiment')
         if explanation.get('technical'):
-            data_sources.append('technical_analysis')
+            data_sources.add('technical_analysis')
         
         # Add market data sources from snapshot
-        if market_snapshot and market_snapshot.data_sources:
-            for source in market_snapshot.data_sources:
-                if source not in data_sources:
-                    data_sources.append(source)
+        if market_snapshot:
+            data_sources.update(market_snapshot.data_sources)
+        data_sources = sorted(data_sources)
         
-        # Enrich explanation with snapshot data
-        enriched_explanation = dict(explanation)
+        # Enrich explanation with snapshot data; without a snapshot the
+        # engine's explanation is stored as-is (the row only reads it)
         if market_snapshot:
-            enriched_explanation['market_data'] = {
-                'sources': market_snapshot.data_sources,
-                'current_price': market_snapshot.current_price,
-                'change_percent': market_snapshot.change_percent,
-                'volume': market_snapshot.volume,
-                'market_cap': market_snapshot.market_cap,
-                'pe_ratio': market_snapshot.pe_ratio,
-                'week_52_high': market_snapshot.week_52_high,
-                'week_52_low': market_snapshot.week_52_low,
-                'news_count_24h': market_snapshot.news_count_24h,
-                'news_sentiment': market_snapshot.news_sentiment_avg,
+            enriched_explanation = {
+                **explanation,
+                'market_data': {
+                    'sources': market_snapshot.data_sources,
+                    'current_price': market_snapshot.current_price,
+                    'change_percent': market_snapshot.change_percent,
+                    'volume': market_snapshot.volume,
+                    'market_cap': market_snapshot.market_cap,
+                    'pe_ratio': market_snapshot.pe_ratio,
+                    'week_52_high': market_snapshot.week_52_high,
+                    'week_52_low': market_snapshot.week_52_low,
+                    'news_count_24h': market_snapshot.news_count_24h,
+                    'news_sentiment': market_snapshot.news_sentiment_avg,
+                },
             }
-        
-        # Insert into database
-        query = """
-            INSERT INTO stock_recommendations (
-                symbol,
-                -- legacy combined
-                action, score, normalized_score, confidence,
-                -- split tracks
-                news_action, news_normalized_score, news_confidence,
-                technical_action, technical_normalized_score, technical_confidence,
-                -- features
-                price_at_recommendation,
-                news_sentiment_score, news_momentum_score,
-                technical_trend_score, technical_momentum_score,
-                rsi, macd_histogram, price_vs_sma20,
-                news_sentiment_1d, article_count_24h,
-                explanation, data_sources_used, generated_at
-            ) VALUES (
-                $1,
-                $2, $3, $4, $5,
-                $6, $7, $8,
-                $9, $10, $11,
-                $12,
-                $13, $14,
-                $15, $16,
-                $17, $18, $19,
-                $20, $21,
-                $22, $23, $24
-            )
-        """
-        
-        import json
-        
-        import math
-
-        def _db_float(v, *, min_value=None, max_value=None):
-            if v is None:
-                return None
-            try:
-                n = float(v)
-            except Exception:
-                return None
-            if not math.isfinite(n):
-                return None
-            if min_value is not None:
-                n = max(min_value, n)
-            if max_value is not None:
-                n = min(max_value, n)
-            return n
-
-        async with self.db_pool.acquire() as conn:
-            await conn.execute(
-                query,
-                symbol,
-                # legacy combined
-                recommendation.action,
-                _db_float(raw_score, min_value=-1.0, max_value=1.0),
-                _db_float(normalized_score, min_value=0.0, max_value=1.0),
-                _db_float(recommendation.confidence, min_value=0.0, max_value=1.0),
-                # split tracks
-                getattr(recommendation, 'news_action', None),
-                _db_float(getattr(recommendation, 'news_normalized_score', None), min_value=0.0, max_value=1.0),
-                _db_float(getattr(recommendation, 'news_confidence', None), min_value=0.0, max_value=1.0),
-                getattr(recommendation, 'technical_action', None),
-                _db_float(getattr(recommendation, 'technical_normalized_score', None), min_value=0.0, max_value=1.0),
-                _db_float(getattr(recommendation, 'technical_confidence', None), min_value=0.0, max_value=1.0),
-                # features
-                current_price,
-                news_sentiment_score,
-                news_momentum_score,
-                technical_trend_score,
-                technical_momentum_score,
-                rsi,
-                macd_histogram,
-                price_vs_sma20,
-                news_sentiment_1d,
-                article_count_24h,
-                json.dumps(enriched_explanation),
-                data_sources,
-                recommendation.generated_at,
-            )
+        else:
+            enriched_explanation = explanation
+        
+        features = (
+            current_price,
+            news_sentiment_score,
+            news_momentum_score,
+            technical_trend_score,
+            technical_momentum_score,
+            rsi,
+            macd_histogram,
+            price_vs_sma20,
+            news_sentiment_1d,
+            article_count_24h,
+        )
+        return _recommendation_record(
+            symbol, recommendation, features, enriched_explanation, data_sources
+        )
     
-    async def _cleanup_old_recommendations(self) -> int:
+    async def _cleanup_old_recommendations(self, conn, symbols: List[str]) -> int:
         """
         Remove old recommendations, keeping only last 10 per symbol.
         
+        Args:
+            conn: Connection (usually inside the persist transaction)
+            symbols: Symbols that just received new recommendations
+        
         Returns:
             Number of rows deleted
         """
-        query = """
-            DELETE FROM stock_recommendations
-            WHERE id IN (
-                SELECT id FROM (
-                    SELECT 
-                        id,
-                        ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY generated_at DESC) as rn
-                    FROM stock_recommendations
-                ) ranked
-                WHERE rn > 10
-            )
-        """
+        deleted_count = await conn.fetchval(CLEANUP_RECOMMENDATIONS_SQL, symbols)
         
-        async with self.db_pool.acquire() as conn:
-            result = await conn.execute(query)
-            # Parse the result to get count (format: "DELETE N")
-            deleted_count = int(result.split()[-1]) if result else 0
-            
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old recommendations")
-            
-            return deleted_count
+        if deleted_count > 0:
+            logger.info(f"Cleaned up {deleted_count} old recommendations")
+        
+        return deleted_count
     
     def _get_next_scheduled_run(self) -> tuple:
         """
         Calculate the next scheduled run time.
         
-        The service runs at fixed times: 7:30 AM PST and 12:00 PM PST daily.
+        The service runs at fixed times: 7:30 AM and 12:00 PM Pacific time
+        (PST or PDT, whichever is in effect) daily.
         
         Returns:
             Tuple of (seconds_until_next_run, next_run_time_str, should_run_now)
             - seconds_until_next_run: Number of seconds until the next scheduled run
-            - next_run_time_str: String representation of next run time in PST
+            - next_run_time_str: String representation of next run time in Pacific time
             - should_run_now: True if we're within 1 minute of a scheduled time
         """
-        from datetime import timezone, timedelta
-        
-        # PST is UTC-8, PDT is UTC-7. For simplicity, we'll use PST (UTC-8)
-        pst = timezone(timedelta(hours=-8))
-        now_pst = datetime.now(pst)
-        
-        logger.info(f"Current PST time: {now_pst.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Find the next scheduled run time
-        candidates = []
-        
-        for hour, minute in self.SCHEDULED_RUN_TIMES:
-            # Check today's scheduled time
-            scheduled_today = now_pst.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            time_diff = (scheduled_today - now_pst).total_seconds()
-            
-            if time_diff > -60:  # Within 1 minute past or in the future
-                candidates.append((time_diff, scheduled_today))
-            
-            # Also add tomorrow's time as a candidate
-            scheduled_tomorrow = scheduled_today + timedelta(days=1)
-            time_diff_tomorrow = (scheduled_tomorrow - now_pst).total_seconds()
-            candidates.append((time_diff_tomorrow, scheduled_tomorrow))
-        
-        # Sort by time difference and get the nearest future (or current) run
-        candidates.sort(key=lambda x: x[0])
-        
-        # Find first candidate that's not too far in the past
-        for time_diff, scheduled_time in candidates:
-            if time_diff >= -60:  # Allow up to 1 minute past
-                should_run_now = -60 <= time_diff <= 60  # Within 1 minute window
-                seconds_until = max(0, int(time_diff))
-                time_str = scheduled_time.strftime('%Y-%m-%d %H:%M PST')
-                return (seconds_until, time_str, should_run_now)
+        now_pst = datetime.now(self.SCHEDULE_TIMEZONE)
+        now_ts = now_pst.timestamp()
+        
+        logger.info(f"Current Pacific time: {now_pst.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        
+        # Walk today's then tomorrow's times in order; the first one that is
+        # not more than a minute in the past is the next run
+        for days_ahead in (0, 1):
+            for hour, minute in self.SCHEDULED_RUN_TIMES:
+                scheduled_time = now_pst.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                if days_ahead:
+                    scheduled_time += timedelta(days=days_ahead)
+                # Compare as timestamps: subtracting datetimes that share a
+                # tzinfo ignores a DST change between them
+                time_diff = scheduled_time.timestamp() - now_ts
+                
+                if time_diff >= -60:  # Allow up to 1 minute past
+                    should_run_now = time_diff <= 60  # Within 1 minute window
+                    seconds_until = max(0, int(time_diff))
+                    time_str = scheduled_time.strftime('%Y-%m-%d %H:%M %Z')
+                    return (seconds_until, time_str, should_run_now)
         
         # Fallback (shouldn't happen)
-        return (0, now_pst.strftime('%Y-%m-%d %H:%M PST'), True)
+        return (0, now_pst.strftime('%Y-%m-%d %H:%M %Z'), True)
     
     async def start_scheduled(self):
         """
         Start the scheduled recommendation flow.
         
-        Runs at fixed times daily: 7:30 AM PST and 12:00 PM PST.
+        Runs at fixed times daily: 7:30 AM PST and 12:00 PM PST. Between
+        runs the loop sleeps until the next scheduled time (or until stop()
+        is called) in a single wait.
         """
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._stop_event.clear()
         schedule_times_str = ", ".join([f"{h}:{m:02d} AM PST" if h < 12 else f"{h}:00 PM PST" 
                                         for h, m in self.SCHEDULED_RUN_TIMES])
         logger.info(f"Starting scheduled recommendation flow")
@@ -1693,7 +2404,7 @@ class RecommendationFlowService:
                     await self.run_once()
                     
                     # After running, wait a bit to avoid re-triggering within the same minute
-                    await asyncio.sleep(90)
+                    await self._wait_for_stop(90)
                 else:
                     # Wait until the next scheduled time
                     wait_hours = seconds_until / 3600
@@ -1704,28 +2415,13 @@ class RecommendationFlowService:
                     else:
                         logger.info(f"Next scheduled run: {next_run_str} ({wait_minutes:.0f} minutes from now)")
                     
-                    # Sleep until next scheduled time using wall-clock time
-                    start_time = time.time()
-                    target_time = start_time + seconds_until
-                    heartbeat_interval = 1800  # Log every 30 minutes
-                    
-                    while time.time() < target_time and self._running:
-                        remaining_seconds = target_time - time.time()
-                        if remaining_seconds <= 0:
-                            break
-                        
-                        sleep_chunk = min(heartbeat_interval, remaining_seconds)
-                        await asyncio.sleep(sleep_chunk)
-                        
-                        # Log heartbeat
-                        remaining_seconds = target_time - time.time()
-                        if remaining_seconds > 60 and self._running:
-                            remaining_hours = remaining_seconds / 3600
-                            remaining_minutes = remaining_seconds / 60
-                            if remaining_hours >= 1:
-                                logger.info(f"Heartbeat: {remaining_hours:.1f} hours until next scheduled run ({next_run_str})")
-                            else:
-                                logger.info(f"Heartbeat: {remaining_minutes:.0f} minutes until next scheduled run ({next_run_str})")
+                    heartbeat = asyncio.create_task(
+                        self._log_heartbeats(time.time() + seconds_until, next_run_str)
+                    )
+                    try:
+                        await self._wait_for_stop(seconds_until)
+                    finally:
+                        heartbeat.cancel()
                 
             except asyncio.CancelledError:
                 logger.info("Scheduled flow cancelled")
@@ -1733,14 +2429,100 @@ class RecommendationFlowService:
             except Exception as e:
                 logger.error(f"Error in scheduled flow: {e}", exc_info=True)
                 # Wait a bit before retrying on error
-                await asyncio.sleep(60)
+                await self._wait_for_stop(60)
+    
+    async def _wait_for_stop(self, seconds: float) -> bool:
+        """
+        Sleep for up to `seconds`, returning early if stop() is called.
+        
+        Returns:
+            True if the service was stopped during the wait
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    async def _log_heartbeats(self, target_time: float, next_run_str: str, interval: float = 1800):
+        """Log the time left until the next scheduled run every `interval` seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            remaining_seconds = target_time - time.time()
+            if remaining_seconds <= 60:
+                return
+            remaining_hours = remaining_seconds / 3600
+            remaining_minutes = remaining_seconds / 60
+            if remaining_hours >= 1:
+                logger.info(f"Heartbeat: {remaining_hours:.1f} hours until next scheduled run ({next_run_str})")
+            else:
+                logger.info(f"Heartbeat: {remaining_minutes:.0f} minutes until next scheduled run ({next_run_str})")
     
     def stop(self):
         """Stop the scheduled flow."""
         self._running = False
+        if self._loop is not None and not self._loop.is_closed():
+            # May be called from a signal handler: wake the loop through its
+            # self-pipe rather than setting the event directly
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         logger.info("Stopping scheduled recommendation flow")
 
 
+# NUMERIC history columns returned as floats: (API key, column)
+HISTORY_FLOAT_FIELDS = (
+    ('score', 'score'),
+    ('normalizedScore', 'normalized_score'),
+    ('confidence', 'confidence'),
+    ('priceAtRecommendation', 'price_at_recommendation'),
+    ('newsSentimentScore', 'news_sentiment_score'),
+    ('newsMomentumScore', 'news_momentum_score'),
+    ('technicalTrendScore', 'technical_trend_score'),
+    ('technicalMomentumScore', 'technical_momentum_score'),
+    ('rsi', 'rsi'),
+    ('macdHistogram', 'macd_histogram'),
+    ('priceVsSma20', 'price_vs_sma20'),
+    ('newsSentiment1d', 'news_sentiment_1d'),
+)
+
+
+def _history_entry(row) -> Dict[str, Any]:
+    """Convert a RECOMMENDATION_HISTORY_SQL row to its camelCase API form."""
+    entry = {
+        'id': str(row['id']),
+        'symbol': row['symbol'],
+        'action': row['action'],
+    }
+    for key, column in HISTORY_FLOAT_FIELDS:
+        value = row[column]
+        # 0.0 is a real score; only NULL maps to None
+        entry[key] = float(value) if value is not None else None
+    entry['articleCount24h'] = row['article_count_24h']
+    entry['explanation'] = row['explanation']
+    entry['dataSourcesUsed'] = row['data_sources_used']
+    entry['generatedAt'] = row['generated_at'].isoformat() if row['generated_at'] else None
+    entry['createdAt'] = row['created_at'].isoformat() if row['created_at'] else None
+    return entry
+
+
+# Recent get_recommendations_history results keyed by (symbol, limit).
+# Recommendations only change when a run persists new rows, which drops the
+# affected symbols here; the TTL bounds staleness from writers in other
+# processes.
+HISTORY_CACHE_TTL_SECONDS = 300
+HISTORY_CACHE_SIZE = 1024
+_history_cache: OrderedDict = OrderedDict()
+
+
+def invalidate_history_cache(symbols: Optional[List[str]] = None):
+    """Drop cached history for the given symbols (all symbols if None)."""
+    if symbols is None:
+        _history_cache.clear()
+        return
+    stale = set(symbols)
+    for key in [k for k in _history_cache if k[0] in stale]:
+        del _history_cache[key]
+
+
 async def get_recommendations_history(
     db_pool: asyncpg.Pool,
     symbol: str,
@@ -1755,52 +2537,26 @@ async def get_recommendations_history(
         limit: Maximum number of recommendations to return (default: 10)
         
     Returns:
-        List of recommendation dictionaries
-    """
-    query = """
-        SELECT 
-            id, symbol, action, score, normalized_score, confidence,
-            price_at_recommendation,
-            news_sentiment_score, news_momentum_score,
-            technical_trend_score, technical_momentum_score,
-            rsi, macd_histogram, price_vs_sma20,
-            news_sentiment_1d, article_count_24h,
-            explanation, data_sources_used, generated_at, created_at
-        FROM stock_recommendations
-        WHERE symbol = $1
-        ORDER BY generated_at DESC
-        LIMIT $2
+        List of recommendation dictionaries (shared with the history cache;
+        don't mutate them)
     """
+    key = (_normalize_symbol(symbol), limit)
+    cached = _history_cache.get(key)
+    if cached is not None:
+        expires_at, results = cached
+        if expires_at > time.monotonic():
+            _history_cache.move_to_end(key)
+            return results
+        del _history_cache[key]
     
     async with db_pool.acquire() as conn:
-        rows = await conn.fetch(query, symbol.upper(), limit)
-        
-        results = []
-        for row in rows:
-            results.append({
-                'id': str(row['id']),
-                'symbol': row['symbol'],
-                'action': row['action'],
-                'score': float(row['score']) if row['score'] else None,
-                'normalizedScore': float(row['normalized_score']) if row['normalized_score'] else None,
-                'confidence': float(row['confidence']) if row['confidence'] else None,
-                'priceAtRecommendation': float(row['price_at_recommendation']) if row['price_at_recommendation'] else None,
-                'newsSentimentScore': float(row['news_sentiment_score']) if row['news_sentiment_score'] is not None else None,
-                'newsMomentumScore': float(row['news_momentum_score']) if row['news_momentum_score'] is not None else None,
-                'technicalTrendScore': float(row['technical_trend_score']) if row['technical_trend_score'] is not None else None,
-                'technicalMomentumScore': float(row['technical_momentum_score']) if row['technical_momentum_score'] is not None else None,
-                'rsi': float(row['rsi']) if row['rsi'] else None,
-                'macdHistogram': float(row['macd_histogram']) if row['macd_histogram'] else None,
-                'priceVsSma20': float(row['price_vs_sma20']) if row['price_vs_sma20'] else None,
-                'newsSentiment1d': float(row['news_sentiment_1d']) if row['news_sentiment_1d'] else None,
-                'articleCount24h': row['article_count_24h'],
-                'explanation': row['explanation'],
-                'dataSourcesUsed': row['data_sources_used'],
-                'generatedAt': row['generated_at'].isoformat() if row['generated_at'] else None,
-                'createdAt': row['created_at'].isoformat() if row['created_at'] else None,
-            })
-        
-        return results
+        rows = await conn.fetch(RECOMMENDATION_HISTORY_SQL, key[0], limit)
+    
+    results = [_history_entry(row) for row in rows]
+    _history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL_SECONDS, results)
+    while len(_history_cache) > HISTORY_CACHE_SIZE:
+        _history_cache.popitem(last=False)
+    return results
 
 
 # =============================================================================
@@ -1814,6 +2570,12 @@ async def main(run_once: bool = False):
     Configuration via environment variables:
     - DATABASE_URL: PostgreSQL connection string
     - WATCHLIST_SYMBOLS: Comma-separated list of stock symbols
+    - RECOMMENDATION_CONCURRENCY: Symbols processed concurrently per run (default: 8)
+    - RECOMMENDATION_DB_POOL_SIZE: Maximum pooled Postgres connections (default: 16)
+    - RECOMMENDATION_API_SYMBOL_TIMEOUT: Seconds per symbol in batch API calls (default: 8)
+    - RECOMMENDATION_ACCESS_LOG: Set to '1' to log every API request (default: off)
+    - RECOMMENDATION_API_WORKERS: API processes for --api-only (default: CPU count)
+    - RECOMMENDATION_API_UDS: Serve the API on this UNIX socket instead of port 8000
     - CLICKHOUSE_HOST: ClickHouse server for news features
     - REDIS_URL: Redis for caching
     - ENABLE_TRADING_HOURS_CHECK: Set to 'false' to run 24/7 (default: 'true')
@@ -1858,34 +2620,85 @@ async def main(run_once: bool = False):
         await service.close()
 
 
-async def run_http_server():
-    """Run the HTTP server for on-demand recommendation generation."""
-    from fastapi import FastAPI, BackgroundTasks
-    from fastapi.responses import JSONResponse
-    import uvicorn
+# =============================================================================
+# HTTP API
+# =============================================================================
+# Both entry points (run_http_server and run_with_api) serve these; the
+# production container runs run_with_api().
+
+class JSONBytesResponse(JSONResponse):
+    """
+    JSON response encoded with dumps_json_bytes (orjson when available).
     
-    app = FastAPI(title="Recommendation Engine API")
-    service = RecommendationFlowService()
+    The default response class of both API apps. Handlers that return it
+    directly skip FastAPI's jsonable_encoder pass over the payload, and
+    NaN/Infinity are written as null instead of failing.
+    """
     
-    @app.on_event("startup")
-    async def startup():
-        await service.initialize()
-        logger.info("HTTP API ready for on-demand recommendation generation")
+    def render(self, content: Any) -> bytes:
+        return dumps_json_bytes(content)
+
+
+_ERROR_BODY_TEMPLATE = b'{"error":%s}'
+
+
+def _error_response(message: str, status_code: int) -> Response:
+    """
+    ``{"error": message}`` response formatted into a prebuilt byte template.
     
-    @app.on_event("shutdown")
-    async def shutdown():
-        service.stop()
-        await service.close()
+    Hot failure paths (an upstream outage fails every request) skip building
+    a dict and running it through the response encoder.
+    """
+    return Response(
+        content=_ERROR_BODY_TEMPLATE % dumps_json_bytes(message),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+# (epoch second, formatted) for _utc_now_iso
+_utc_now_iso_cache = (0, '')
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time (naive ISO 8601) at second resolution for API responses.
     
-    @app.get("/health")
-    async def health():
-        return {"status": "healthy"}
+    The string is only re-formatted when the second changes, so responses
+    served in the same second share it.
+    """
+    global _utc_now_iso_cache
+    second = int(time.time())
+    if second != _utc_now_iso_cache[0]:
+        formatted = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+        _utc_now_iso_cache = (second, formatted)
+    return _utc_now_iso_cache[1]
+
+
+def _new_api_app() -> FastAPI:
+    """
+    Create an API app with the settings both servers share.
     
+    Responses of 1 KB or more are gzipped for clients that accept it;
+    batch and regime payloads are repetitive JSON and shrink several-fold.
+    """
+    app = FastAPI(title="Recommendation Engine API", default_response_class=JSONBytesResponse)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    return app
+
+
+def _add_api_routes(app, service: RecommendationFlowService):
+    """Register the endpoints shared by both API servers on an app."""
+    @app.get("/pool/stats")
+    async def pool_stats():
+        """Postgres connection pool usage."""
+        return service.pool_stats()
+
     @app.post("/generate")
     async def generate_recommendations(background_tasks: BackgroundTasks):
         """Trigger recommendation generation in the background."""
         background_tasks.add_task(service.run_once)
-        return JSONResponse(
+        return JSONBytesResponse(
             content={"success": True, "message": "Recommendation generation started"},
             status_code=202
         )
@@ -1899,109 +2712,252 @@ async def run_http_server():
           - symbols: list[string]
           - include_features: bool (optional)
           - save_to_db: bool (optional)
+          - stream: bool (optional) - stream entries as they complete
 
         Generates recommendations for the given symbols and optionally persists
         them into Postgres (stock_recommendations).
+
+        By default the response lists one entry per requested symbol, in
+        request order, once all are generated. With stream=true the same JSON
+        object is streamed instead: the recommendations array holds one entry
+        per distinct symbol in completion order (cache hits first), so the
+        first entries arrive without waiting for the slowest symbol.
         """
         user_id = request.get("user_id", "system")
         symbols = request.get("symbols") or []
         include_features = bool(request.get("include_features", False))
         save_to_db = bool(request.get("save_to_db", False))
+        stream = bool(request.get("stream", False))
 
         if not isinstance(symbols, list) or len(symbols) == 0:
-            return JSONResponse(content={"error": "symbols must be a non-empty list"}, status_code=400)
+            return _error_response("symbols must be a non-empty list", 400)
 
         # Ensure service is initialized
         if service.engine is None:
             await service.initialize()
 
-        recs = []
+        symbols = [_normalize_symbol(s) for s in symbols]
+        # Repeated tickers are generated (and saved) once, then fanned back out
+        unique = list(dict.fromkeys(symbols))
+        cache_kind = "recommendation-features" if include_features else "recommendation"
+        # Saving needs fresh recommendations, so only read-only calls use the
+        # cache; hits for the whole batch come back in one round trip
+        cached = {} if save_to_db else await service.get_cached_responses(cache_kind, unique)
+        misses = [sym for sym in unique if sym not in cached]
 
-        async def _save_to_db(symbol: str, rec_obj) -> None:
-            if not service.db_pool:
-                return
-            # Insert minimal record required by schema
-            await service.db_pool.execute(
-                """
-                INSERT INTO stock_recommendations (
-                    symbol,
-                    -- legacy combined
-                    action, score, normalized_score, confidence,
-                    -- split tracks
-                    news_action, news_normalized_score, news_confidence,
-                    technical_action, technical_normalized_score, technical_confidence,
-                    -- features
-                    price_at_recommendation,
-                    news_sentiment_score, news_momentum_score,
-                    technical_trend_score, technical_momentum_score,
-                    rsi, macd_histogram, price_vs_sma20,
-                    news_sentiment_1d, article_count_24h,
-                    explanation, data_sources_used, generated_at
-                ) VALUES (
-                    $1,
-                    $2,$3,$4,$5,
-                    $6,$7,$8,
-                    $9,$10,$11,
-                    $12,
-                    $13,$14,
-                    $15,$16,
-                    $17,$18,$19,
-                    $20,$21,
-                    $22,$23,NOW()
-                )
-                """,
-                symbol,
-                rec_obj.action,
-                float(rec_obj.score) if rec_obj.score is not None else 0.0,
-                float(rec_obj.normalized_score) if rec_obj.normalized_score is not None else 0.5,
-                float(rec_obj.confidence) if rec_obj.confidence is not None else 0.0,
-                getattr(rec_obj, 'news_action', None),
-                getattr(rec_obj, 'news_normalized_score', None),
-                getattr(rec_obj, 'news_confidence', None),
-                getattr(rec_obj, 'technical_action', None),
-                getattr(rec_obj, 'technical_normalized_score', None),
-                getattr(rec_obj, 'technical_confidence', None),
-                rec_obj.price_at_recommendation,
-                rec_obj.news_sentiment_score,
-                rec_obj.news_momentum_score,
-                rec_obj.technical_trend_score,
-                rec_obj.technical_momentum_score,
-                rec_obj.rsi,
-                rec_obj.macd_histogram,
-                rec_obj.price_vs_sma20,
-                rec_obj.news_sentiment_1d,
-                rec_obj.article_count_24h or 0,
-                json.dumps(rec_obj.explanation) if rec_obj.explanation else None,
-                ['news', 'technical'],
+        async def _one(sym: str) -> tuple:
+            """Generate one symbol; returns (response entry, row to persist or None, generated)."""
+            try:
+                async with service._symbol_semaphore:
+                    rec_obj = await asyncio.wait_for(
+                        service.engine.generate_recommendation(symbol=sym, include_features=include_features),
+                        timeout=service.api_symbol_timeout,
+                    )
+            except asyncio.TimeoutError:
+                error = f"timed out after {service.api_symbol_timeout:g}s"
+            except Exception as e:
+                error = str(e)
+            else:
+                row = _api_recommendation_record(sym, rec_obj) if save_to_db else None
+                return _maybe_dict(rec_obj), row, True
+            logger.error(f"Batch generation failed for {sym}: {error}")
+            return {
+                "symbol": sym,
+                "action": "HOLD",
+                "confidence": 0.0,
+                "score": 0.0,
+                "normalized_score": 0.5,
+                "explanation": {"summary": f"Unable to analyze {sym}", "error": error},
+            }, None, False
+
+        async def _finish(generated: Dict[str, tuple]):
+            """Cache the generated entries and persist their rows in one batch."""
+            # Fallback HOLD entries are not cached
+            await service.cache_responses(
+                cache_kind, {sym: rec for sym, (rec, _, ok) in generated.items() if ok}
             )
+            pending_rows = [row for _, row, _ in generated.values() if row is not None]
+            if pending_rows and service.db_pool:
+                try:
+                    await service._persist_recommendations(pending_rows)
+                except Exception as e:
+                    logger.warning(f"Failed to persist {len(pending_rows)} recommendations (batch): {e}")
 
-        for s in symbols:
-            sym = str(s).upper().strip()
+        async def _stream():
+            """Yield the response object piecewise as entries complete."""
+            async def _keyed(sym: str) -> tuple:
+                return sym, await _one(sym)
+
+            tasks = [asyncio.ensure_future(_keyed(sym)) for sym in misses]
+            generated = {}
             try:
-                rec_obj = await service.engine.generate_recommendation(symbol=sym, include_features=include_features)
-                if save_to_db:
-                    try:
-                        await _save_to_db(sym, rec_obj)
-                    except Exception as e:
-                        logger.warning(f"Failed to persist {sym} (batch): {e}")
+                yield b'{"user_id":' + dumps_json_bytes(user_id) + b',"recommendations":['
+                separator = b''
+                for rec in cached.values():
+                    yield separator + dumps_json_bytes(rec)
+                    separator = b','
+                for next_done in asyncio.as_completed(tasks):
+                    sym, outcome = await next_done
+                    generated[sym] = outcome
+                    yield separator + dumps_json_bytes(outcome[0])
+                    separator = b','
+                await _finish(generated)
+                yield b'],"generated_at":' + dumps_json_bytes(_utc_now_iso()) + b'}'
+            finally:
+                # Client went away mid-stream: stop generating for it
+                for task in tasks:
+                    task.cancel()
 
-                recs.append(rec_obj.dict() if hasattr(rec_obj, 'dict') else rec_obj)
-            except Exception as e:
-                logger.error(f"Batch generation failed for {sym}: {e}")
-                recs.append({
-                    "symbol": sym,
-                    "action": "HOLD",
-                    "confidence": 0.0,
-                    "score": 0.0,
-                    "normalized_score": 0.5,
-                    "explanation": {"summary": f"Unable to analyze {sym}", "error": str(e)},
-                })
+        if stream:
+            return StreamingResponse(_stream(), media_type="application/json")
 
-        return {
+        # Misses are generated concurrently (bounded like scheduled runs)
+        outcomes = await asyncio.gather(*(_one(sym) for sym in misses))
+        generated = dict(zip(misses, outcomes))
+        # Rows are written in one batch after every symbol is generated
+        await _finish(generated)
+
+        # Response stays in request order, one entry per requested symbol
+        recs = [cached[sym] if sym in cached else generated[sym][0] for sym in symbols]
+        return JSONBytesResponse({
             "user_id": user_id,
             "recommendations": recs,
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+            "generated_at": _utc_now_iso(),
+        })
+
+
+# Recent regime classifications keyed by symbol. UI refreshes poll /regime
+# in bursts; within the TTL they skip the feature fetch and classify even
+# without Redis, and concurrent misses for a symbol share one in-flight
+# classification.
+REGIME_CACHE_TTL_SECONDS = 20
+REGIME_CACHE_SIZE = 1024
+# Lets browsers and proxies reuse a /regime response for the same window
+REGIME_RESPONSE_HEADERS = {"Cache-Control": f"public, max-age={REGIME_CACHE_TTL_SECONDS}"}
+_regime_cache: OrderedDict = OrderedDict()
+_regime_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _regime_error_response(symbol: str, error: Exception) -> Response:
+    """
+    Error response for a failed /regime request.
+    
+    Unreachable or slow upstreams (engine init, feature stores) are 503 so
+    callers retry later; invalid input is 400; anything else is a 500.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError, aiohttp.ClientError, asyncpg.PostgresConnectionError)):
+        logger.warning(f"Regime data unavailable for {symbol}: {error}")
+        status_code = 503
+    elif isinstance(error, ValueError):
+        logger.warning(f"Invalid regime request for {symbol}: {error}")
+        status_code = 400
+    else:
+        logger.error(f"Failed to get regime for {symbol}: {error}")
+        status_code = 500
+    return _error_response(str(error), status_code)
+
+
+async def _classify_regime(symbol: str) -> Optional[tuple]:
+    """
+    Classify a symbol's market regime with the shared engine.
+    
+    Each server formats the result into its own /regime response.
+    
+    Returns:
+        Tuple of (regime_state, signal_weights, regime_explanation), or None
+        if regime classification is not available
+    """
+    cached = _regime_cache.get(symbol)
+    if cached is not None:
+        expires_at, result = cached
+        if expires_at > time.monotonic():
+            _regime_cache.move_to_end(symbol)
+            return result
+        del _regime_cache[symbol]
+    
+    task = _regime_inflight.get(symbol)
+    if task is None:
+        task = asyncio.ensure_future(_classify_regime_uncached(symbol))
+        _regime_inflight[symbol] = task
+        task.add_done_callback(lambda _: _regime_inflight.pop(symbol, None))
+    # Shielded so one caller disconnecting doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+
+async def _classify_regime_uncached(symbol: str) -> Optional[tuple]:
+    """Fetch features and classify; caches successful classifications."""
+    engine = await get_engine()
+    if not engine.regime_classifier:
+        return None
+    
+    news_features, technical_features = await engine.fetch_features(symbol)
+    regime_state = engine.regime_classifier.classify(
+        symbol=symbol,
+        technical_features=technical_features,
+        news_features=news_features,
+    )
+    regime_weights = engine.regime_classifier.get_signal_weights(regime_state)
+    regime_explanation = engine.regime_classifier.get_regime_explanation(regime_state)
+    
+    result = (regime_state, regime_weights, regime_explanation)
+    _regime_cache[symbol] = (time.monotonic() + REGIME_CACHE_TTL_SECONDS, result)
+    while len(_regime_cache) > REGIME_CACHE_SIZE:
+        _regime_cache.popitem(last=False)
+    return result
+
+
+def _uvicorn_options() -> Dict[str, Any]:
+    """
+    uvicorn settings shared by the API entry points.
+    
+    Per-request access logging is off; set RECOMMENDATION_ACCESS_LOG=1 to
+    re-enable it. With RECOMMENDATION_API_UDS set, the API listens on that
+    UNIX socket instead of TCP port 8000, for a reverse proxy on the same host.
+    """
+    uds = os.getenv('RECOMMENDATION_API_UDS')
+    bind = {"uds": uds} if uds else {"host": "0.0.0.0", "port": 8000}
+    return {
+        **bind,
+        # Explicit so worker processes never fall back to the stock loop
+        # or the pure-Python HTTP parser when the C versions are installed
+        "loop": "uvloop" if uvloop is not None else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "log_level": "info",
+        "access_log": os.getenv('RECOMMENDATION_ACCESS_LOG', '0') == '1',
+    }
+
+
+async def _serve_api(app):
+    """
+    Serve an API app with uvicorn on port 8000 (or RECOMMENDATION_API_UDS)
+    in the running event loop.
+    
+    The loop is already uvloop when installed (see _run_event_loop).
+    """
+    config = uvicorn.Config(app, **_uvicorn_options())
+    await uvicorn.Server(config).serve()
+
+
+async def run_http_server():
+    """Run the HTTP server for on-demand recommendation generation."""
+    app = _new_api_app()
+    service = RecommendationFlowService()
+    
+    @app.on_event("startup")
+    async def startup():
+        await service.initialize()
+        logger.info("HTTP API ready for on-demand recommendation generation")
+    
+    @app.on_event("shutdown")
+    async def shutdown():
+        service.stop()
+        await service.close()
+    
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+    
+    _add_api_routes(app, service)
     
     @app.post("/generate-sync")
     async def generate_recommendations_sync():
@@ -2011,7 +2967,7 @@ async def run_http_server():
             return {"success": True, "result": result}
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
-            return JSONResponse(
+            return JSONBytesResponse(
                 content={"success": False, "error": str(e)},
                 status_code=500
             )
@@ -2032,15 +2988,19 @@ async def run_http_server():
         Returns:
             Recommendation object with all scores and explanation
         """
-        symbol = request.get("symbol", "").upper().strip()
+        symbol = _normalize_symbol(request.get("symbol") or "")
         company_name = request.get("company_name", symbol)
         save_to_db = request.get("save_to_db", False)
         
         if not symbol:
-            return JSONResponse(
-                content={"error": "symbol is required"},
-                status_code=400
-            )
+            return _error_response("symbol is required", 400)
+        
+        # A save needs a fresh recommendation, so it bypasses the cache
+        if not save_to_db:
+            cached = await service.get_cached_response("single-detail", symbol)
+            if cached is not None:
+                cached["company_name"] = company_name
+                return JSONBytesResponse(cached)
         
         logger.info(f"On-demand recommendation requested for {symbol}")
         
@@ -2049,10 +3009,7 @@ async def run_http_server():
             recommendation = await service.generate_single_recommendation(symbol)
             
             if recommendation is None:
-                return JSONResponse(
-                    content={"error": f"Failed to generate recommendation for {symbol}"},
-                    status_code=500
-                )
+                return _error_response(f"Failed to generate recommendation for {symbol}", 500)
             
             # Optionally save to database
             if save_to_db and service.db_pool:
@@ -2063,7 +3020,7 @@ async def run_http_server():
                     logger.warning(f"Failed to save recommendation to database: {e}")
             
             # Return the recommendation
-            return {
+            response = {
                 "symbol": symbol,
                 "company_name": company_name,
                 "action": recommendation.get("action", "HOLD"),
@@ -2080,13 +3037,12 @@ async def run_http_server():
                 "explanation": recommendation.get("explanation"),
                 "generated_at": recommendation.get("generated_at", datetime.now(timezone.utc).isoformat()),
             }
+            await service.cache_response("single-detail", symbol, response)
+            return JSONBytesResponse(response)
             
         except Exception as e:
             logger.error(f"Error generating recommendation for {symbol}: {e}")
-            return JSONResponse(
-                content={"error": str(e)},
-                status_code=500
-            )
+            return _error_response(str(e), 500)
     
     @app.get("/regime/{symbol}")
     async def get_regime(symbol: str):
@@ -2104,41 +3060,17 @@ async def run_http_server():
         - Position sizing recommendations
         - Stop-loss recommendations
         """
-        symbol = symbol.upper()
+        symbol = _normalize_symbol(symbol)
+        
+        cached = await service.get_cached_response("regime-detail", symbol)
+        if cached is not None:
+            return JSONBytesResponse(cached, headers=REGIME_RESPONSE_HEADERS)
         
         try:
-            engine = await get_engine()
-            
-            # Get features for regime classification
-            news_features = None
-            if engine.news_provider:
-                try:
-                    news_features = await engine.news_provider.get_features_single(symbol)
-                except Exception as e:
-                    logger.warning(f"Failed to get news features for {symbol}: {e}")
-            
-            technical_features = None
-            if engine.technical_provider:
-                try:
-                    technical_features = await engine.technical_provider.get_features(symbol)
-                except Exception as e:
-                    logger.warning(f"Failed to get technical features for {symbol}: {e}")
-            
-            # Classify regime
-            if not engine.regime_classifier:
-                return JSONResponse(
-                    content={"error": "Regime classification not available"},
-                    status_code=503
-                )
-            
-            regime_state = engine.regime_classifier.classify(
-                symbol=symbol,
-                technical_features=technical_features,
-                news_features=news_features,
-            )
-            
-            regime_weights = engine.regime_classifier.get_signal_weights(regime_state)
-            regime_explanation = engine.regime_classifier.get_regime_explanation(regime_state)
+            classified = await _classify_regime(symbol)
+            if classified is None:
+                return _error_response("Regime classification not available", 503)
+            regime_state, regime_weights, regime_explanation = classified
             
             # Build response
             regime_info = {
@@ -2189,302 +3121,216 @@ async def run_http_server():
                     "reasoning": sl.reasoning,
                 }
             
-            return {
+            response = {
                 "symbol": symbol,
                 "regime": regime_info,
                 "signal_weights": signal_weights_info,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_now_iso(),
             }
+            await service.cache_response("regime-detail", symbol, response)
+            return JSONBytesResponse(response, headers=REGIME_RESPONSE_HEADERS)
             
         except Exception as e:
-            logger.error(f"Failed to get regime for {symbol}: {e}")
-            return JSONResponse(
-                content={"error": str(e)},
-                status_code=500
-            )
+            return _regime_error_response(symbol, e)
     
-    config = uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")
-    server = uvicorn.Server(config)
-    await server.serve()
+    await _serve_api(app)
 
 
-async def run_with_api():
-    """Run both the scheduled service and HTTP API concurrently."""
-    service = RecommendationFlowService()
+def build_api_app(service: RecommendationFlowService) -> FastAPI:
+    """
+    Build the production API app (served by run_with_api and create_app).
     
-    try:
-        await service.initialize()
+    The caller owns the service's lifecycle (initialize/close).
+    """
+    app = _new_api_app()
+    
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "running": service._running}
+    
+    _add_api_routes(app, service)
+    
+    @app.post("/generate/single")
+    async def generate_single(request: dict):
+        """Generate on-demand recommendation for a single stock."""
+        symbol = _normalize_symbol(request.get("symbol") or "")
+        company_name = request.get("company_name", symbol)
         
-        # Run HTTP API in background task
-        from fastapi import FastAPI, BackgroundTasks
-        from fastapi.responses import JSONResponse
-        import uvicorn
-        
-        app = FastAPI(title="Recommendation Engine API")
-        
-        @app.get("/health")
-        async def health():
-            return {"status": "healthy", "running": service._running}
-        
-        @app.post("/generate")
-        async def generate_recommendations(background_tasks: BackgroundTasks):
-            """Trigger recommendation generation in the background."""
-            background_tasks.add_task(service.run_once)
-            return JSONResponse(
-                content={"success": True, "message": "Recommendation generation started"},
-                status_code=202
-            )
-
-        @app.post("/recommendations")
-        async def generate_recommendations_sync(request: dict):
-            """Synchronous batch recommendation generation (used by api-gateway).
-
-            See run_http_server() version for docs. This is duplicated here because
-            the production container runs run_with_api().
-            """
-            user_id = request.get("user_id", "system")
-            symbols = request.get("symbols") or []
-            include_features = bool(request.get("include_features", False))
-            save_to_db = bool(request.get("save_to_db", False))
-
-            if not isinstance(symbols, list) or len(symbols) == 0:
-                return JSONResponse(content={"error": "symbols must be a non-empty list"}, status_code=400)
-
-            if service.engine is None:
-                await service.initialize()
-
-            recs = []
-
-            async def _save_to_db(symbol: str, rec_obj) -> None:
-                if not service.db_pool:
-                    return
-                await service.db_pool.execute(
-                    """
-                    INSERT INTO stock_recommendations (
-                        symbol,
-                        -- legacy combined
-                        action, score, normalized_score, confidence,
-                        -- split tracks
-                        news_action, news_normalized_score, news_confidence,
-                        technical_action, technical_normalized_score, technical_confidence,
-                        -- features
-                        price_at_recommendation,
-                        news_sentiment_score, news_momentum_score,
-                        technical_trend_score, technical_momentum_score,
-                        rsi, macd_histogram, price_vs_sma20,
-                        news_sentiment_1d, article_count_24h,
-                        explanation, data_sources_used, generated_at
-                    ) VALUES (
-                        $1,
-                        $2,$3,$4,$5,
-                        $6,$7,$8,
-                        $9,$10,$11,
-                        $12,
-                        $13,$14,
-                        $15,$16,
-                        $17,$18,$19,
-                        $20,$21,
-                        $22,$23,NOW()
-                    )
-                    """,
-                    symbol,
-                    rec_obj.action,
-                    float(rec_obj.score) if rec_obj.score is not None else 0.0,
-                    float(rec_obj.normalized_score) if rec_obj.normalized_score is not None else 0.5,
-                    float(rec_obj.confidence) if rec_obj.confidence is not None else 0.0,
-                    getattr(rec_obj, 'news_action', None),
-                    getattr(rec_obj, 'news_normalized_score', None),
-                    getattr(rec_obj, 'news_confidence', None),
-                    getattr(rec_obj, 'technical_action', None),
-                    getattr(rec_obj, 'technical_normalized_score', None),
-                    getattr(rec_obj, 'technical_confidence', None),
-                    rec_obj.price_at_recommendation,
-                    rec_obj.news_sentiment_score,
-                    rec_obj.news_momentum_score,
-                    rec_obj.technical_trend_score,
-                    rec_obj.technical_momentum_score,
-                    rec_obj.rsi,
-                    rec_obj.macd_histogram,
-                    rec_obj.price_vs_sma20,
-                    rec_obj.news_sentiment_1d,
-                    rec_obj.article_count_24h or 0,
-                    json.dumps(rec_obj.explanation) if rec_obj.explanation else None,
-                    ['news', 'technical'],
-                )
-
-            for s in symbols:
-                sym = str(s).upper().strip()
-                try:
-                    rec_obj = await service.engine.generate_recommendation(symbol=sym, include_features=include_features)
-                    if save_to_db:
-                        try:
-                            await _save_to_db(sym, rec_obj)
-                        except Exception as e:
-                            logger.warning(f"Failed to persist {sym} (batch): {e}")
-
-                    recs.append(rec_obj.dict() if hasattr(rec_obj, 'dict') else rec_obj)
-                except Exception as e:
-                    logger.error(f"Batch generation failed for {sym}: {e}")
-                    recs.append({
-                        "symbol": sym,
-                        "action": "HOLD",
-                        "confidence": 0.0,
-                        "score": 0.0,
-                        "normalized_score": 0.5,
-                        "explanation": {"summary": f"Unable to analyze {sym}", "error": str(e)},
-                    })
-
-            return {
-                "user_id": user_id,
-                "recommendations": recs,
-                "generated_at": datetime.utcnow().isoformat(),
-            }
+        if not symbol:
+            return _error_response("symbol is required", 400)
         
-        def _sanitize_for_json(obj):
-            """Recursively replace NaN/Inf with None so JSON serialization never fails."""
-            import math
-            if obj is None:
-                return None
-            if isinstance(obj, float):
-                return obj if math.isfinite(obj) else None
-            if isinstance(obj, dict):
-                return {k: _sanitize_for_json(v) for k, v in obj.items()}
-            if isinstance(obj, (list, tuple)):
-                return [_sanitize_for_json(v) for v in obj]
-            return obj
-
-        @app.post("/generate/single")
-        async def generate_single(request: dict):
-            """Generate on-demand recommendation for a single stock."""
-            symbol = request.get("symbol", "").upper().strip()
-            company_name = request.get("company_name", symbol)
+        cached = await service.get_cached_response("single", symbol)
+        if cached is not None:
+            cached["company_name"] = company_name
+            return JSONBytesResponse(cached)
+        
+        logger.info(f"On-demand recommendation requested for {symbol}")
+        
+        try:
+            recommendation = await service.generate_single_recommendation(symbol)
             
-            if not symbol:
-                return JSONResponse(content={"error": "symbol is required"}, status_code=400)
+            if recommendation is None:
+                return _error_response(f"Failed to generate recommendation for {symbol}", 500)
+            
+            payload = {
+                "symbol": symbol,
+                "company_name": company_name,
+                "action": recommendation.get("action", "HOLD"),
+                "confidence": recommendation.get("confidence", 0),
+                "normalized_score": recommendation.get("normalized_score", 0),
+                # Include raw score for parity with stored recommendations
+                "score": recommendation.get("score"),
+                "news_sentiment_score": recommendation.get("news_sentiment_score"),
+                "news_momentum_score": recommendation.get("news_momentum_score"),
+                "technical_trend_score": recommendation.get("technical_trend_score"),
+                # Do not default to 0 if missing; allow null to show "-" in UI
+                "technical_momentum_score": recommendation.get("technical_momentum_score"),
+                "price_at_recommendation": recommendation.get("price_at_recommendation"),
+                "explanation": recommendation.get("explanation"),
+                # Pass through regime + signal weights if available
+                "regime": recommendation.get("regime"),
+                "signal_weights": recommendation.get("signal_weights"),
+                "generated_at": recommendation.get("generated_at"),
+            }
+            # NaN/Inf become null when the payload is encoded
+            await service.cache_response("single", symbol, payload)
+            return JSONBytesResponse(payload)
+        except Exception as e:
+            logger.error(f"Error generating recommendation for {symbol}: {e}")
+            return _error_response(str(e), 500)
+    
+    @app.get("/regime/{symbol}")
+    async def get_regime_api(symbol: str):
+        """Get regime classification for a symbol."""
+        symbol = _normalize_symbol(symbol)
+        cached = await service.get_cached_response("regime", symbol)
+        if cached is not None:
+            return JSONBytesResponse(cached, headers=REGIME_RESPONSE_HEADERS)
+        try:
+            classified = await _classify_regime(symbol)
+            if classified is None:
+                return _error_response("Regime not available", 503)
+            regime_state, regime_weights, regime_explanation = classified
             
-            logger.info(f"On-demand recommendation requested for {symbol}")
+            response = {
+                "symbol": symbol,
+                "regime": {
+                    "label": regime_explanation.get("regime_label"),
+                    "risk_level": regime_explanation.get("risk_level"),
+                    "volatility": regime_state.volatility.value,
+                    "trend": regime_state.trend.value,
+                    "liquidity": regime_state.liquidity.value,
+                    "information": regime_state.information.value,
+                    "risk_score": round(regime_state.regime_risk_score, 3),
+                    "warnings": regime_explanation.get("warnings", []),
+                },
+                "signal_weights": {
+                    "news_sentiment": round(regime_weights.news_sentiment, 4),
+                    "news_momentum": round(regime_weights.news_momentum, 4),
+                    "technical_trend": round(regime_weights.technical_trend, 4),
+                    "technical_momentum": round(regime_weights.technical_momentum, 4),
+                    "confidence_multiplier": round(regime_weights.confidence_multiplier, 3),
+                },
+                "timestamp": _utc_now_iso(),
+            }
             
-            try:
-                recommendation = await service.generate_single_recommendation(symbol)
-                
-                if recommendation is None:
-                    return JSONResponse(
-                        content={"error": f"Failed to generate recommendation for {symbol}"},
-                        status_code=500
-                    )
-                
-                payload = {
-                    "symbol": symbol,
-                    "company_name": company_name,
-                    "action": recommendation.get("action", "HOLD"),
-                    "confidence": recommendation.get("confidence", 0),
-                    "normalized_score": recommendation.get("normalized_score", 0),
-                    # Include raw score for parity with stored recommendations
-                    "score": recommendation.get("score"),
-                    "news_sentiment_score": recommendation.get("news_sentiment_score"),
-                    "news_momentum_score": recommendation.get("news_momentum_score"),
-                    "technical_trend_score": recommendation.get("technical_trend_score"),
-                    # Do not default to 0 if missing; allow null to show "-" in UI
-                    "technical_momentum_score": recommendation.get("technical_momentum_score"),
-                    "price_at_recommendation": recommendation.get("price_at_recommendation"),
-                    "explanation": recommendation.get("explanation"),
-                    # Pass through regime + signal weights if available
-                    "regime": recommendation.get("regime"),
-                    "signal_weights": recommendation.get("signal_weights"),
-                    "generated_at": recommendation.get("generated_at"),
+            if regime_weights.position_sizing:
+                ps = regime_weights.position_sizing
+                response["position_sizing"] = {
+                    "size_multiplier": round(ps.size_multiplier, 3),
+                    "max_position_percent": round(ps.max_position_percent, 2),
+                    "scale_in_entries": ps.scale_in_entries,
+                    "reasoning": ps.reasoning,
                 }
-                return _sanitize_for_json(payload)
-            except Exception as e:
-                logger.error(f"Error generating recommendation for {symbol}: {e}")
-                return JSONResponse(content={"error": str(e)}, status_code=500)
-        
-        @app.get("/regime/{symbol}")
-        async def get_regime_api(symbol: str):
-            """Get regime classification for a symbol."""
-            symbol = symbol.upper()
-            try:
-                engine = await get_engine()
-                
-                news_features = None
-                if engine.news_provider:
-                    try:
-                        news_features = await engine.news_provider.get_features_single(symbol)
-                    except Exception as e:
-                        logger.warning(f"Failed to get news features for {symbol}: {e}")
-                
-                technical_features = None
-                if engine.technical_provider:
-                    try:
-                        technical_features = await engine.technical_provider.get_features(symbol)
-                    except Exception as e:
-                        logger.warning(f"Failed to get technical features for {symbol}: {e}")
-                
-                if not engine.regime_classifier:
-                    return JSONResponse(content={"error": "Regime not available"}, status_code=503)
-                
-                regime_state = engine.regime_classifier.classify(symbol, technical_features, news_features)
-                regime_weights = engine.regime_classifier.get_signal_weights(regime_state)
-                regime_explanation = engine.regime_classifier.get_regime_explanation(regime_state)
-                
-                response = {
-                    "symbol": symbol,
-                    "regime": {
-                        "label": regime_explanation.get("regime_label"),
-                        "risk_level": regime_explanation.get("risk_level"),
-                        "volatility": regime_state.volatility.value,
-                        "trend": regime_state.trend.value,
-                        "liquidity": regime_state.liquidity.value,
-                        "information": regime_state.information.value,
-                        "risk_score": round(regime_state.regime_risk_score, 3),
-                        "warnings": regime_explanation.get("warnings", []),
-                    },
-                    "signal_weights": {
-                        "news_sentiment": round(regime_weights.news_sentiment, 4),
-                        "news_momentum": round(regime_weights.news_momentum, 4),
-                        "technical_trend": round(regime_weights.technical_trend, 4),
-                        "technical_momentum": round(regime_weights.technical_momentum, 4),
-                        "confidence_multiplier": round(regime_weights.confidence_multiplier, 3),
-                    },
-                    "timestamp": datetime.utcnow().isoformat(),
+            
+            if regime_weights.stop_loss:
+                sl = regime_weights.stop_loss
+                response["stop_loss"] = {
+                    "atr_multiplier": round(sl.atr_multiplier, 2),
+                    "percent_from_entry": round(sl.percent_from_entry, 2),
+                    "use_trailing_stop": sl.use_trailing_stop,
+                    "risk_reward_ratio": round(sl.risk_reward_ratio, 2),
+                    "reasoning": sl.reasoning,
                 }
-                
-                if regime_weights.position_sizing:
-                    ps = regime_weights.position_sizing
-                    response["position_sizing"] = {
-                        "size_multiplier": round(ps.size_multiplier, 3),
-                        "max_position_percent": round(ps.max_position_percent, 2),
-                        "scale_in_entries": ps.scale_in_entries,
-                        "reasoning": ps.reasoning,
-                    }
-                
-                if regime_weights.stop_loss:
-                    sl = regime_weights.stop_loss
-                    response["stop_loss"] = {
-                        "atr_multiplier": round(sl.atr_multiplier, 2),
-                        "percent_from_entry": round(sl.percent_from_entry, 2),
-                        "use_trailing_stop": sl.use_trailing_stop,
-                        "risk_reward_ratio": round(sl.risk_reward_ratio, 2),
-                        "reasoning": sl.reasoning,
-                    }
-                
-                return response
-            except Exception as e:
-                logger.error(f"Failed to get regime for {symbol}: {e}")
-                return JSONResponse(content={"error": str(e)}, status_code=500)
+            
+            await service.cache_response("regime", symbol, response)
+            return JSONBytesResponse(response, headers=REGIME_RESPONSE_HEADERS)
+        except Exception as e:
+            return _regime_error_response(symbol, e)
+    
+    return app
+
+
+def create_app() -> FastAPI:
+    """
+    App factory for API-only worker processes (see run_api_workers).
+    
+    Each worker builds its own service, so every process has its own
+    Postgres pool and Redis client; they share state only through Postgres
+    and Redis. Workers skip the watchlist load and its LISTEN connection,
+    which only the --scheduler process needs.
+    """
+    service = RecommendationFlowService()
+    app = build_api_app(service)
+    
+    @app.on_event("startup")
+    async def startup():
+        await service.initialize(scheduler=False)
+        logger.info("API worker ready")
+    
+    @app.on_event("shutdown")
+    async def shutdown():
+        service.stop()
+        await service.close()
+    
+    return app
+
+
+def run_api_workers(workers: int):
+    """
+    Serve the API from several worker processes, without the scheduler.
+    
+    Run the scheduler as its own single process alongside (--scheduler)
+    so scheduled runs are not duplicated per worker. Each worker opens up
+    to RECOMMENDATION_DB_POOL_SIZE Postgres connections.
+    
+    Under gunicorn the same factory serves with
+    ``gunicorn 'recommendation_flow:create_app()' -k uvicorn.workers.UvicornWorker``.
+    
+    Args:
+        workers: Number of uvicorn worker processes
+    """
+    uvicorn.run(
+        "recommendation_flow:create_app",
+        factory=True,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        workers=workers,
+        **_uvicorn_options(),
+    )
+
+
+async def run_with_api():
+    """Run both the scheduled service and HTTP API concurrently."""
+    service = RecommendationFlowService()
+    
+    try:
+        await service.initialize()
         
-        # Run both the scheduler and HTTP server
-        async def run_scheduler():
-            await service.start_scheduled()
+        # Run HTTP API in background task
+        app = build_api_app(service)
         
         async def run_api():
-            config = uvicorn.Config(app, host="0.0.0.0", port=8000, log_level="info")
-            server = uvicorn.Server(config)
-            await server.serve()
+            try:
+                await _serve_api(app)
+            finally:
+                # uvicorn exited (e.g. on SIGTERM): end the scheduler too
+                service.stop()
         
-        await asyncio.gather(
-            run_scheduler(),
-            run_api(),
-        )
+        # Run both the scheduler and HTTP server; if either fails the
+        # TaskGroup cancels the other instead of leaving it running alone
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(service.start_scheduled(), name="scheduler")
+            tg.create_task(run_api(), name="api")
         
     except KeyboardInterrupt:
         logger.info("Received interrupt signal")
@@ -2493,17 +3339,43 @@ async def run_with_api():
         await service.close()
 
 
+def _run_event_loop(coro):
+    """Run a coroutine to completion on uvloop when installed, else asyncio."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    logger.info("Using uvloop event loop")
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='Recommendation Flow Service')
     parser.add_argument('--once', action='store_true', help='Run once and exit (default: run on schedule)')
     parser.add_argument('--api', action='store_true', help='Run with HTTP API for on-demand generation')
+    parser.add_argument('--api-only', action='store_true',
+                        help='Serve only the HTTP API from --workers processes (run --scheduler separately)')
+    parser.add_argument('--scheduler', action='store_true',
+                        help='Run only the scheduled generation, as a single process (the default)')
+    parser.add_argument('--workers', type=int,
+                        default=int(os.getenv('RECOMMENDATION_API_WORKERS', '0')) or os.cpu_count() or 1,
+                        help='API worker processes for --api-only (default: RECOMMENDATION_API_WORKERS or CPU count)')
+    parser.add_argument('--uds', default=os.getenv('RECOMMENDATION_API_UDS'),
+                        help='Serve the API on this UNIX socket instead of port 8000 (default: RECOMMENDATION_API_UDS)')
     args = parser.parse_args()
     
-    if args.once:
-        asyncio.run(main(run_once=True))
+    if args.uds:
+        # Read by _uvicorn_options in every API mode
+        os.environ['RECOMMENDATION_API_UDS'] = args.uds
+    
+    if args.api_only:
+        # uvicorn owns the worker processes and their event loops
+        run_api_workers(args.workers)
+    elif args.once:
+        _run_event_loop(main(run_once=True))
     elif args.api:
-        asyncio.run(run_with_api())
+        _run_event_loop(run_with_api())
     else:
-        asyncio.run(main(run_once=False))
+        # --scheduler, or no mode flag
+        _run_event_loop(main(run_once=False))
@@ -294,9 +294,18 @@ class TechnicalFeatureProvider:
                 logger.warning(f"Redis not available: {e}")
                 self.redis_client = None
         
-        # Initialize HTTP session
+        # One pooled HTTP session for every price fetch; idle connections are
+        # kept for a minute so repeated symbols skip the TLS handshake
         import aiohttp
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
         
         self._initialized = True
     
@@ -353,8 +362,6 @@ class TechnicalFeatureProvider:
     
     async def _calculate_features(self, symbol: str) -> TechnicalFeatures:
         """Fetch price data and calculate all technical features."""
-        import numpy as np
-        
         # Fetch historical data (6 months for SMA 200)
         df = await self._fetch_price_data(symbol, period="6mo", interval="1d")
         
@@ -362,6 +369,15 @@ class TechnicalFeatureProvider:
             logger.warning(f"Insufficient price data for {symbol}")
             return TechnicalFeatures.empty(symbol)
         
+        # The indicator math is CPU-bound pandas work; run it in the default
+        # executor so concurrent symbols and API requests keep being served
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._compute_features, symbol, df)
+    
+    def _compute_features(self, symbol: str, df) -> TechnicalFeatures:
+        """Calculate all technical features from a daily OHLCV frame."""
+        import numpy as np
+        
         # Current price
         current_price = float(df["close"].iloc[-1])
         
@@ -497,20 +513,21 @@ class TechnicalFeatureProvider:
     
     def _calculate_obv(self, df) -> 'pd.Series':
         """Calculate On-Balance Volume."""
+        import numpy as np
         import pandas as pd
         
-        obv = pd.Series(index=df.index, dtype=float)
-        obv.iloc[0] = 0
+        close = df["close"].to_numpy(dtype=float)
+        volume = df["volume"].to_numpy(dtype=float)
         
-        for i in range(1, len(df)):
-            if df["close"].iloc[i] > df["close"].iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] + df["volume"].iloc[i]
-            elif df["close"].iloc[i] < df["close"].iloc[i-1]:
-                obv.iloc[i] = obv.iloc[i-1] - df["volume"].iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i-1]
+        # +volume on up days, -volume on down days, unchanged otherwise
+        # (including NaN closes); OBV is the running sum from 0
+        steps = np.zeros(len(close))
+        up = close[1:] > close[:-1]
+        down = close[1:] < close[:-1]
+        steps[1:][up] = volume[1:][up]
+        steps[1:][down] = -volume[1:][down]
         
-        return obv
+        return pd.Series(np.cumsum(steps), index=df.index)
     
     async def _fetch_price_data(
         self,
@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.mark.asyncio
+async def test_news_and_technical_features_are_fetched_concurrently():
+    import main as main
+
+    both_started = asyncio.Event()
+    started = []
+
+    async def fetch(kind):
+        started.append(kind)
+        if len(started) == 2:
+            both_started.set()
+        # Only completes if the other fetch is already in flight
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return kind
+
+    class NewsProvider:
+        async def get_features_single(self, symbol):
+            return await fetch("news")
+
+    class TechnicalProvider:
+        async def get_features(self, symbol):
+            await fetch("technical")
+            raise RuntimeError("quote API down")
+
+    engine = object.__new__(main.RecommendationEngine)
+    engine.news_provider = NewsProvider()
+    engine.technical_provider = TechnicalProvider()
+
+    news, technical = await engine.fetch_features("AAPL")
+
+    assert news == "news"
+    assert technical is None
+
+    engine.news_provider = None
+    assert await engine.fetch_features("AAPL") == (None, None)
+
+
+def test_obv_accumulates_signed_volume():
+    import pandas as pd
+    from technical_features import TechnicalFeatureProvider
+
+    df = pd.DataFrame({
+        "close": [10.0, 11.0, 11.0, 9.0, float("nan"), 12.0],
+        "volume": [100.0, 200.0, 300.0, 50.0, 70.0, 10.0],
+    })
+
+    obv = TechnicalFeatureProvider(redis_url=None)._calculate_obv(df)
+
+    assert obv.tolist() == [0.0, 200.0, 200.0, 150.0, 150.0, 150.0]
+    assert obv.index.equals(df.index)
+
+
+@pytest.mark.asyncio
+async def test_indicator_math_runs_off_the_event_loop_thread():
+    import threading
+    from technical_features import TechnicalFeatureProvider
+
+    provider = TechnicalFeatureProvider(redis_url=None)
+    frame = object()
+    threads = []
+
+    async def fetch_price_data(symbol, period, interval):
+        return [frame] * 60
+
+    def compute_features(symbol, df):
+        threads.append(threading.current_thread())
+        return symbol
+
+    provider._fetch_price_data = fetch_price_data
+    provider._compute_features = compute_features
+
+    assert await provider._calculate_features("AAPL") == "AAPL"
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_regime_endpoint_serializes_the_validated_model(monkeypatch):
+    from fastapi.testclient import TestClient
+    import main as main
+    from regime_classifier import RegimeClassifier
+
+    class Engine:
+        regime_classifier = RegimeClassifier()
+
+        async def fetch_features(self, symbol):
+            return None, None
+
+    async def get_engine():
+        return Engine()
+
+    monkeypatch.setattr(main, "get_engine", get_engine)
+
+    response = TestClient(main.app).get("/regime/aapl")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["symbol"] == "AAPL"
+    assert set(body) == {"symbol", "regime", "signal_weights", "timestamp"}
+
+
+def test_prewarm_access_counts_decay_between_refreshes():
+    from news_features import NewsFeatureProvider
+
+    provider = NewsFeatureProvider(redis_url=None)
+    provider._access_counter.update(["AAPL"] * 8 + ["MSFT"])
+
+    provider._decay_access_counts()
+    assert provider._access_counter == {"AAPL": 4}
+
+    for _ in range(3):
+        provider._decay_access_counts()
+    assert not provider._access_counter
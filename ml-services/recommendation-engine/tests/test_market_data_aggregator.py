@@ -0,0 +1,459 @@
+import pytest
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+# Match the existing test style: add src to path for imports.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Connectors are replaced with in-memory fakes, so no network access is needed.
+
+
+def _article(title, url, **metadata):
+    return SimpleNamespace(title=title, url=url, metadata=metadata, symbols=[])
+
+
+class FakeNewsConnector:
+    def __init__(self, articles):
+        self.articles = articles
+        self.calls = []
+
+    async def fetch_news(self, symbols=None, since=None, limit=None):
+        self.calls.append({'symbols': symbols, 'since': since, 'limit': limit})
+        return self.articles
+
+
+class SlowConnector:
+    async def fetch_news(self, **kwargs):
+        await asyncio.sleep(10)
+
+
+class FailingConnector:
+    async def fetch_news(self, **kwargs):
+        raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_merges_sources_and_records_errors():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator.alpha_vantage = FakeNewsConnector([
+        _article("a", "https://x/a", sentiment_score=0.4),
+        _article("b", "https://x/b", sentiment_score=0.2),
+    ])
+    aggregator.finnhub = FailingConnector()
+
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert snapshot.data_sources == ['alpha_vantage']
+    assert snapshot.news_count_24h == 2
+    # VADER-normalized sum of the article scores
+    assert snapshot.news_sentiment_avg == pytest.approx(0.6 / (0.6 ** 2 + 15.0) ** 0.5)
+    assert len(snapshot.errors) == 1 and snapshot.errors[0].startswith('finnhub')
+
+    call = aggregator.alpha_vantage.calls[0]
+    assert call['symbols'] == ['AAPL']
+    assert call['limit'] == 20
+    assert call['since'] is not None
+
+
+@pytest.mark.asyncio
+async def test_social_sentiment_blends_into_news_sentiment():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator.stocktwits = FakeNewsConnector([
+        _article("m1", "https://st/1", sentiment='bullish'),
+        _article("m2", "https://st/2", sentiment='bullish'),
+        _article("m3", "https://st/3", sentiment='bearish'),
+        _article("m4", "https://st/4"),
+    ])
+
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert snapshot.data_sources == ['stocktwits']
+    assert snapshot.news_sentiment_avg == pytest.approx(1 / 3)
+    assert len(snapshot.news_articles) == 4
+    assert [a['sentiment'] for a in snapshot.news_articles] == ['bullish', 'bullish', 'bearish', None]
+
+
+@pytest.mark.asyncio
+async def test_get_snapshots_batches_list_capable_sources():
+    import recommendation_flow as rf
+
+    a1 = _article("a1", "https://x/1")
+    a1.symbols = ['AAPL']
+    a2 = _article("a2", "https://x/2")
+    a2.symbols = ['MSFT', 'AAPL']
+
+    symbols = ['AAPL', 'MSFT', 'NVDA', 'AMZN', 'META', 'TSLA']
+    aggregator = rf.MarketDataAggregator()
+    aggregator.newsapi = FakeNewsConnector([a1, a2])
+    aggregator.finnhub = FakeNewsConnector([_article("f", "https://f/1")])
+
+    snapshots = await aggregator.get_snapshots(symbols)
+
+    # NewsAPI is called once per bucket of 5 symbols, Finnhub once per symbol
+    assert [c['symbols'] for c in aggregator.newsapi.calls] == [symbols[:5], symbols[5:]]
+    assert aggregator.newsapi.calls[0]['limit'] == 100
+    assert len(aggregator.finnhub.calls) == len(symbols)
+
+    assert snapshots['AAPL'].news_count_24h == 3
+    assert snapshots['MSFT'].news_count_24h == 2
+    assert snapshots['NVDA'].news_count_24h == 1
+    assert sorted(snapshots['MSFT'].data_sources) == ['finnhub', 'newsapi']
+    assert snapshots['NVDA'].data_sources == ['finnhub']
+
+
+@pytest.mark.asyncio
+async def test_fetch_windows_are_anchored_to_the_run_start():
+    from datetime import datetime, timedelta
+    import recommendation_flow as rf
+
+    run_started = datetime(2024, 3, 1, 14, 30)
+    aggregator = rf.MarketDataAggregator()
+    aggregator.finnhub = FakeNewsConnector([])
+    aggregator.stocktwits = FakeNewsConnector([])
+
+    snapshots = await aggregator.get_snapshots(['AAPL', 'MSFT'], now=run_started)
+
+    assert {s.timestamp for s in snapshots.values()} == {run_started}
+    assert {c['since'] for c in aggregator.finnhub.calls} == {run_started - timedelta(days=7)}
+    assert {c['since'] for c in aggregator.stocktwits.calls} == {run_started - timedelta(days=1)}
+
+
+@pytest.mark.asyncio
+async def test_news_fetches_are_cached_until_invalidated():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator.finnhub = FakeNewsConnector([_article("f", "https://f/1")])
+
+    await aggregator.get_snapshot("AAPL")
+    await aggregator.get_snapshot("AAPL")
+    assert len(aggregator.finnhub.calls) == 1
+
+    await aggregator.invalidate_news_cache("AAPL")
+    await aggregator.get_snapshot("AAPL")
+    assert len(aggregator.finnhub.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_news_results_are_not_cached():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator.finnhub = FakeNewsConnector([])
+
+    await aggregator.get_snapshot("AAPL")
+    await aggregator.get_snapshot("AAPL")
+
+    assert len(aggregator.finnhub.calls) == 2
+    assert len(aggregator._news_cache) == 0
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    async def scan_iter(self, match=None):
+        import fnmatch
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_news_cache_is_shared_through_redis():
+    from datetime import datetime
+    import recommendation_flow as rf
+
+    if rf.NewsArticle is None:
+        pytest.skip("streaming connectors not importable")
+    from streaming.connectors import NewsSource
+
+    article = rf.NewsArticle(
+        title="Apple beats estimates", summary="", url="https://x/1",
+        source=NewsSource.UNKNOWN, source_name="StockTwits",
+        published_at=datetime(2024, 1, 2), symbols=['AAPL'],
+        metadata={'sentiment': 'bullish'},
+    )
+    redis = FakeRedis()
+
+    first = rf.MarketDataAggregator()
+    first._redis = redis
+    first.stocktwits = FakeNewsConnector([article])
+    await first.get_snapshot("AAPL")
+
+    (key, ttl), = redis.ttls.items()
+    assert key.startswith('rec:news:stocktwits:messages:AAPL:')
+    assert ttl == 1800
+
+    # A fresh process is served from Redis without calling the connector
+    second = rf.MarketDataAggregator()
+    second._redis = redis
+    second.stocktwits = FakeNewsConnector([])
+    snapshot = await second.get_snapshot("AAPL")
+
+    assert second.stocktwits.calls == []
+    assert snapshot.social_sentiment == 1.0
+
+    await second.invalidate_news_cache("AAPL")
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_sources_are_cut_off_at_the_fetch_budget():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator(fetch_budget_seconds=0.1)
+    aggregator.finnhub = FakeNewsConnector([_article("f", "https://f/1")])
+    aggregator.newsapi = SlowConnector()
+
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert snapshot.data_sources == ['finnhub']
+    assert snapshot.errors == ['newsapi: timed out after 0.1s']
+    assert not snapshot.is_ready_for_decision()
+
+    snapshot.current_price = 100.0
+    assert snapshot.is_ready_for_decision()
+
+
+@pytest.mark.asyncio
+async def test_budget_applies_per_fetch_not_per_watchlist():
+    import recommendation_flow as rf
+
+    class QueuedConnector:
+        # Alpha Vantage has one bulkhead slot: these fetches run one at a time
+        def __init__(self):
+            self.calls = 0
+
+        async def fetch_news(self, symbols=None, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return [_article(symbols[0], f"https://av/{symbols[0]}")]
+
+    symbols = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOG", "META"]
+    aggregator = rf.MarketDataAggregator(fetch_budget_seconds=0.1)
+    aggregator.alpha_vantage = QueuedConnector()
+
+    # 6 x 50ms queued behind one slot is well past the 0.1s budget
+    snapshots = await aggregator.get_snapshots(symbols)
+
+    assert aggregator.alpha_vantage.calls == len(symbols)
+    for symbol in symbols:
+        assert snapshots[symbol].data_sources == ['alpha_vantage']
+        assert snapshots[symbol].errors == []
+
+
+@pytest.mark.asyncio
+async def test_republished_news_is_counted_once():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator.finnhub = FakeNewsConnector([
+        _article("Apple beats estimates", "https://www.reuters.com/a?src=finnhub"),
+        _article("Apple beats estimates", "https://www.reuters.com/a?src=finnhub"),
+    ])
+    aggregator.newsapi = FakeNewsConnector([
+        _article("APPLE beats estimates!", "https://www.reuters.com/a"),
+        _article("Apple beats estimates", "https://www.cnbc.com/a"),
+    ])
+
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert snapshot.news_count_24h == 2
+    assert len(snapshot.news_articles) == 2
+    assert 'seen_news' not in snapshot.to_dict()
+
+
+def test_listed_urls_are_not_repeated_across_sources():
+    import recommendation_flow as rf
+
+    snapshot = rf.MarketDataSnapshot(symbol="AAPL")
+    aggregator = rf.MarketDataAggregator()
+    filing = _article("10-K", "https://sec.gov/a", filing_type="10-K")
+    updated = _article("10-K (amended)", "https://sec.gov/a", filing_type="10-K/A")
+
+    aggregator._merge_data(snapshot, {'filings': [filing, updated]}, 'sec_edgar')
+    aggregator._merge_data(snapshot, {'filings': [filing]}, 'sec_edgar')
+
+    assert snapshot.news_articles == [
+        {'source': 'sec_edgar', 'title': '10-K', 'url': 'https://sec.gov/a', 'filing_type': '10-K'},
+    ]
+    assert 'seen_urls' not in snapshot.to_dict()
+
+
+class FakePriceConnector:
+    async def get_snapshot(self, symbol):
+        return {'day': {'c': 100.0}}
+
+    async def get_previous_close(self, symbol):
+        return None
+
+    async def fetch_news(self, **kwargs):
+        return [_article("p", "https://p/1")]
+
+
+@pytest.mark.asyncio
+async def test_pending_fetches_are_cancelled_once_quorum_is_reached():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator(quorum_sources=2, quorum_news_sources=2)
+    aggregator.polygon = FakePriceConnector()
+    aggregator.finnhub = FakeNewsConnector([_article("f", "https://f/1")])
+    aggregator.newsapi = SlowConnector()
+
+    started = asyncio.get_running_loop().time()
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert sorted(snapshot.data_sources) == ['finnhub', 'polygon']
+    assert snapshot.current_price == 100.0
+    assert snapshot.errors == []
+
+
+@pytest.mark.asyncio
+async def test_sources_without_substitutes_still_land_after_quorum():
+    import recommendation_flow as rf
+
+    class SlowNasdaqConnector:
+        async def get_stock_prices(self, symbol=None, **kwargs):
+            await asyncio.sleep(0.1)
+            return [{'date': '2024-01-02', 'close': 101.0}, {'date': '2024-01-01', 'close': 99.0}]
+
+    aggregator = rf.MarketDataAggregator(quorum_sources=2, quorum_news_sources=2)
+    aggregator.polygon = FakePriceConnector()
+    aggregator.finnhub = FakeNewsConnector([_article("f", "https://f/1")])
+    aggregator.newsapi = SlowConnector()
+    aggregator.nasdaq = SlowNasdaqConnector()
+
+    started = asyncio.get_running_loop().time()
+    snapshot = await aggregator.get_snapshot("AAPL")
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert sorted(snapshot.data_sources) == ['finnhub', 'nasdaq', 'polygon']
+    assert [close for _, close in snapshot.price_history] == [99.0, 101.0]
+    assert snapshot.errors == []
+
+
+def test_snapshot_uses_slots():
+    import recommendation_flow as rf
+
+    snapshot = rf.MarketDataSnapshot(symbol="AAPL")
+
+    assert not hasattr(snapshot, '__dict__')
+    with pytest.raises(AttributeError):
+        snapshot.unknown_field = 1
+    assert snapshot.to_dict()['symbol'] == "AAPL"
+
+
+def test_snapshot_columns_pack_numeric_fields():
+    import numpy as np
+    import recommendation_flow as rf
+
+    table = rf.snapshot_columns([
+        rf.MarketDataSnapshot(symbol="AAPL", current_price=190.5, volume=1000),
+        rf.MarketDataSnapshot(symbol="MSFT", rsi=0.4),
+    ])
+
+    assert table.shape == (2,)
+    assert table['current_price'][0] == 190.5
+    assert np.isnan(table['current_price'][1])
+    assert table['volume'][0] == 1000
+    assert table['rsi'][1] == pytest.approx(0.4)
+
+
+def test_incremental_indicators_match_full_recompute():
+    import numpy as np
+    import recommendation_flow as rf
+
+    rng = np.random.default_rng(7)
+    closes = (100 + rng.normal(0, 1, 40).cumsum()).tolist()
+    history = [(f"2024-01-{i + 1:02d}", c) for i, c in enumerate(closes)]
+
+    aggregator = rf.MarketDataAggregator()
+    aggregator._update_indicators("AAPL", history[:30])
+    incremental = aggregator._update_indicators("AAPL", history[10:34])
+    fresh = rf.IndicatorState.seed(history[:34])
+
+    assert incremental is aggregator._indicator_state["AAPL"]
+    assert incremental.sma_20 == pytest.approx(np.mean(closes[14:34]))
+    assert incremental.sma_20 == pytest.approx(fresh.sma_20)
+    assert incremental.rsi == pytest.approx(fresh.rsi)
+    assert 0.0 <= incremental.rsi <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_repeated_failures_open_the_circuit():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator(news_cache_ttl=0)
+    aggregator.finnhub = FailingConnector()
+
+    for _ in range(rf.MarketDataAggregator.CIRCUIT_BREAKER_THRESHOLD):
+        snapshot = await aggregator.get_snapshot("AAPL")
+        assert snapshot.errors == ['finnhub: boom']
+
+    # Source is now skipped entirely until the cooldown expires
+    snapshot = await aggregator.get_snapshot("AAPL")
+    assert snapshot.errors == []
+    assert aggregator._circuit_open('finnhub')
+
+
+def test_news_sentiment_is_weighted_by_article_count():
+    import recommendation_flow as rf
+
+    aggregator = rf.MarketDataAggregator()
+    merged = []
+    for order in ([(0.8, 3), (-0.4, 1)], [(-0.4, 1), (0.8, 3)]):
+        snapshot = rf.MarketDataSnapshot(symbol="AAPL")
+        for score, count in order:
+            aggregator._merge_data(
+                snapshot, {'avg_sentiment': score, 'sentiment_count': count}, 'alpha_vantage'
+            )
+        aggregator._calculate_derived_metrics(snapshot)
+        merged.append(snapshot.news_sentiment_avg)
+
+    assert merged[0] == pytest.approx((0.8 * 3 - 0.4) / 4)
+    assert merged[0] == pytest.approx(merged[1])
+
+
+def test_field_mergers_fill_only_missing_fields():
+    import recommendation_flow as rf
+
+    snapshot = rf.MarketDataSnapshot(symbol="AAPL", current_price=101.0)
+    aggregator = rf.MarketDataAggregator()
+
+    aggregator._merge_data(snapshot, {
+        'snapshot': {'day': {'c': 99.0, 'o': 98.0, 'v': 1000}, 'todays_change_perc': 1.5,
+                     'prev_day': {'c': 97.5}},
+    }, 'polygon')
+    aggregator._merge_data(snapshot, {
+        'prices': [{'date': '2024-01-02', 'close': 96.0, 'high': 99.5},
+                   {'date': '2024-01-01', 'close': 95.0}],
+    }, 'nasdaq')
+
+    assert snapshot.current_price == 101.0
+    assert snapshot.open_price == 98.0
+    assert snapshot.volume == 1000
+    assert snapshot.change_percent == 1.5
+    assert snapshot.previous_close == 97.5
+    assert snapshot.close_price == 96.0
+    assert snapshot.high_price == 99.5
+    assert snapshot.price_history == [('2024-01-01', 95.0), ('2024-01-02', 96.0)]
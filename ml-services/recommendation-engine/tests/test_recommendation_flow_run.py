@@ -0,0 +1,214 @@
+import pytest
+import sys
+import os
+import asyncio
+from types import SimpleNamespace
+
+# Match the existing test style: add src to path for imports.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class FakeEngine:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+
+    async def generate_recommendation(self, symbol, include_features=False):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.05)
+            if symbol in self.fail:
+                raise RuntimeError("engine down")
+            return SimpleNamespace(symbol=symbol, action='HOLD', confidence=0.5)
+        finally:
+            self.active -= 1
+
+
+def _service(symbols, engine, concurrency):
+    import recommendation_flow as rf
+
+    service = rf.RecommendationFlowService(
+        postgres_dsn="postgresql://unused",
+        watchlist=rf.WatchlistConfig(symbols=symbols),
+        symbol_concurrency=concurrency,
+    )
+    service.engine = engine
+    service.persisted = []
+    service._build_recommendation_record = lambda symbol, rec, snapshot: (symbol,)
+
+    async def persist(records):
+        service.persisted.extend(records)
+        return len(records)
+
+    service._persist_recommendations = persist
+    return service
+
+
+@pytest.mark.asyncio
+async def test_run_once_processes_symbols_concurrently():
+    symbols = ['AAPL', 'MSFT', 'NVDA', 'AMZN', 'META']
+    engine = FakeEngine(fail=['NVDA'])
+    service = _service(symbols, engine, concurrency=2)
+
+    results = await service.run_once()
+
+    assert engine.peak == 2
+    assert results['symbols_processed'] == 4
+    assert results['errors'] == ['Failed to process NVDA: engine down']
+    # Rows keep watchlist order regardless of completion order
+    assert service.persisted == [('AAPL',), ('MSFT',), ('AMZN',), ('META',)]
+    assert results['duration_seconds'] < 1
+
+
+class WatchlistConnection:
+    def __init__(self, symbols):
+        self.symbols = symbols
+        self.queries = 0
+
+    async def fetch(self, query):
+        self.queries += 1
+        return [{'symbol': symbol} for symbol in self.symbols]
+
+
+class WatchlistPool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        pool = self
+
+        class Acquire:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Acquire()
+
+
+@pytest.mark.asyncio
+async def test_watchlist_reloads_only_when_notified_or_stale():
+    conn = WatchlistConnection(['AAPL'])
+    service = _service(['MSFT'], FakeEngine(), concurrency=2)
+    service.db_pool = WatchlistPool(conn)
+
+    await service._refresh_watchlist()
+    assert service.watchlist.symbols == ['AAPL']
+
+    conn.symbols = ['AAPL', 'NVDA']
+    await service._refresh_watchlist()
+    assert conn.queries == 1
+    assert service.watchlist.symbols == ['AAPL']
+
+    service._on_watchlist_changed(None, 1, service.WATCHLIST_CHANNEL, '')
+    await service._refresh_watchlist()
+    assert conn.queries == 2
+    assert service.watchlist.symbols == ['AAPL', 'NVDA']
+
+
+@pytest.mark.asyncio
+async def test_stop_wakes_the_scheduler_without_waiting_for_the_next_run():
+    service = _service(['AAPL'], FakeEngine(), concurrency=1)
+    service._get_next_scheduled_run = lambda: (6 * 3600, 'later', False)
+
+    scheduler = asyncio.create_task(service.start_scheduled())
+    await asyncio.sleep(0.01)
+    service.stop()
+
+    await asyncio.wait_for(scheduler, timeout=1)
+    assert service.persisted == []
+
+
+@pytest.mark.asyncio
+async def test_failed_scheduler_shuts_down_the_api(monkeypatch):
+    import recommendation_flow as rf
+
+    events = []
+
+    class Service:
+        async def initialize(self):
+            pass
+
+        async def start_scheduled(self):
+            await asyncio.sleep(0)
+            raise RuntimeError("scheduler crashed")
+
+        def stop(self):
+            events.append("stop")
+
+        async def close(self):
+            events.append("close")
+
+    async def serve(app):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("api cancelled")
+            raise
+
+    monkeypatch.setattr(rf, "RecommendationFlowService", Service)
+    monkeypatch.setattr(rf, "build_api_app", lambda service: None)
+    monkeypatch.setattr(rf, "_serve_api", serve)
+
+    with pytest.raises(ExceptionGroup):
+        await asyncio.wait_for(rf.run_with_api(), timeout=1)
+
+    assert events[0] == "api cancelled"
+    assert events[-1] == "close"
+
+
+def test_api_binds_a_unix_socket_when_configured(monkeypatch):
+    import recommendation_flow as rf
+
+    monkeypatch.delenv("RECOMMENDATION_API_UDS", raising=False)
+    tcp = rf._uvicorn_options()
+    assert (tcp["host"], tcp["port"]) == ("0.0.0.0", 8000)
+    assert "uds" not in tcp
+
+    monkeypatch.setenv("RECOMMENDATION_API_UDS", "/tmp/recommendations.sock")
+    unix = rf._uvicorn_options()
+    assert unix["uds"] == "/tmp/recommendations.sock"
+    assert "host" not in unix and "port" not in unix
+
+
+@pytest.mark.asyncio
+async def test_api_workers_skip_the_watchlist_listener(monkeypatch):
+    import recommendation_flow as rf
+
+    connects = []
+
+    async def create_pool(*args, **kwargs):
+        return object()
+
+    async def connect(*args, **kwargs):
+        connects.append(args)
+
+    async def load_watchlist(self):
+        connects.append("watchlist")
+
+    class Aggregator:
+        def __init__(self, **kwargs):
+            pass
+
+        async def initialize(self):
+            pass
+
+    async def get_engine():
+        return FakeEngine()
+
+    monkeypatch.setattr(rf.asyncpg, "create_pool", create_pool)
+    monkeypatch.setattr(rf.asyncpg, "connect", connect)
+    monkeypatch.setattr(rf.RecommendationFlowService, "_load_watchlist", load_watchlist)
+    monkeypatch.setattr(rf, "MarketDataAggregator", Aggregator)
+    monkeypatch.setattr(rf, "get_engine", get_engine)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    service = rf.RecommendationFlowService(postgres_dsn="postgresql://unused")
+    await service.initialize(scheduler=False)
+
+    assert connects == []
+    assert service._watchlist_listener is None
+    assert service.engine is not None
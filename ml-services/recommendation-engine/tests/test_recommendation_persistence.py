@@ -0,0 +1,308 @@
+import pytest
+import sys
+import os
+
+# Match the existing test style: add src to path for imports.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncpg
+
+
+class DummyTransaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        self.conn.depth += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.conn.depth -= 1
+        return False
+
+
+class DummyConnection:
+    def __init__(self, fail_copy=False, fail_symbols=()):
+        self.fail_copy = fail_copy
+        self.fail_symbols = set(fail_symbols)
+        self.copies = []
+        self.executes = []
+        self.prepared = []
+        self.depth = 0
+        self.insert_depths = []
+
+    def transaction(self):
+        return DummyTransaction(self)
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        if self.fail_copy:
+            raise asyncpg.PostgresError("copy rejected")
+        self.copies.append((table, list(records), columns))
+
+    async def execute(self, query, *args):
+        self.executes.append((query, args))
+
+    async def fetchval(self, query, *args):
+        self.executes.append((query, args))
+        return 0
+
+    async def prepare(self, query):
+        self.prepared.append(query)
+        return DummyStatement(self, query)
+
+
+class DummyStatement:
+    def __init__(self, conn, query):
+        self.conn = conn
+        self.query = query
+
+    async def fetch(self, *args):
+        self.conn.insert_depths.append(self.conn.depth)
+        if args[0] in self.conn.fail_symbols:
+            raise asyncpg.PostgresError("row rejected")
+        self.conn.executes.append((self.query, args))
+        return []
+
+
+class DummyAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class DummyPool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        return DummyAcquire(self.conn)
+
+    def get_size(self):
+        return 6
+
+    def get_idle_size(self):
+        return 4
+
+    def get_min_size(self):
+        return 4
+
+    def get_max_size(self):
+        return 16
+
+
+def _service(conn):
+    import recommendation_flow as rf
+
+    service = rf.RecommendationFlowService(
+        postgres_dsn="postgresql://unused",
+        watchlist=rf.WatchlistConfig(symbols=["AAPL"]),
+    )
+    service.db_pool = DummyPool(conn)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_recommendations_are_bulk_copied():
+    import recommendation_flow as rf
+
+    conn = DummyConnection()
+    service = _service(conn)
+    records = [("AAPL",) + (None,) * 23, ("MSFT",) + (None,) * 23]
+
+    saved = await service._persist_recommendations(records)
+
+    assert saved == 2
+    assert conn.executes == [
+        ("SET LOCAL synchronous_commit TO OFF", ()),
+        (rf.CLEANUP_RECOMMENDATIONS_SQL, (["AAPL", "MSFT"],)),
+    ]
+    table, copied, columns = conn.copies[0]
+    assert table == 'stock_recommendations'
+    assert copied == records
+    assert columns == rf.RECOMMENDATION_COLUMNS
+    assert len(columns) == 24
+
+
+@pytest.mark.asyncio
+async def test_rejected_copy_falls_back_to_row_inserts():
+    import recommendation_flow as rf
+
+    conn = DummyConnection(fail_copy=True)
+    service = _service(conn)
+    records = [("AAPL",) + (None,) * 23]
+
+    saved = await service._persist_recommendations(records)
+
+    assert saved == 1
+    assert conn.prepared == [rf.INSERT_RECOMMENDATION_SQL]
+    query, args = conn.executes[-2]
+    assert query == rf.INSERT_RECOMMENDATION_SQL
+    assert '$24' in query
+    assert args == records[0]
+
+
+@pytest.mark.asyncio
+async def test_row_fallback_runs_in_one_transaction_with_a_savepoint_per_row():
+    import recommendation_flow as rf
+
+    conn = DummyConnection(fail_copy=True, fail_symbols={"MSFT"})
+    service = _service(conn)
+    records = [("AAPL",) + (None,) * 23, ("MSFT",) + (None,) * 23, ("NVDA",) + (None,) * 23]
+
+    saved = await service._persist_recommendations(records)
+
+    assert saved == 2
+    # Outer transaction plus one savepoint around every insert
+    assert conn.insert_depths == [2, 2, 2]
+    assert conn.executes[1] == ("SET LOCAL synchronous_commit TO OFF", ())
+    assert [args[0] for query, args in conn.executes if query == rf.INSERT_RECOMMENDATION_SQL] == ["AAPL", "NVDA"]
+    assert conn.executes[-1] == (rf.CLEANUP_RECOMMENDATIONS_SQL, (["AAPL", "MSFT", "NVDA"],))
+
+
+@pytest.mark.asyncio
+async def test_pool_connections_exchange_jsonb_as_objects():
+    import numpy as np
+    import recommendation_flow as rf
+
+    class CodecConnection:
+        async def set_type_codec(self, typename, **kwargs):
+            self.codec = (typename, kwargs)
+
+    conn = CodecConnection()
+    await rf.init_db_connection(conn)
+
+    typename, codec = conn.codec
+    assert typename == 'jsonb'
+    assert codec['format'] == 'binary'
+
+    wire = codec['encoder']({'summary': 'ok', 'score': np.float64(0.25)})
+    assert wire[:1] == b'\x01'
+    assert codec['decoder'](wire) == {'summary': 'ok', 'score': 0.25}
+
+
+def test_api_recommendations_share_the_insert_statement():
+    from types import SimpleNamespace
+    import recommendation_flow as rf
+
+    rec = SimpleNamespace(
+        action='BUY', score=None, normalized_score=0.7, confidence=0.6,
+        news_action='BUY', news_normalized_score=0.8, news_confidence=0.5,
+        technical_action='HOLD', technical_normalized_score=None,
+        technical_confidence=None,
+        price_at_recommendation=190.0, news_sentiment_score=0.2,
+        news_momentum_score=None, technical_trend_score=None,
+        technical_momentum_score=None, rsi=55.0, macd_histogram=None,
+        price_vs_sma20=None, news_sentiment_1d=None, article_count_24h=None,
+        explanation='', generated_at=None,
+    )
+
+    record = rf._api_recommendation_record('AAPL', rec)
+
+    assert len(record) == len(rf.RECOMMENDATION_COLUMNS)
+    row = dict(zip(rf.RECOMMENDATION_COLUMNS, record))
+    assert row['symbol'] == 'AAPL'
+    assert row['score'] == 0.0
+    assert row['news_action'] == 'BUY'
+    assert row['technical_normalized_score'] is None
+    assert row['article_count_24h'] == 0
+    assert row['explanation'] is None
+    assert row['data_sources_used'] == ['news', 'technical']
+    assert row['generated_at'].tzinfo is not None
+
+
+def test_db_float_drops_non_finite_values():
+    import recommendation_flow as rf
+
+    assert rf._db_float(None) is None
+    assert rf._db_float('n/a') is None
+    assert rf._db_float(float('nan')) is None
+    assert rf._db_float(float('-inf')) is None
+    assert rf._db_float('0.25') == 0.25
+
+
+def test_history_entries_keep_zero_scores():
+    from datetime import datetime, timezone
+    from decimal import Decimal
+    import recommendation_flow as rf
+
+    row = {column: None for _, column in rf.HISTORY_FLOAT_FIELDS}
+    row.update(
+        id='b7c1', symbol='AAPL', action='HOLD',
+        score=Decimal('0.0000'), normalized_score=Decimal('0.5000'), rsi=Decimal('0'),
+        article_count_24h=0, explanation={'summary': 'flat'},
+        data_sources_used=['news_sentiment'],
+        generated_at=datetime(2024, 1, 2, tzinfo=timezone.utc), created_at=None,
+    )
+
+    entry = rf._history_entry(row)
+
+    assert entry['score'] == 0.0
+    assert entry['rsi'] == 0.0
+    assert entry['normalizedScore'] == 0.5
+    assert entry['macdHistogram'] is None
+    assert entry['generatedAt'] == '2024-01-02T00:00:00+00:00'
+    assert entry['createdAt'] is None
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_jsonb_encoding_writes_non_finite_floats_as_null(monkeypatch, use_orjson):
+    import json
+    import recommendation_flow as rf
+
+    if not use_orjson:
+        monkeypatch.setattr(rf, 'orjson', None)
+    elif rf.orjson is None:
+        pytest.skip("orjson not installed")
+
+    encoded = rf.dumps_json_bytes({'rsi': float('nan'), 'scores': [1.0, float('inf')]})
+
+    assert json.loads(encoded) == {'rsi': None, 'scores': [1.0, None]}
+
+
+class HistoryConnection(DummyConnection):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.fetches = 0
+
+    async def fetch(self, query, *args):
+        self.fetches += 1
+        return self.rows
+
+
+@pytest.mark.asyncio
+async def test_history_is_cached_until_new_recommendations_are_saved():
+    import recommendation_flow as rf
+
+    rf.invalidate_history_cache()
+    row = {column: None for _, column in rf.HISTORY_FLOAT_FIELDS}
+    row.update(id='1', symbol='AAPL', action='BUY', article_count_24h=3,
+               explanation=None, data_sources_used=None,
+               generated_at=None, created_at=None)
+    conn = HistoryConnection([row])
+    pool = DummyPool(conn)
+
+    first = await rf.get_recommendations_history(pool, 'aapl')
+    second = await rf.get_recommendations_history(pool, 'AAPL')
+    assert second is first
+    assert conn.fetches == 1
+
+    await _service(conn)._persist_recommendations([("AAPL",) + (None,) * 23])
+    await rf.get_recommendations_history(pool, 'AAPL')
+    assert conn.fetches == 2
+
+
+def test_pool_stats_report_connections_in_use():
+    service = _service(DummyConnection())
+
+    assert service.pool_stats() == {
+        "available": True, "size": 6, "idle": 4, "in_use": 2, "min_size": 4, "max_size": 16,
+    }
+
+    service.db_pool = None
+    assert service.pool_stats() == {"available": False}
@@ -0,0 +1,276 @@
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+# Match the existing test style: add src to path for imports.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.queued.append((key, value, ex))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, value, ex in self.queued:
+            self.redis.store[key] = value
+            self.redis.ttls[key] = ex
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeApp:
+    """Collects the handlers registered by _add_api_routes."""
+
+    def __init__(self):
+        self.routes = {}
+
+    def post(self, path):
+        def register(handler):
+            self.routes[path] = handler
+            return handler
+        return register
+
+    get = post
+
+
+def _service(redis):
+    import recommendation_flow as rf
+
+    service = rf.RecommendationFlowService(
+        postgres_dsn="postgresql://unused",
+        watchlist=rf.WatchlistConfig(symbols=[]),
+    )
+    service._redis = redis
+    return service
+
+
+@pytest.mark.asyncio
+async def test_api_responses_are_shared_through_redis_with_jittered_ttl():
+    redis = FakeRedis()
+    service = _service(redis)
+
+    assert await service.get_cached_response("regime", "AAPL") is None
+
+    response = {"symbol": "AAPL", "regime": {"risk_score": 0.42}}
+    await service.cache_response("regime", "AAPL", response)
+
+    (key, ttl), = redis.ttls.items()
+    assert key == "rec:v1:regime:AAPL"
+    assert 54 <= ttl <= 66
+
+    # Another process sees the same response
+    assert await _service(redis).get_cached_response("regime", "AAPL") == response
+    assert await service.get_cached_response("single", "AAPL") is None
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_disabled_without_redis():
+    service = _service(None)
+
+    await service.cache_response("regime", "AAPL", {"symbol": "AAPL"})
+    assert await service.get_cached_response("regime", "AAPL") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_recommendations_only_generate_cache_misses():
+    import recommendation_flow as rf
+
+    generated = []
+
+    class Engine:
+        async def generate_recommendation(self, symbol, include_features=False):
+            generated.append(symbol)
+            if symbol == "TSLA":
+                raise RuntimeError("engine down")
+            return SimpleNamespace(symbol=symbol, action="BUY")
+
+    redis = FakeRedis()
+    service = _service(redis)
+    service.engine = Engine()
+    await service.cache_response("recommendation", "AAPL", {"symbol": "AAPL", "action": "SELL"})
+    app = FakeApp()
+    rf._add_api_routes(app, service)
+
+    redis.round_trips = 0
+    response = await app.routes["/recommendations"]({"symbols": ["msft", "AAPL", "TSLA", " MSFT "]})
+    result = rf.loads_json(response.body)
+
+    # Repeated symbols are generated once
+    assert generated == ["MSFT", "TSLA"]
+    assert [rec["action"] for rec in result["recommendations"]] == ["BUY", "SELL", "HOLD", "BUY"]
+    # One MGET for the hits and one pipeline for the new entries
+    assert redis.round_trips == 2
+    # The fallback for the failed symbol is not cached
+    assert set(redis.store) == {"rec:v1:recommendation:AAPL", "rec:v1:recommendation:MSFT"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_regime_requests_share_one_classification(monkeypatch):
+    import asyncio
+    import recommendation_flow as rf
+
+    fetches = []
+
+    class Classifier:
+        def classify(self, symbol, technical_features, news_features):
+            return SimpleNamespace(symbol=symbol)
+
+        def get_signal_weights(self, state):
+            return "weights"
+
+        def get_regime_explanation(self, state):
+            return {"regime_label": "Calm"}
+
+    class Engine:
+        regime_classifier = Classifier()
+
+        async def fetch_features(self, symbol):
+            fetches.append(symbol)
+            await asyncio.sleep(0.01)
+            return None, None
+
+    async def get_engine():
+        return Engine()
+
+    monkeypatch.setattr(rf, "get_engine", get_engine)
+    monkeypatch.setattr(rf, "_regime_cache", rf.OrderedDict())
+
+    results = await asyncio.gather(*(rf._classify_regime("AAPL") for _ in range(3)))
+
+    assert fetches == ["AAPL"]
+    assert all(result is results[0] for result in results)
+    assert rf._regime_inflight == {}
+
+    # Served from the in-process cache within the TTL
+    assert await rf._classify_regime("AAPL") is results[0]
+    assert fetches == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_batch_yields_entries_as_they_complete():
+    import asyncio
+    import recommendation_flow as rf
+
+    class Engine:
+        async def generate_recommendation(self, symbol, include_features=False):
+            await asyncio.sleep(0.05 if symbol == "SLOW" else 0)
+            return SimpleNamespace(symbol=symbol, action="BUY")
+
+    redis = FakeRedis()
+    service = _service(redis)
+    service.engine = Engine()
+    await service.cache_response("recommendation", "AAPL", {"symbol": "AAPL", "action": "SELL"})
+    app = FakeApp()
+    rf._add_api_routes(app, service)
+
+    response = await app.routes["/recommendations"](
+        {"user_id": "u1", "symbols": ["SLOW", "FAST", "AAPL", "fast"], "stream": True}
+    )
+    chunks = [chunk async for chunk in response.body_iterator]
+    result = rf.loads_json(b"".join(chunks))
+
+    assert result["user_id"] == "u1"
+    # Cache hits first, then completion order; one entry per distinct symbol
+    assert [rec["symbol"] for rec in result["recommendations"]] == ["AAPL", "FAST", "SLOW"]
+    assert "generated_at" in result
+    assert "rec:v1:recommendation:SLOW" in redis.store
+
+
+def test_response_timestamps_are_formatted_once_per_second(monkeypatch):
+    import recommendation_flow as rf
+
+    monkeypatch.setattr(rf, "_utc_now_iso_cache", (0, ""))
+    monkeypatch.setattr(rf.time, "time", lambda: 1704153600.25)
+    first = rf._utc_now_iso()
+    monkeypatch.setattr(rf.time, "time", lambda: 1704153600.75)
+
+    assert first == "2024-01-02T00:00:00"
+    assert rf._utc_now_iso() is first
+
+
+@pytest.mark.asyncio
+async def test_slow_batch_symbols_fall_back_to_hold():
+    import asyncio
+    import recommendation_flow as rf
+
+    class Engine:
+        async def generate_recommendation(self, symbol, include_features=False):
+            await asyncio.sleep(1 if symbol == "SLOW" else 0)
+            return SimpleNamespace(symbol=symbol, action="BUY")
+
+    service = _service(None)
+    service.engine = Engine()
+    service.api_symbol_timeout = 0.05
+    app = FakeApp()
+    rf._add_api_routes(app, service)
+
+    response = await app.routes["/recommendations"]({"symbols": ["SLOW", "FAST"]})
+    slow, fast = rf.loads_json(response.body)["recommendations"]
+
+    assert fast["action"] == "BUY"
+    assert slow["action"] == "HOLD"
+    assert slow["explanation"]["error"] == "timed out after 0.05s"
+
+
+@pytest.mark.asyncio
+async def test_regime_responses_are_cacheable_downstream():
+    import recommendation_flow as rf
+
+    service = _service(FakeRedis())
+    await service.cache_response("regime", "AAPL", {"symbol": "AAPL"})
+    app = rf.build_api_app(service)
+    get_regime = next(route.endpoint for route in app.routes if route.path == "/regime/{symbol}")
+
+    response = await get_regime(" aapl")
+
+    assert rf.loads_json(response.body) == {"symbol": "AAPL"}
+    assert response.headers["cache-control"] == "public, max-age=20"
+
+
+@pytest.mark.parametrize('error, status_code', [
+    (TimeoutError("feature store timed out"), 503),
+    (ConnectionRefusedError("connection refused"), 503),
+    (ValueError("unknown symbol"), 400),
+    (KeyError("volatility"), 500),
+])
+def test_regime_errors_map_to_status_codes(error, status_code):
+    import recommendation_flow as rf
+
+    response = rf._regime_error_response("AAPL", error)
+
+    assert response.status_code == status_code
+    assert rf.loads_json(response.body) == {"error": str(error)}
+
+
+def test_error_response_escapes_the_message_into_json():
+    import recommendation_flow as rf
+
+    response = rf._error_response('quote "API" down\n', 500)
+
+    assert response.status_code == 500
+    assert response.media_type == "application/json"
+    assert rf.loads_json(response.body) == {"error": 'quote "API" down\n'}
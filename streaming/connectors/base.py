@@ -257,6 +257,7 @@ class BaseNewsConnector(ABC):
         api_key: Optional[str] = None,
         rate_limit: Optional[int] = None,
         timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the news connector.
@@ -265,14 +266,18 @@ class BaseNewsConnector(ABC):
             api_key: API authentication key (required for most sources)
             rate_limit: Override default rate limit (requests per minute)
             timeout: HTTP request timeout in seconds
+            session: Shared aiohttp session to use instead of a private one.
+                The caller owns it; close() leaves it open.
         """
         self.api_key = api_key
         self.timeout = timeout
         self.rate_limit = rate_limit or self.rate_limit_per_minute
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
         
         # Rate limiting state
         self._request_times: List[datetime] = []
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         
         # Metrics
         self.total_requests = 0
@@ -285,13 +290,13 @@ class BaseNewsConnector(ABC):
         Reuses connections for better performance.
         """
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            self._session = aiohttp.ClientSession(timeout=self._client_timeout)
+            self._owns_session = True
         return self._session
     
     async def close(self):
-        """Close the HTTP session and release resources."""
-        if self._session and not self._session.closed:
+        """Close the HTTP session (unless it is shared) and release resources."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
     
     async def _wait_for_rate_limit(self):
@@ -381,7 +386,8 @@ class BaseNewsConnector(ABC):
 
         try:
             if method.upper() == "GET":
-                async with session.get(url, params=params, headers=headers) as response:
+                async with session.get(url, params=params, headers=headers,
+                                       timeout=self._client_timeout) as response:
                     if response.status >= 400:
                         # Capture body for better diagnostics (do not assume JSON on errors)
                         body = (await response.text())[:2000]
@@ -395,7 +401,8 @@ class BaseNewsConnector(ABC):
                         response.raise_for_status()
                     return await response.json()
             else:
-                async with session.post(url, json=params, headers=headers) as response:
+                async with session.post(url, json=params, headers=headers,
+                                        timeout=self._client_timeout) as response:
                     if response.status >= 400:
                         body = (await response.text())[:2000]
                         logger.warning(
@@ -24,6 +24,8 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 import logging
 
+import aiohttp
+
 from .base import BaseNewsConnector, NewsArticle, NewsSource, NewsCategory
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,7 @@ class FinnhubConnector(BaseNewsConnector):
         api_key: Optional[str] = None,
         rate_limit: Optional[int] = None,
         timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the Finnhub connector.
@@ -70,11 +73,12 @@ class FinnhubConnector(BaseNewsConnector):
             api_key: Finnhub API key (or retrieved from Vault/FINNHUB_API_KEY env var)
             rate_limit: Override default rate limit
             timeout: HTTP request timeout in seconds
+            session: Optional shared aiohttp session
         """
         # API key will be loaded lazily from Vault if not provided
         self._api_key_override = api_key
         self._api_key_loaded = api_key is not None
-        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout)
+        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout, session=session)
     
     async def _ensure_api_key(self):
         """Load API key from Vault if not already loaded."""
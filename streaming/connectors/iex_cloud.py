@@ -28,6 +28,8 @@ from typing import List, Optional, Dict, Any
 import logging
 import os
 
+import aiohttp
+
 from .base import BaseNewsConnector, NewsArticle, NewsSource, NewsCategory
 
 logger = logging.getLogger(__name__)
@@ -70,6 +72,7 @@ class IEXCloudConnector(BaseNewsConnector):
         rate_limit: Optional[int] = None,
         timeout: int = 30,
         use_sandbox: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the IEX Cloud connector.
@@ -79,11 +82,12 @@ class IEXCloudConnector(BaseNewsConnector):
             rate_limit: Override default rate limit
             timeout: HTTP request timeout in seconds
             use_sandbox: Use sandbox environment for testing (free, no limits)
+            session: Optional shared aiohttp session
         """
         # API key will be loaded lazily from Vault if not provided
         self._api_key_override = api_key
         self._api_key_loaded = api_key is not None
-        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout)
+        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout, session=session)
         self.use_sandbox = use_sandbox
         
         # Use sandbox URL if specified
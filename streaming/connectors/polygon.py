@@ -28,6 +28,8 @@ from typing import List, Optional, Dict, Any
 import logging
 import os
 
+import aiohttp
+
 from .base import BaseNewsConnector, NewsArticle, NewsSource, NewsCategory
 
 logger = logging.getLogger(__name__)
@@ -68,6 +70,7 @@ class PolygonConnector(BaseNewsConnector):
         api_key: Optional[str] = None,
         rate_limit: Optional[int] = None,
         timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize the Polygon.io connector.
@@ -76,11 +79,12 @@ class PolygonConnector(BaseNewsConnector):
             api_key: Polygon.io API key (or retrieved from Vault/POLYGON_API_KEY env var)
             rate_limit: Override default rate limit
             timeout: HTTP request timeout in seconds
+            session: Optional shared aiohttp session
         """
         # API key will be loaded lazily from Vault if not provided
         self._api_key_override = api_key
         self._api_key_loaded = api_key is not None
-        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout)
+        super().__init__(api_key=api_key, rate_limit=rate_limit, timeout=timeout, session=session)
     
     async def _ensure_api_key(self):
         """Load API key from Vault if not already loaded."""
@@ -232,6 +232,7 @@ class RSSFeedConnector(BaseNewsConnector):
         self,
         enabled_feeds: Optional[List[str]] = None,
         timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         """
         Initialize RSS feed connector.
@@ -240,8 +241,9 @@ class RSSFeedConnector(BaseNewsConnector):
             enabled_feeds: List of feed keys to enable (default: all feeds)
                           See RSS_FEEDS dict for available keys.
             timeout: HTTP request timeout in seconds
+            session: Optional shared aiohttp session
         """
-        super().__init__(api_key=None, timeout=timeout)
+        super().__init__(api_key=None, timeout=timeout, session=session)
         
         # Enable specified feeds or all feeds
         if enabled_feeds:
@@ -275,6 +275,17 @@ class TestBaseNewsConnectorUtilities:
         )
         assert BaseNewsConnector._is_retryable_exception(exc_500) is True
 
+    @pytest.mark.asyncio
+    async def test_shared_session_is_not_closed_by_connector(self):
+        shared = aiohttp.ClientSession()
+        try:
+            connector = FinnhubConnector(api_key="test_key", session=shared)
+            assert await connector._get_session() is shared
+            await connector.close()
+            assert not shared.closed
+        finally:
+            await shared.close()
+
 
 # =============================================================================
 # Finnhub Connector Tests